@@ -0,0 +1,107 @@
+"""
+3-month action plan as a phase/action template graph
+
+Each phase lists its actions and warnings together with the set of patient
+conditions they require. A plan is resolved once per distinct condition
+set and memoized, since only a few dozen combinations occur in practice.
+"""
+
+from functools import lru_cache
+from typing import Dict, FrozenSet, List, Optional, Tuple
+
+from localization import DEFAULT_LOCALE, get_catalog
+
+# Condition names (see HELDDashboardGenerator._plan_conditions)
+HIGH_HOMOCYSTEINE = 'high_homocysteine'
+INFLAMMATION = 'inflammation'
+CBS_UPREGULATION = 'cbs_upregulation'
+COMT_VARIANTS = 'comt_variants'
+# From the consult notes (see consult_notes)
+SLEEP_ISSUES = 'sleep_issues'
+PREGNANCY = 'pregnancy'
+KIDNEY_DISEASE = 'kidney_disease'
+
+ALWAYS: FrozenSet[str] = frozenset()
+
+# (required conditions, item); an item is included when all are present.
+# Texts are catalog messages: plan.<phase>.title/duration,
+# plan.<action>.title/description and plan.<warning>
+PLAN_TEMPLATE: Tuple[Dict, ...] = (
+    {
+        'phase': 'phase1',
+        'actions': (
+            (frozenset({HIGH_HOMOCYSTEINE}), {'icon': '🥚', 'key': 'choline'}),
+            (ALWAYS, {'icon': '☀️', 'key': 'vitamin_d'}),
+            (frozenset({INFLAMMATION}), {'icon': '🧘', 'key': 'inflammation'}),
+            (frozenset({COMT_VARIANTS}), {'icon': '🧠', 'key': 'comt'}),
+            (frozenset({SLEEP_ISSUES}), {'icon': '🌙', 'key': 'sleep'}),
+        ),
+        'warnings': (
+            (frozenset({CBS_UPREGULATION}), 'warning.cbs'),
+            (frozenset({PREGNANCY}), 'warning.pregnancy'),
+            (frozenset({KIDNEY_DISEASE}), 'warning.kidney'),
+        ),
+    },
+    {
+        'phase': 'phase2',
+        'actions': (
+            (ALWAYS, {'icon': '📊', 'key': 'retest_week6'}),
+            (ALWAYS, {'icon': '💊', 'key': 'b_complex'}),
+            (ALWAYS, {'icon': '🥬', 'key': 'nutrition'}),
+            (ALWAYS, {'icon': '🔬', 'key': 'antioxidants'}),
+        ),
+        'warnings': (),
+    },
+    {
+        'phase': 'phase3',
+        'actions': (
+            (ALWAYS, {'icon': '🎯', 'key': 'symptoms'}),
+            (ALWAYS, {'icon': '⚖️', 'key': 'dosage'}),
+            (ALWAYS, {'icon': '🔄', 'key': 'lifestyle'}),
+            (ALWAYS, {'icon': '📋', 'key': 'retest_week12'}),
+        ),
+        'warnings': (),
+    },
+)
+
+
+@lru_cache(maxsize=256)
+def _resolve(conditions: FrozenSet[str], locale: str) -> Tuple[Dict, ...]:
+    """Resolve the template for one condition fingerprint and locale"""
+    t = get_catalog(locale)
+    return tuple(
+        {
+            'phase': t(f"plan.{phase['phase']}.title"),
+            'duration': t(f"plan.{phase['phase']}.duration"),
+            'actions': [
+                {
+                    'icon': item['icon'],
+                    'title': t(f"plan.{item['key']}.title"),
+                    'description': t(f"plan.{item['key']}.description"),
+                }
+                for required, item in phase['actions'] if required <= conditions
+            ],
+            'warnings': [
+                t(f"plan.{key}") for required, key in phase['warnings'] if required <= conditions
+            ],
+        }
+        for phase in PLAN_TEMPLATE
+    )
+
+
+def resolve_plan(conditions: FrozenSet[str], locale: Optional[str] = None) -> List[Dict]:
+    """
+    Phases, actions and warnings that apply to a set of conditions
+
+    The resolved plan is memoized per condition set and locale; callers get
+    fresh lists so the cached plan cannot be modified through them.
+    """
+    return [
+        dict(phase, actions=[dict(a) for a in phase['actions']], warnings=list(phase['warnings']))
+        for phase in _resolve(frozenset(conditions), locale or DEFAULT_LOCALE)
+    ]
+
+
+def cache_info():
+    """Memoization statistics for resolved plans"""
+    return _resolve.cache_info()
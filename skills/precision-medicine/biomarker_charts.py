@@ -0,0 +1,143 @@
+"""
+Inline SVG range bars and trend sparklines for biomarker cards
+
+Geometry only depends on the printed optimal range and on where the value
+falls in it, so positions are snapped to BUCKETS steps and the finished SVG
+is cached per (range, bucket, status). A panel of thousands of cards only
+computes each distinct bar once.
+"""
+
+from functools import lru_cache
+from typing import Optional, Sequence, Tuple
+
+# Value positions are snapped to 1/BUCKETS of the bar width
+BUCKETS = 50
+
+SPARKLINE_WIDTH = 100
+SPARKLINE_HEIGHT = 24
+
+_STATUS_COLORS = {
+    'critical': 'var(--status-critical)',
+    'warning': 'var(--status-warning)',
+    'optimal': 'var(--status-optimal)',
+}
+_DEFAULT_COLOR = 'var(--status-good)'
+
+
+@lru_cache(maxsize=1024)
+def parse_range(range_text: str) -> Optional[Tuple[Optional[float], Optional[float]]]:
+    """
+    Parse a printed range ('<8.0', '>30', '45-60') into (low, high)
+
+    Returns:
+        (low, high) with None for an open end, or None if unparsable
+    """
+    text = range_text.strip()
+    try:
+        if text.startswith('<'):
+            return None, float(text[1:])
+        if text.startswith('>'):
+            return float(text[1:]), None
+        low, high = text.split('-')
+        return float(low), float(high)
+    except ValueError:
+        return None
+
+
+@lru_cache(maxsize=1024)
+def _scale(range_text: str) -> Optional[Tuple[float, float, float, float]]:
+    """Bar domain (start, end) and optimal band (start, end) for a range"""
+    bounds = parse_range(range_text)
+    if bounds is None:
+        return None
+    low, high = bounds
+
+    # The optimal band takes the middle third of the bar (or half for open ranges)
+    if low is not None and high is not None:
+        span = high - low
+        scale = max(0.0, low - span), high + span, low, high
+    elif high is not None:
+        scale = 0.0, high * 2, 0.0, high
+    else:
+        scale = 0.0, low * 2, low, low * 2
+
+    start, end, band_start, band_end = scale
+    if end <= start or band_end <= band_start:
+        return None
+    return scale
+
+
+def _bucket(position: float) -> int:
+    return min(BUCKETS, max(0, round(position * BUCKETS)))
+
+
+@lru_cache(maxsize=4096)
+def _range_bar_svg(range_text: str, bucket: int, status: str) -> str:
+    start, end, band_start, band_end = _scale(range_text)
+    width = end - start
+    band_x = (band_start - start) / width * 100
+    band_w = (band_end - band_start) / width * 100
+    fill_w = bucket * 100 / BUCKETS
+    color = _STATUS_COLORS.get(status, _DEFAULT_COLOR)
+
+    return (
+        '<div class="biomarker-bar">'
+        '<svg viewBox="0 0 100 8" preserveAspectRatio="none" width="100%" height="100%">'
+        f'<rect x="{band_x:.1f}" width="{band_w:.1f}" height="8" style="fill: var(--jungle-green); fill-opacity: 0.3"/>'
+        f'<rect class="biomarker-fill" width="{fill_w:.1f}" height="8" style="fill: {color}"/>'
+        '</svg></div>'
+    )
+
+
+def range_bar(optimal_range: str, value: float, status: str) -> str:
+    """
+    Range bar showing where a value sits relative to its optimal range
+
+    Returns:
+        HTML for a .biomarker-bar, or '' if the range cannot be drawn
+    """
+    scale = _scale(optimal_range) if optimal_range else None
+    if scale is None:
+        return ''
+    start, end = scale[0], scale[1]
+    return _range_bar_svg(optimal_range, _bucket((value - start) / (end - start)), status)
+
+
+@lru_cache(maxsize=4096)
+def _sparkline_svg(points: Tuple[Tuple[int, int], ...], status: str) -> str:
+    coordinates = ' '.join(f"{x},{y}" for x, y in points)
+    color = _STATUS_COLORS.get(status, _DEFAULT_COLOR)
+    last_x, last_y = points[-1]
+    return (
+        f'<svg class="biomarker-sparkline" viewBox="0 0 {SPARKLINE_WIDTH} {SPARKLINE_HEIGHT}" '
+        'preserveAspectRatio="none">'
+        f'<polyline points="{coordinates}" vector-effect="non-scaling-stroke" '
+        f'style="fill: none; stroke: {color}; stroke-width: 2"/>'
+        f'<circle cx="{last_x}" cy="{last_y}" r="2" style="fill: {color}"/>'
+        '</svg>'
+    )
+
+
+def sparkline(values: Sequence[float], status: str) -> str:
+    """
+    Trend line for a series of measurements, oldest first
+
+    Returns:
+        Inline SVG, or '' for fewer than two values
+    """
+    if len(values) < 2:
+        return ''
+    low, high = min(values), max(values)
+    spread = (high - low) or 1.0
+    step = SPARKLINE_WIDTH / (len(values) - 1)
+    # Snap to whole units so similar trends share one cached SVG
+    points = tuple(
+        (round(i * step), round((1 - (v - low) / spread) * (SPARKLINE_HEIGHT - 4)) + 2)
+        for i, v in enumerate(values)
+    )
+    return _sparkline_svg(points, status)
+
+
+def cache_info():
+    """Memoization statistics for range bars"""
+    return _range_bar_svg.cache_info()
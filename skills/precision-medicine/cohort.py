@@ -0,0 +1,294 @@
+"""
+Cohort analytics over parsed biomarkers and DNA variants
+
+Parsed results for many patients are stored column-wise in compact
+``array`` columns with interned string codes, so aggregate queries scan
+integer columns instead of lists of dicts.
+"""
+
+import json
+from array import array
+from collections import Counter
+from pathlib import Path
+from typing import Dict, Iterable, Iterator, List, Optional, Sequence, Set, Tuple
+
+from parsers.markers import fold, resolve_marker
+
+BIOMARKER_STATUSES = ('optimal', 'warning', 'critical')
+VARIANT_SEVERITIES = ('info', 'warning', 'critical')
+
+
+def marker_key(name: str) -> str:
+    """Key used to group biomarkers with the same name across patients"""
+    return resolve_marker(name) or fold(name)
+
+
+class _Vocabulary:
+    """Interns strings to small integer codes"""
+
+    def __init__(self, values: Sequence[str] = ()):
+        self.values: List[str] = []
+        self.codes: Dict[str, int] = {}
+        for value in values:
+            self.code(value)
+
+    def code(self, value: str) -> int:
+        code = self.codes.get(value)
+        if code is None:
+            code = len(self.values)
+            self.codes[value] = code
+            self.values.append(value)
+        return code
+
+    def lookup(self, value: str) -> Optional[int]:
+        return self.codes.get(value)
+
+
+class Cohort:
+    """Columnar table of parsed results for many patients"""
+
+    def __init__(self):
+        self.patient_ids: List[str] = []
+
+        self._markers = _Vocabulary()
+        self._statuses = _Vocabulary(BIOMARKER_STATUSES)
+        self._genes = _Vocabulary()
+        self._genotypes = _Vocabulary()
+        self._rs_numbers = _Vocabulary()
+        self._severities = _Vocabulary(VARIANT_SEVERITIES)
+
+        # Biomarker rows
+        self._bio_patient = array('I')
+        self._bio_marker = array('I')
+        self._bio_status = array('B')
+        self._bio_value = array('d')
+
+        # Variant rows
+        self._var_patient = array('I')
+        self._var_gene = array('I')
+        self._var_rs = array('I')
+        self._var_genotype = array('I')
+        self._var_severity = array('B')
+
+    def __len__(self) -> int:
+        return len(self.patient_ids)
+
+    def add_patient(
+        self,
+        patient_id: str,
+        biomarkers: List[Dict],
+        dna_variants: List[Dict]
+    ) -> int:
+        """
+        Append one patient's parser output
+
+        Args:
+            patient_id: Identifier kept for reporting
+            biomarkers: Output of BloodParser.parse
+            dna_variants: Output of DNAParser.parse
+
+        Returns:
+            Row index of the patient within the cohort
+        """
+        index = len(self.patient_ids)
+        self.patient_ids.append(patient_id)
+
+        for marker in biomarkers:
+            self._bio_patient.append(index)
+            self._bio_marker.append(self._markers.code(marker_key(marker['name'])))
+            self._bio_status.append(self._statuses.code(marker['status']))
+            self._bio_value.append(float(marker['value']))
+
+        for variant in dna_variants:
+            self._var_patient.append(index)
+            self._var_gene.append(self._genes.code(variant['gene']))
+            self._var_rs.append(self._rs_numbers.code(variant['rs_number']))
+            self._var_genotype.append(self._genotypes.code(variant['genotype']))
+            self._var_severity.append(self._severities.code(variant['severity']))
+
+        return index
+
+    @classmethod
+    def from_records(cls, records: Iterable[Dict]) -> 'Cohort':
+        """
+        Build a cohort from patient records
+
+        Each record has the structure:
+        {
+            'patient_id': str,
+            'biomarkers': [...],    # BloodParser output
+            'dna_variants': [...]   # DNAParser output
+        }
+        """
+        cohort = cls()
+        for record in records:
+            cohort.add_patient(
+                record['patient_id'],
+                record.get('biomarkers', []),
+                record.get('dna_variants', [])
+            )
+        return cohort
+
+    @classmethod
+    def load(cls, path: str) -> 'Cohort':
+        """
+        Load patient records from a JSON file or a directory of JSON files
+
+        A file may hold a single record or a list of records.
+        """
+        source = Path(path)
+        files = sorted(source.glob('*.json')) if source.is_dir() else [source]
+
+        def records():
+            for file in files:
+                with open(file, 'r', encoding='utf-8') as f:
+                    data = json.load(f)
+                if isinstance(data, list):
+                    yield from data
+                else:
+                    yield data
+
+        return cls.from_records(records())
+
+    def biomarker_rows(self) -> Iterator[Tuple[int, str, str]]:
+        """Yield (patient row, marker key, status) for every biomarker"""
+        markers = self._markers.values
+        statuses = self._statuses.values
+        for patient, marker, status in zip(self._bio_patient, self._bio_marker, self._bio_status):
+            yield patient, markers[marker], statuses[status]
+
+    def variant_rows(self) -> Iterator[Tuple[int, str, str, str]]:
+        """Yield (patient row, gene, rs number, genotype) for every variant"""
+        genes = self._genes.values
+        rs_numbers = self._rs_numbers.values
+        genotypes = self._genotypes.values
+        for patient, gene, rs, genotype in zip(
+            self._var_patient, self._var_gene, self._var_rs, self._var_genotype
+        ):
+            yield patient, genes[gene], rs_numbers[rs], genotypes[genotype]
+
+    def status_distribution(self, marker: Optional[str] = None) -> Dict[str, Dict[str, int]]:
+        """
+        Count biomarker statuses per marker
+
+        Args:
+            marker: Only report this marker (matched with marker_key)
+
+        Returns:
+            {marker: {'optimal': n, 'warning': n, 'critical': n}}
+        """
+        if marker is not None:
+            code = self._markers.lookup(marker_key(marker))
+            if code is None:
+                return {}
+            counts = Counter(
+                status for m, status in zip(self._bio_marker, self._bio_status) if m == code
+            )
+            pairs = {(code, status): n for status, n in counts.items()}
+        else:
+            pairs = Counter(zip(self._bio_marker, self._bio_status))
+
+        result: Dict[str, Dict[str, int]] = {}
+        for (m, status), n in pairs.items():
+            row = result.setdefault(
+                self._markers.values[m], dict.fromkeys(BIOMARKER_STATUSES, 0)
+            )
+            row[self._statuses.values[status]] = n
+        return result
+
+    def genotype_frequencies(
+        self,
+        gene: Optional[str] = None
+    ) -> Dict[str, Dict[str, Dict[str, float]]]:
+        """
+        Genotype frequencies per SNP
+
+        SNPs of the same gene (e.g. MTHFR rs1801133 and rs1801131) are kept
+        apart. A fraction is the share of that SNP's variant rows; a patient
+        normally has one row per SNP.
+
+        Args:
+            gene: Only report the SNPs of this gene
+
+        Returns:
+            {gene: {rs_number: {genotype: fraction}}}
+        """
+        if gene is not None:
+            code = self._genes.lookup(gene)
+            if code is None:
+                return {}
+            pairs = Counter(
+                (code, rs, genotype)
+                for g, rs, genotype in zip(self._var_gene, self._var_rs, self._var_genotype)
+                if g == code
+            )
+        else:
+            pairs = Counter(zip(self._var_gene, self._var_rs, self._var_genotype))
+
+        totals = Counter()
+        for (g, rs, _), n in pairs.items():
+            totals[g, rs] += n
+
+        result: Dict[str, Dict[str, Dict[str, float]]] = {}
+        for (g, rs, genotype), n in sorted(pairs.items()):
+            snp = result.setdefault(self._genes.values[g], {}).setdefault(
+                self._rs_numbers.values[rs], {}
+            )
+            snp[self._genotypes.values[genotype]] = n / totals[g, rs]
+        return result
+
+    def patients_with_variant(self, gene: str, genotype: str) -> Set[int]:
+        """Row indexes of patients carrying genotype for gene"""
+        g = self._genes.lookup(gene)
+        gt = self._genotypes.lookup(genotype)
+        if g is None or gt is None:
+            return set()
+        return {
+            patient
+            for patient, gene_code, genotype_code
+            in zip(self._var_patient, self._var_gene, self._var_genotype)
+            if gene_code == g and genotype_code == gt
+        }
+
+    def patients_with_status(
+        self,
+        marker: str,
+        statuses: Sequence[str] = ('critical',)
+    ) -> Set[int]:
+        """Row indexes of patients whose marker has one of the given statuses"""
+        m = self._markers.lookup(marker_key(marker))
+        if m is None:
+            return set()
+        wanted = {self._statuses.lookup(status) for status in statuses}
+        return {
+            patient
+            for patient, marker_code, status
+            in zip(self._bio_patient, self._bio_marker, self._bio_status)
+            if marker_code == m and status in wanted
+        }
+
+    def co_occurrence(
+        self,
+        gene: str,
+        genotype: str,
+        marker: str,
+        statuses: Sequence[str] = ('critical',)
+    ) -> Dict[str, int]:
+        """
+        2x2 contingency of a genotype against a biomarker status
+
+        Example: PEMT TT against critical homocysteine.
+
+        Returns:
+            {'both': n, 'variant_only': n, 'marker_only': n, 'neither': n}
+        """
+        carriers = self.patients_with_variant(gene, genotype)
+        flagged = self.patients_with_status(marker, statuses)
+        both = len(carriers & flagged)
+
+        return {
+            'both': both,
+            'variant_only': len(carriers) - both,
+            'marker_only': len(flagged) - both,
+            'neither': len(self) - len(carriers | flagged)
+        }
@@ -0,0 +1,215 @@
+"""
+Consult-notes analysis with a precompiled keyword matcher
+
+The symptom, medication, goal and contraindication vocabularies (NL/EN/DE)
+are compiled once into an Aho-Corasick automaton over folded text (accents
+stripped, punctuation as spaces; see parsers.markers.fold). Analyzing notes
+is then a single pass over the text, however many keywords there are, so
+long Notion exports stay linear. A keyword directly preceded by a negation
+('geen hoofdpijn', 'niet zwanger') is ignored.
+"""
+
+from typing import Dict, FrozenSet, Iterator, List, NamedTuple, Optional, Tuple
+
+from parsers.markers import fold
+
+SYMPTOM = 'symptom'
+MEDICATION = 'medication'
+GOAL = 'goal'
+CONTRAINDICATION = 'contraindication'
+
+# Kind -> canonical value -> keywords. Medication values are the names used
+# by the interaction library (interactions.medication_id).
+VOCABULARY: Dict[str, Dict[str, Tuple[str, ...]]] = {
+    SYMPTOM: {
+        'fatigue': (
+            'vermoeid', 'vermoeidheid', 'moe', 'weinig energie', 'fatigue', 'tired',
+            'tiredness', 'low energy', 'müde', 'müdigkeit', 'erschöpft',
+        ),
+        'poor_sleep': (
+            'slaapt slecht', 'slecht slapen', 'slaapproblemen', 'slapeloosheid', 'insomnia',
+            'poor sleep', 'sleeps badly', 'schlafstörung', 'schlafstörungen', 'schläft schlecht',
+        ),
+        'brain_fog': (
+            'brain fog', 'hersenmist', 'concentratieproblemen', 'concentration problems',
+            'konzentrationsstörungen',
+        ),
+        'anxiety': (
+            'angst', 'angstig', 'onrustig', 'anxiety', 'anxious', 'ängstlich', 'unruhe',
+        ),
+        'headache': (
+            'hoofdpijn', 'migraine', 'headache', 'headaches', 'kopfschmerzen', 'migräne',
+        ),
+        'joint_pain': (
+            'gewrichtspijn', 'joint pain', 'gelenkschmerzen',
+        ),
+        'digestive': (
+            'buikpijn', 'opgeblazen', 'darmklachten', 'bloating', 'abdominal pain',
+            'blähungen', 'bauchschmerzen',
+        ),
+    },
+    MEDICATION: {
+        'methotrexaat': ('methotrexaat', 'methotrexate', 'methotrexat', 'mtx'),
+        'warfarine': ('warfarine', 'warfarin', 'coumadin'),
+        'acenocoumarol': ('acenocoumarol', 'sintrom'),
+        'ssri': (
+            'ssri', 'sertraline', 'sertralin', 'fluoxetine', 'fluoxetin', 'paroxetine',
+            'paroxetin', 'citalopram', 'escitalopram', 'fluvoxamine',
+        ),
+        'levodopa': ('levodopa', 'l dopa', 'sinemet', 'madopar'),
+        'thiazide': (
+            'thiazide', 'hydrochloorthiazide', 'hydrochlorothiazide', 'hydrochlorothiazid',
+            'hctz', 'chloortalidon', 'chlorthalidone',
+        ),
+        'levothyroxine': ('levothyroxine', 'levothyroxin', 'euthyrox', 'thyrax', 'l thyroxin'),
+        'doxycycline': ('doxycycline', 'doxycyclin'),
+        'ciprofloxacine': ('ciprofloxacine', 'ciprofloxacin', 'cipro'),
+    },
+    GOAL: {
+        'energy': ('meer energie', 'more energy', 'mehr energie'),
+        'sleep': ('beter slapen', 'better sleep', 'besser schlafen'),
+        'weight': ('afvallen', 'gewichtsverlies', 'weight loss', 'lose weight', 'abnehmen'),
+        'focus': ('betere focus', 'better focus', 'bessere konzentration'),
+        'performance': ('sportprestaties', 'athletic performance', 'sportliche leistung'),
+    },
+    CONTRAINDICATION: {
+        'pregnancy': (
+            'zwanger', 'zwangerschap', 'kinderwens', 'pregnant', 'pregnancy',
+            'schwanger', 'schwangerschaft', 'kinderwunsch',
+        ),
+        'breastfeeding': ('borstvoeding', 'breastfeeding', 'stillt', 'stillzeit'),
+        'kidney_disease': (
+            'nierinsufficiëntie', 'nierfalen', 'nierziekte', 'verminderde nierfunctie',
+            'kidney disease', 'renal failure', 'chronic kidney disease', 'ckd',
+            'niereninsuffizienz', 'nierenerkrankung',
+        ),
+    },
+}
+
+# A keyword right after one of these words is negated
+NEGATIONS: FrozenSet[str] = frozenset((
+    'geen', 'niet', 'zonder', 'no', 'not', 'without', 'kein', 'keine', 'keinen', 'nicht', 'ohne',
+))
+
+
+class Match(NamedTuple):
+    """A keyword occurrence; start/end index the folded text"""
+    kind: str
+    value: str
+    start: int
+    end: int
+
+
+class NotesFacts(NamedTuple):
+    """Canonical facts extracted from consult notes"""
+    symptoms: FrozenSet[str]
+    medications: FrozenSet[str]
+    goals: FrozenSet[str]
+    contraindications: FrozenSet[str]
+
+
+_KIND_FIELDS = {
+    SYMPTOM: 'symptoms',
+    MEDICATION: 'medications',
+    GOAL: 'goals',
+    CONTRAINDICATION: 'contraindications',
+}
+
+
+class KeywordMatcher:
+    """Aho-Corasick automaton over a keyword vocabulary"""
+
+    def __init__(self, vocabulary: Dict[str, Dict[str, Tuple[str, ...]]] = VOCABULARY):
+        """Compile the vocabulary: keyword trie, failure links, merged outputs"""
+        # Per state: transitions, failure state and (keyword length, kind, value) outputs
+        self._goto: List[Dict[str, int]] = [{}]
+        self._fail: List[int] = [0]
+        self._out: List[List[Tuple[int, str, str]]] = [[]]
+
+        for kind, values in vocabulary.items():
+            for value, keywords in values.items():
+                for keyword in keywords:
+                    folded = fold(keyword)
+                    if folded:
+                        self._add(folded, (len(folded), kind, value))
+
+        # Breadth-first, so a state's failure target is finished before it
+        queue = list(self._goto[0].values())
+        for state in queue:
+            for ch, child in self._goto[state].items():
+                queue.append(child)
+                fallback = self._fail[state]
+                while fallback and ch not in self._goto[fallback]:
+                    fallback = self._fail[fallback]
+                target = self._goto[fallback].get(ch, 0)
+                self._fail[child] = target if target != child else 0
+                self._out[child] = self._out[child] + self._out[self._fail[child]]
+
+    def _add(self, keyword: str, output: Tuple[int, str, str]):
+        state = 0
+        for ch in keyword:
+            child = self._goto[state].get(ch)
+            if child is None:
+                child = self._goto[state][ch] = len(self._goto)
+                self._goto.append({})
+                self._fail.append(0)
+                self._out.append([])
+            state = child
+        if output not in self._out[state]:
+            self._out[state].append(output)
+
+    def find(self, folded: str) -> Iterator[Match]:
+        """
+        Whole-word keyword matches in already folded text, in one pass
+
+        Negated matches are skipped.
+        """
+        goto, fail, out = self._goto, self._fail, self._out
+        size = len(folded)
+        state = 0
+        for i, ch in enumerate(folded):
+            while state and ch not in goto[state]:
+                state = fail[state]
+            state = goto[state].get(ch, 0)
+            if not out[state]:
+                continue
+            end = i + 1
+            if end < size and folded[end] != ' ':
+                continue
+            for length, kind, value in out[state]:
+                start = end - length
+                if start > 0 and folded[start - 1] != ' ':
+                    continue
+                if start > 1 and folded[folded.rfind(' ', 0, start - 1) + 1:start - 1] in NEGATIONS:
+                    continue
+                yield Match(kind, value, start, end)
+
+    def matches(self, text: str) -> List[Match]:
+        """Keyword matches in raw notes text"""
+        return list(self.find(fold(text)))
+
+
+def analyze_notes(text: str, matcher: Optional[KeywordMatcher] = None) -> NotesFacts:
+    """
+    Extract symptoms, medications, goals and contraindications from notes
+
+    Args:
+        text: Consult notes (e.g. a Notion export)
+        matcher: Compiled matcher (the built-in vocabulary by default)
+    """
+    found: Dict[str, set] = {field: set() for field in _KIND_FIELDS.values()}
+    if text:
+        for match in (matcher or default_matcher()).find(fold(text)):
+            found[_KIND_FIELDS[match.kind]].add(match.value)
+    return NotesFacts(**{field: frozenset(values) for field, values in found.items()})
+
+
+_default_matcher: Optional[KeywordMatcher] = None
+
+
+def default_matcher() -> KeywordMatcher:
+    """Matcher for the built-in vocabulary, compiled on first use"""
+    global _default_matcher
+    if _default_matcher is None:
+        _default_matcher = KeywordMatcher()
+    return _default_matcher
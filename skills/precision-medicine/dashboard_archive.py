@@ -0,0 +1,278 @@
+#!/usr/bin/env python3
+"""
+Deduplicated archive format for saved HELD dashboards
+
+Every dashboard repeats the same CSS, header, disclaimer and footer. The
+archive stores one shared dictionary (trained on existing dashboards) and
+compresses each dashboard against it with zlib's preset-dictionary support,
+so only the patient-specific parts cost real space.
+
+File layout (all integers big-endian):
+    magic            8 bytes   b'HELDARC1'
+    dict_length      4 bytes
+    dictionary       dict_length bytes, zlib-compressed
+    entries          repeated until EOF:
+        name_length  2 bytes
+        name         UTF-8
+        html_length  4 bytes   (uncompressed, UTF-8 encoded)
+        crc32        4 bytes   (of the uncompressed bytes)
+        data_length  4 bytes
+        data         raw deflate stream compressed with the dictionary
+"""
+
+import struct
+import sys
+import zlib
+from collections import Counter
+from pathlib import Path
+from typing import Dict, Iterable, List, Tuple
+
+MAGIC = b'HELDARC1'
+
+# zlib only looks back 32 KB, so a larger dictionary is never used
+MAX_DICTIONARY_SIZE = 32 * 1024
+
+_HEADER = struct.Struct('>I')
+_ENTRY = struct.Struct('>III')  # html_length, crc32, data_length
+_NAME = struct.Struct('>H')
+MAX_NAME_LENGTH = 0xFFFF  # UTF-8 bytes, fits name_length
+
+
+def train_dictionary(samples: Iterable[str], max_size: int = MAX_DICTIONARY_SIZE) -> bytes:
+    """
+    Build a shared dictionary from sample dashboards
+
+    Lines that occur in at least half of the samples are kept. The most
+    common lines go last, because deflate encodes closer matches cheaper.
+
+    Args:
+        samples: Dashboard HTML strings
+        max_size: Upper bound on dictionary size in bytes
+
+    Returns:
+        Dictionary bytes (may be empty if there are no samples)
+    """
+    counts = Counter()
+    first_seen = {}
+    total = 0
+
+    for html in samples:
+        total += 1
+        lines = html.splitlines(keepends=True)
+        counts.update(set(lines))
+        for position, line in enumerate(lines):
+            first_seen.setdefault(line, position)
+
+    if not total:
+        return b''
+
+    threshold = max(1, total // 2)
+    common = [line for line, count in counts.items() if count >= threshold]
+
+    # Least common first, ties keep document order so runs of CSS stay intact
+    common.sort(key=lambda line: (counts[line], first_seen[line]))
+
+    dictionary = b''.join(line.encode('utf-8') for line in common)
+    return dictionary[-max_size:]
+
+
+def _compress(data: bytes, dictionary: bytes) -> bytes:
+    if dictionary:
+        compressor = zlib.compressobj(9, zlib.DEFLATED, -15, 9, zlib.Z_DEFAULT_STRATEGY, dictionary)
+    else:
+        compressor = zlib.compressobj(9, zlib.DEFLATED, -15)
+    return compressor.compress(data) + compressor.flush()
+
+
+def _decompress(data: bytes, dictionary: bytes) -> bytes:
+    if dictionary:
+        decompressor = zlib.decompressobj(-15, dictionary)
+    else:
+        decompressor = zlib.decompressobj(-15)
+    return decompressor.decompress(data) + decompressor.flush()
+
+
+class DashboardArchive:
+    """Read and append dashboards in a dictionary-compressed archive file"""
+
+    def __init__(self, path: str):
+        """Open an existing archive and index its entries"""
+        self.path = Path(path)
+        if not self.path.exists():
+            raise FileNotFoundError(f"Archive not found: {path}")
+
+        self.dictionary = b''
+        self._index: Dict[str, Tuple[int, int, int, int]] = {}
+        self._load_index()
+
+    @classmethod
+    def create(cls, path: str, dictionary: bytes) -> 'DashboardArchive':
+        """Create a new, empty archive with the given shared dictionary"""
+        if len(dictionary) > MAX_DICTIONARY_SIZE:
+            raise ValueError(f"Dictionary too large: {len(dictionary)} bytes")
+
+        archive_path = Path(path)
+        archive_path.parent.mkdir(parents=True, exist_ok=True)
+        with open(archive_path, 'wb') as f:
+            f.write(MAGIC)
+            packed = zlib.compress(dictionary, 9)
+            f.write(_HEADER.pack(len(packed)))
+            f.write(packed)
+
+        return cls(str(archive_path))
+
+    def _read_exact(self, f, size: int, what: str) -> bytes:
+        """Read size bytes or raise ValueError naming the truncated field"""
+        data = f.read(size)
+        if len(data) != size:
+            raise ValueError(
+                f"Truncated archive {self.path}: {what} at byte {f.tell() - len(data)} "
+                f"needs {size} bytes, got {len(data)}"
+            )
+        return data
+
+    def _load_index(self):
+        """Scan entry headers without decompressing any data"""
+        with open(self.path, 'rb') as f:
+            if f.read(len(MAGIC)) != MAGIC:
+                raise ValueError(f"Not a HELD dashboard archive: {self.path}")
+
+            (dict_length,) = _HEADER.unpack(self._read_exact(f, _HEADER.size, 'dictionary length'))
+            try:
+                self.dictionary = zlib.decompress(self._read_exact(f, dict_length, 'dictionary'))
+            except zlib.error as e:
+                raise ValueError(f"Corrupt archive dictionary in {self.path}: {e}") from e
+
+            end = self.path.stat().st_size
+            while True:
+                raw = f.read(_NAME.size)
+                if not raw:
+                    break
+                if len(raw) != _NAME.size:
+                    raise ValueError(f"Truncated archive {self.path}: partial entry header at end")
+                (name_length,) = _NAME.unpack(raw)
+                try:
+                    name = self._read_exact(f, name_length, 'entry name').decode('utf-8')
+                except UnicodeDecodeError as e:
+                    raise ValueError(f"Corrupt entry name in {self.path}: {e}") from e
+                html_length, crc, data_length = _ENTRY.unpack(
+                    self._read_exact(f, _ENTRY.size, f"header of {name}")
+                )
+                offset = f.tell()
+                # Seek past the data, then check the file really is that long
+                f.seek(data_length, 1)
+                if f.tell() > end:
+                    raise ValueError(
+                        f"Truncated archive {self.path}: data of {name} needs {data_length} bytes"
+                    )
+                self._index[name] = (offset, data_length, html_length, crc)
+
+    def names(self) -> List[str]:
+        """Return entry names in archive order"""
+        return list(self._index)
+
+    def __contains__(self, name: str) -> bool:
+        return name in self._index
+
+    def __len__(self) -> int:
+        return len(self._index)
+
+    def add(self, name: str, html: str):
+        """Append a dashboard; later entries with the same name win on read"""
+        encoded_name = name.encode('utf-8')
+        if len(encoded_name) > MAX_NAME_LENGTH:
+            raise ValueError(
+                f"Entry name too long: {len(encoded_name)} UTF-8 bytes (max {MAX_NAME_LENGTH})"
+            )
+        raw = html.encode('utf-8')
+        data = _compress(raw, self.dictionary)
+        crc = zlib.crc32(raw)
+
+        # Headers are packed before the file is touched, so a failure
+        # cannot leave a partial entry behind
+        header = _NAME.pack(len(encoded_name)) + encoded_name + _ENTRY.pack(len(raw), crc, len(data))
+        with open(self.path, 'ab') as f:
+            f.write(header)
+            offset = f.tell()
+            f.write(data)
+
+        self._index[name] = (offset, len(data), len(raw), crc)
+
+    def read(self, name: str) -> str:
+        """Reconstruct the exact HTML stored under name"""
+        if name not in self._index:
+            raise KeyError(name)
+
+        offset, data_length, html_length, crc = self._index[name]
+        with open(self.path, 'rb') as f:
+            f.seek(offset)
+            data = f.read(data_length)
+
+        raw = _decompress(data, self.dictionary)
+        if len(raw) != html_length or zlib.crc32(raw) != crc:
+            raise ValueError(f"Corrupt archive entry: {name}")
+
+        return raw.decode('utf-8')
+
+
+def archive_outputs(output_dir: str, archive_path: str) -> DashboardArchive:
+    """
+    Pack every dashboard in output_dir into a new archive
+
+    Args:
+        output_dir: Directory with saved *.html dashboards
+        archive_path: Destination archive file
+
+    Returns:
+        The written archive
+    """
+    files = sorted(Path(output_dir).glob('*.html'))
+    # Bytes, not read_text(), so line endings survive the round trip exactly
+    documents = [(p.name, p.read_bytes().decode('utf-8')) for p in files]
+
+    dictionary = train_dictionary(html for _, html in documents)
+    archive = DashboardArchive.create(archive_path, dictionary)
+    for name, html in documents:
+        archive.add(name, html)
+
+    return archive
+
+
+def main(argv: List[str]) -> int:
+    """CLI: pack a directory, list an archive or extract one entry"""
+    usage = (
+        "Usage:\n"
+        "  python3 dashboard_archive.py pack <outputs_dir> <archive>\n"
+        "  python3 dashboard_archive.py list <archive>\n"
+        "  python3 dashboard_archive.py extract <archive> <name> [destination]"
+    )
+    if len(argv) < 2:
+        print(usage)
+        return 1
+
+    command = argv[0]
+    if command == 'pack' and len(argv) == 3:
+        archive = archive_outputs(argv[1], argv[2])
+        original = sum(p.stat().st_size for p in Path(argv[1]).glob('*.html'))
+        packed = archive.path.stat().st_size
+        print(f"{len(archive)} dashboards: {original} -> {packed} bytes")
+        return 0
+
+    if command == 'list' and len(argv) == 2:
+        for name in DashboardArchive(argv[1]).names():
+            print(name)
+        return 0
+
+    if command == 'extract' and len(argv) in (3, 4):
+        html = DashboardArchive(argv[1]).read(argv[2])
+        destination = Path(argv[3] if len(argv) == 4 else argv[2])
+        destination.write_bytes(html.encode('utf-8'))
+        print(f"Extracted: {destination}")
+        return 0
+
+    print(usage)
+    return 1
+
+
+if __name__ == "__main__":
+    sys.exit(main(sys.argv[1:]))
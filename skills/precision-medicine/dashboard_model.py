@@ -0,0 +1,228 @@
+"""
+Dashboard data model and non-HTML renderers
+
+HELDDashboardGenerator.build_model() does all parsing and analysis once and
+returns a DashboardModel; every output format renders from that model. The
+HTML renderer lives on the generator (it needs the template helpers); the
+JSON, Markdown and plain text renderers are here.
+"""
+
+import json
+from typing import Dict, List, Optional
+
+from localization import get_catalog
+
+FIELDS = (
+    'patient_name',
+    'consult_date',
+    'biomarkers',
+    'dna_variants',
+    'critical_alerts',
+    'priorities',
+    'supplement_protocol',
+    'action_plan',
+    'welldium_link',
+    'brand',
+    'locale',
+)
+
+
+class DashboardModel:
+    """Everything a dashboard shows, computed once per patient"""
+
+    __slots__ = FIELDS
+
+    def __init__(
+        self,
+        patient_name: str,
+        consult_date: str,
+        biomarkers: List[Dict],
+        dna_variants: List[Dict],
+        critical_alerts: List[Dict],
+        priorities: List[Dict],
+        supplement_protocol: List[Dict],
+        action_plan: List[Dict],
+        welldium_link: str = "",
+        brand: Optional[str] = None,
+        locale: Optional[str] = None
+    ):
+        self.patient_name = patient_name
+        self.consult_date = consult_date
+        self.biomarkers = biomarkers
+        self.dna_variants = dna_variants
+        self.critical_alerts = critical_alerts
+        self.priorities = priorities
+        self.supplement_protocol = supplement_protocol
+        self.action_plan = action_plan
+        self.welldium_link = welldium_link
+        self.brand = brand
+        self.locale = locale
+
+    def to_dict(self) -> Dict:
+        """Plain dict of all fields (shares the underlying lists)"""
+        return {field: getattr(self, field) for field in FIELDS}
+
+    @classmethod
+    def from_dict(cls, data: Dict) -> 'DashboardModel':
+        """Rebuild a model from to_dict() output or parsed JSON"""
+        return cls(**{field: data[field] for field in FIELDS if field in data})
+
+    def __eq__(self, other) -> bool:
+        if not isinstance(other, DashboardModel):
+            return NotImplemented
+        return self.to_dict() == other.to_dict()
+
+    def __repr__(self) -> str:
+        return f"DashboardModel(patient_name={self.patient_name!r}, consult_date={self.consult_date!r})"
+
+
+def _load_msgpack():
+    """Import msgpack lazily so the generator itself stays stdlib-only"""
+    try:
+        import msgpack
+    except ImportError as e:
+        raise ImportError(
+            "msgpack serialization requires msgpack: pip install msgpack"
+        ) from e
+    return msgpack
+
+
+def to_json(model: DashboardModel, indent=None) -> str:
+    """Serialize a model to JSON (compact unless indent is given)"""
+    separators = (',', ':') if indent is None else None
+    return json.dumps(model.to_dict(), ensure_ascii=False, indent=indent, separators=separators)
+
+
+def from_json(text: str) -> DashboardModel:
+    """Deserialize a model from JSON"""
+    return DashboardModel.from_dict(json.loads(text))
+
+
+def to_msgpack(model: DashboardModel) -> bytes:
+    """Serialize a model to msgpack (optional dependency)"""
+    return _load_msgpack().packb(model.to_dict(), use_bin_type=True)
+
+
+def from_msgpack(data: bytes) -> DashboardModel:
+    """Deserialize a model from msgpack (optional dependency)"""
+    return DashboardModel.from_dict(_load_msgpack().unpackb(data, raw=False))
+
+
+def _optimal_suffix(alert: Dict) -> str:
+    """' (optimal range)' after an alert, or nothing when the marker has none"""
+    return f" ({alert['optimal']})" if alert['optimal'] else ''
+
+
+def render_markdown(model: DashboardModel) -> str:
+    """Render a model as Markdown"""
+    t = get_catalog(model.locale)
+    lines = [
+        f"# {model.patient_name} - Precision Health Dashboard",
+        "",
+        f"**{t('html.consult_date')}:** {model.consult_date}",
+        "",
+        f"## {t('section.alerts.title')}",
+        "",
+    ]
+    if model.critical_alerts:
+        for alert in model.critical_alerts:
+            lines.append(
+                f"- {alert['icon']} **{alert['title']}** - {alert['marker']}"
+                f"{_optimal_suffix(alert)}. {alert['description']}"
+            )
+    else:
+        lines.append(f"- ✅ {t('alerts.none.title')}")
+
+    lines += ["", f"## {t('section.biomarkers.title')}", ""]
+    if model.biomarkers:
+        lines += [
+            f"| {t('markdown.marker')} | {t('markdown.value')} | {t('markdown.optimal')} | Status |",
+            "| --- | --- | --- | --- |"
+        ]
+        for marker in model.biomarkers:
+            lines.append(
+                f"| {marker['name']} | {marker['value']} {marker['unit']} "
+                f"| {marker['optimal_range']} {marker['unit']} | {marker['status'].upper()} |"
+            )
+    else:
+        lines.append(t('biomarkers.none'))
+
+    lines += ["", f"## {t('section.dna.title')}", ""]
+    if model.dna_variants:
+        lines += [
+            f"| {t('markdown.gene')} | rs | Genotype | {t('dna.impact')} |",
+            "| --- | --- | --- | --- |"
+        ]
+        for variant in model.dna_variants:
+            lines.append(
+                f"| {variant['gene']} | {variant['rs_number']} "
+                f"| {variant['genotype']} | {variant['impact']} |"
+            )
+    else:
+        lines.append(t('dna.none'))
+
+    lines += ["", f"## {t('section.supplements.title')}", ""]
+    if model.supplement_protocol:
+        for supp in model.supplement_protocol:
+            lines.append(
+                f"- **{supp['time']}** ({supp['time_label']}) - **{supp['name']}** "
+                f"`{t('badge.' + supp['badge'].lower().replace(' ', '-'))}`: {supp['dosage']}. {supp['reason']}"
+            )
+            for message in supp.get('interactions', ()):
+                lines.append(f"  - ⚠️ {message}")
+    else:
+        lines.append(t('supplements.none'))
+    if model.welldium_link:
+        lines += ["", f"[{t('html.order_welldium')}]({model.welldium_link})"]
+
+    lines += ["", f"## {t('section.plan.title')}"]
+    for phase in model.action_plan:
+        lines += ["", f"### {phase['phase']} ({phase['duration']})", ""]
+        for action in phase['actions']:
+            lines.append(f"- {action['icon']} **{action['title']}**: {action['description']}")
+        for warning in phase.get('warnings', ()):
+            lines.append(f"- {warning}")
+
+    return '\n'.join(lines) + '\n'
+
+
+def render_text(model: DashboardModel) -> str:
+    """Render a model as plain text (e.g. for e-mail)"""
+    t = get_catalog(model.locale)
+    rule = '=' * 70
+    lines = [
+        rule,
+        f"{model.patient_name} - Precision Health Dashboard",
+        f"{t('html.consult_date')}: {model.consult_date}",
+        rule
+    ]
+
+    lines += ["", t('section.alerts.title').upper()]
+    if model.critical_alerts:
+        for alert in model.critical_alerts:
+            lines.append(f"  {alert['title']}: {alert['marker']}{_optimal_suffix(alert)}")
+    else:
+        lines.append(f"  {t('alerts.none.title')}")
+
+    lines += ["", t('text.blood')]
+    for marker in model.biomarkers:
+        lines.append(
+            f"  {marker['name']}: {marker['value']} {marker['unit']} "
+            f"({t('text.optimal')} {marker['optimal_range']}) [{marker['status'].upper()}]"
+        )
+
+    lines += ["", t('text.dna')]
+    for variant in model.dna_variants:
+        lines.append(f"  {variant['gene']} {variant['rs_number']} {variant['genotype']} [{variant['severity']}]")
+
+    lines += ["", t('text.supplements')]
+    for supp in model.supplement_protocol:
+        lines.append(f"  {supp['time']}  {supp['name']} - {supp['dosage']}")
+
+    lines += ["", t('text.plan')]
+    for phase in model.action_plan:
+        lines.append(f"  {phase['phase']} ({phase['duration']})")
+        for action in phase['actions']:
+            lines.append(f"    - {action['title']}")
+
+    return '\n'.join(lines) + '\n'
@@ -0,0 +1,234 @@
+"""
+Virtualized DNA variant section for large variant lists
+
+A 32-gene panel renders one dna-card per variant. Raw genotype imports
+have thousands of variants, so above a threshold the section is rendered
+differently:
+
+    - critical/warning variants get server-rendered cards (capped)
+    - all variants are embedded once as compact, column-interned JSON
+    - a small inline script draws only the rows in view, with severity
+      and gene filters, so the DOM stays small however many variants exist
+"""
+
+import json
+from typing import Callable, Dict, List, Optional
+
+from localization import Catalog, get_catalog
+
+# Variant lists longer than this are rendered virtualized
+VIRTUALIZE_THRESHOLD = 200
+
+# At most this many cards are server-rendered in virtual mode
+MAX_SERVER_CARDS = 50
+
+SEVERITIES = ('critical', 'warning', 'info')
+_SEVERITY_CODES = {severity: code for code, severity in enumerate(SEVERITIES)}
+
+# Only dashboards in virtual mode need these rules, so they ship with the section
+_CSS = """
+    .dna-virtual,
+    .dna-more {
+        grid-column: 1 / -1;
+    }
+
+    .dna-more {
+        font-size: 0.9rem;
+        opacity: 0.7;
+    }
+
+    .dna-filters {
+        display: flex;
+        gap: 1rem;
+        align-items: center;
+        margin-bottom: 1rem;
+    }
+
+    .dna-filters select,
+    .dna-filters input {
+        padding: 0.5rem 0.75rem;
+        border: 2px solid var(--gray-border);
+        border-radius: 8px;
+        font: inherit;
+    }
+
+    .dna-filter-count {
+        margin-left: auto;
+        font-size: 0.85rem;
+        opacity: 0.7;
+    }
+
+    .dna-viewport {
+        height: 480px;
+        overflow-y: auto;
+        border: 2px solid var(--gray-border);
+        border-radius: 12px;
+    }
+
+    .dna-spacer {
+        position: relative;
+    }
+
+    .dna-row {
+        position: absolute;
+        left: 0;
+        right: 0;
+        height: 44px;
+        display: grid;
+        grid-template-columns: 7rem 7rem 4rem 6rem 1fr;
+        gap: 1rem;
+        align-items: center;
+        padding: 0 1rem;
+        border-bottom: 1px solid var(--gray-border);
+        border-left: 4px solid transparent;
+        font-size: 0.9rem;
+        white-space: nowrap;
+        overflow: hidden;
+    }
+
+    .dna-row span {
+        overflow: hidden;
+        text-overflow: ellipsis;
+    }
+
+    .dna-row span:first-child {
+        font-weight: 700;
+        color: var(--jungle-green);
+    }
+
+    .dna-row.severity-critical {
+        border-left-color: var(--status-critical);
+    }
+
+    .dna-row.severity-warning {
+        border-left-color: var(--status-warning);
+    }
+"""
+
+_SCRIPT = """
+(function () {
+    var data = JSON.parse(document.getElementById('dna-variants-data').textContent);
+    var viewport = document.getElementById('dna-viewport');
+    var spacer = viewport.firstElementChild;
+    var severityFilter = document.getElementById('dna-filter-severity');
+    var geneFilter = document.getElementById('dna-filter-gene');
+    var counter = document.getElementById('dna-filter-count');
+    var ROW = 44, OVERSCAN = 8, visible = data.rows, pending = false;
+
+    function draw() {
+        var first = Math.max(0, Math.floor(viewport.scrollTop / ROW) - OVERSCAN);
+        var last = Math.min(visible.length, Math.ceil((viewport.scrollTop + viewport.clientHeight) / ROW) + OVERSCAN);
+        var fragment = document.createDocumentFragment();
+        for (var i = first; i < last; i++) {
+            var r = visible[i], row = document.createElement('div');
+            row.className = 'dna-row severity-' + data.severities[r[3]];
+            row.style.top = (i * ROW) + 'px';
+            [data.genes[r[0]], r[1], r[2], r[4], data.impacts[r[5]]].forEach(function (text) {
+                var cell = document.createElement('span');
+                cell.textContent = text;
+                row.appendChild(cell);
+            });
+            fragment.appendChild(row);
+        }
+        spacer.textContent = '';
+        spacer.appendChild(fragment);
+    }
+
+    function filter() {
+        var severity = severityFilter.value, gene = geneFilter.value.trim().toUpperCase();
+        visible = data.rows.filter(function (r) {
+            return (!severity || data.severities[r[3]] === severity)
+                && (!gene || data.genes[r[0]].indexOf(gene) === 0);
+        });
+        spacer.style.height = (visible.length * ROW) + 'px';
+        counter.textContent = visible.length + ' / ' + data.rows.length;
+        viewport.scrollTop = 0;
+        draw();
+    }
+
+    viewport.addEventListener('scroll', function () {
+        if (!pending) {
+            pending = true;
+            requestAnimationFrame(function () { pending = false; draw(); });
+        }
+    });
+    severityFilter.addEventListener('change', filter);
+    geneFilter.addEventListener('input', filter);
+    filter();
+})();
+"""
+
+
+def encode_variants(dna_variants: List[Dict]) -> str:
+    """
+    Compact JSON for the client-side grid
+
+    Genes and impact texts repeat heavily, so they are interned into lookup
+    lists; each row is [gene, rs_number, genotype, severity, variant, impact]
+    with gene, severity and impact as indices.
+    """
+    genes: Dict[str, int] = {}
+    impacts: Dict[str, int] = {}
+    rows = []
+    for v in dna_variants:
+        rows.append([
+            genes.setdefault(v['gene'], len(genes)),
+            v['rs_number'],
+            v['genotype'],
+            _SEVERITY_CODES.get(v['severity'], _SEVERITY_CODES['info']),
+            v.get('variant_name') or '',
+            impacts.setdefault(v['impact'], len(impacts)),
+        ])
+
+    payload = {
+        'severities': SEVERITIES,
+        'genes': list(genes),
+        'impacts': list(impacts),
+        'rows': rows,
+    }
+    # '</' would end the surrounding <script> element early
+    return json.dumps(payload, ensure_ascii=False, separators=(',', ':')).replace('</', '<\\/')
+
+
+def build_virtual_dna_html(
+    dna_variants: List[Dict],
+    render_card: Callable[[Dict], str],
+    t: Optional[Catalog] = None
+) -> str:
+    """
+    Build the virtualized DNA section
+
+    Args:
+        dna_variants: Parsed variants
+        render_card: Renders one server-side dna-card (the normal card markup)
+        t: Catalog for the section's labels (Dutch by default)
+    """
+    t = t or get_catalog()
+    flagged = sorted(
+        (v for v in dna_variants if v['severity'] in ('critical', 'warning')),
+        key=lambda v: _SEVERITY_CODES[v['severity']]
+    )
+    cards = '\n'.join(render_card(v) for v in flagged[:MAX_SERVER_CARDS])
+    hidden = len(flagged) - MAX_SERVER_CARDS
+    more = f'<p class="dna-more">{t("dna.more_flagged", count=hidden)}</p>' if hidden > 0 else ''
+
+    return f"""
+            <style>{_CSS}</style>
+            {cards}
+            {more}
+            <div class="dna-virtual">
+                <div class="dna-filters">
+                    <select id="dna-filter-severity">
+                        <option value="">{t('dna.filter_all')}</option>
+                        <option value="critical">{t('dna.filter_critical')}</option>
+                        <option value="warning">{t('dna.filter_warning')}</option>
+                        <option value="info">{t('dna.filter_info')}</option>
+                    </select>
+                    <input id="dna-filter-gene" type="search" placeholder="{t('dna.filter_gene')}">
+                    <span id="dna-filter-count" class="dna-filter-count">{len(dna_variants)} / {len(dna_variants)}</span>
+                </div>
+                <div id="dna-viewport" class="dna-viewport"><div class="dna-spacer"></div></div>
+            </div>
+            <script type="application/json" id="dna-variants-data">{encode_variants(dna_variants)}</script>
+            <script>{_SCRIPT}</script>
+            """
@@ -0,0 +1,413 @@
+"""
+Golden-file regression harness for rendered dashboards
+
+A deterministic corpus of synthetic patients is rendered and compared with
+stored goldens. Both sides are parsed into a normalized tree first:
+whitespace is collapsed, comments dropped, attributes sorted, and
+<style>/<script> bodies are replaced by a digest so goldens stay small.
+Every node carries a hash of its subtree, so identical dashboards compare
+in one linear pass. Differing ones are diffed by descending only into
+subtrees whose hashes differ, which reports each change with its path
+instead of a wall of text.
+
+    python golden.py --count 300 --golden-dir outputs/golden --update
+    python golden.py --count 300 --golden-dir outputs/golden
+"""
+
+import hashlib
+import random
+import re
+import sys
+from html import escape
+from html.parser import HTMLParser
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+DEFAULT_GOLDEN_DIR = Path(__file__).resolve().parent / 'tests' / 'golden'
+
+# Elements that never have children
+VOID_TAGS = frozenset(('area', 'base', 'br', 'col', 'embed', 'hr', 'img', 'input', 'link', 'meta', 'source', 'wbr'))
+
+# Elements whose body is replaced by a digest
+OPAQUE_TAGS = frozenset(('style', 'script'))
+
+# Pseudo-tag for <!DOCTYPE ...> declarations
+DOCTYPE = '!doctype'
+_DIGEST = re.compile(r'^sha1:[0-9a-f]{16} \(\d+ bytes\)$')
+
+
+class Node:
+    """A normalized element or text node with a hash of its subtree"""
+
+    __slots__ = ('tag', 'attrs', 'text', 'children', 'digest')
+
+    def __init__(self, tag: Optional[str], attrs: Tuple[Tuple[str, str], ...] = (), text: str = ''):
+        self.tag = tag  # None for text nodes
+        self.attrs = attrs
+        self.text = text
+        self.children: List['Node'] = []
+        self.digest = b''
+
+    def seal(self) -> bytes:
+        """Compute the subtree hash bottom-up (children first)"""
+        h = hashlib.sha1()
+        h.update(repr((self.tag, self.attrs, self.text)).encode('utf-8'))
+        for child in self.children:
+            h.update(child.seal())
+        self.digest = h.digest()
+        return self.digest
+
+    def label(self) -> str:
+        if self.tag is None:
+            return '#text'
+        classes = dict(self.attrs).get('class', '').split()
+        return self.tag + (f".{classes[0]}" if classes else '')
+
+
+def _collapse(text: str) -> str:
+    return ' '.join(text.split())
+
+
+class _TreeBuilder(HTMLParser):
+
+    def __init__(self):
+        super().__init__(convert_charrefs=True)
+        self.root = Node('#document')
+        self._stack = [self.root]
+
+    def handle_starttag(self, tag, attrs):
+        node = Node(tag, tuple(sorted((name, _collapse(value or '')) for name, value in attrs)))
+        self._stack[-1].children.append(node)
+        if tag not in VOID_TAGS:
+            self._stack.append(node)
+
+    def handle_startendtag(self, tag, attrs):
+        self.handle_starttag(tag, attrs)
+        if tag not in VOID_TAGS:
+            self._stack.pop()
+
+    def handle_endtag(self, tag):
+        # Close up to the matching element; stray end tags are ignored
+        for depth in range(len(self._stack) - 1, 0, -1):
+            if self._stack[depth].tag == tag:
+                del self._stack[depth:]
+                return
+
+    def handle_decl(self, decl):
+        self._stack[-1].children.append(Node(DOCTYPE, text=decl))
+
+    def handle_data(self, data):
+        parent = self._stack[-1]
+        if parent.tag in OPAQUE_TAGS:
+            parent.text += data
+            return
+        # The parser splits text at stray '<' and entities; keep one node per run
+        if parent.children and parent.children[-1].tag is None:
+            parent.children[-1].text += data
+        else:
+            parent.children.append(Node(None, text=data))
+
+
+def parse_html(html: str) -> Node:
+    """Parse HTML into a normalized, hashed tree"""
+    builder = _TreeBuilder()
+    builder.feed(html)
+    builder.close()
+
+    stack = [builder.root]
+    while stack:
+        node = stack.pop()
+        for child in node.children:
+            if child.tag is None:
+                child.text = _collapse(child.text)
+        node.children = [child for child in node.children if child.tag is not None or child.text]
+        if node.tag in OPAQUE_TAGS and node.text:
+            body = node.text.strip()
+            # Goldens already hold the digest
+            if not _DIGEST.match(body):
+                data = body.encode('utf-8')
+                body = f"sha1:{hashlib.sha1(data).hexdigest()[:16]} ({len(data)} bytes)"
+            node.text = body
+        stack.extend(node.children)
+    builder.root.seal()
+    return builder.root
+
+
+def serialize(root: Node) -> str:
+    """Canonical, indented HTML for a normalized tree (the golden file format)"""
+    lines: List[str] = []
+
+    def write(node: Node, depth: int):
+        indent = '  ' * depth
+        if node.tag is None:
+            lines.append(indent + escape(node.text, quote=False))
+            return
+        if node.tag == DOCTYPE:
+            lines.append(f"{indent}<!{node.text}>")
+            return
+        attrs = ''.join(f' {name}="{escape(value)}"' for name, value in node.attrs)
+        lines.append(f"{indent}<{node.tag}{attrs}>")
+        if node.tag in VOID_TAGS:
+            return
+        if node.text:
+            lines.append(f"{indent}  {node.text}")
+        for child in node.children:
+            write(child, depth + 1)
+        lines.append(f"{indent}</{node.tag}>")
+
+    for child in root.children:
+        write(child, 0)
+    return '\n'.join(lines) + '\n'
+
+
+def normalize(html: str) -> str:
+    """Normalized form of a document"""
+    return serialize(parse_html(html))
+
+
+def diff_trees(expected: Node, actual: Node, limit: int = 20) -> List[str]:
+    """
+    Structural differences between two normalized trees
+
+    Only subtrees with different hashes are visited. Within a parent,
+    children are aligned by hash: a common prefix and suffix are skipped,
+    unchanged children elsewhere are matched through a hash index, and the
+    rest are paired in order when their tags agree.
+
+    Returns:
+        Up to limit human-readable differences, each prefixed with its path
+    """
+    differences: List[str] = []
+
+    def report(path: str, message: str):
+        if len(differences) < limit:
+            differences.append(f"{path}: {message}")
+
+    def compare(a: Node, b: Node, path: str):
+        if a.digest == b.digest or len(differences) >= limit:
+            return
+        if a.tag != b.tag or a.tag is None:
+            report(path, f"{_describe(a)} -> {_describe(b)}")
+            return
+        if a.attrs != b.attrs:
+            before, after = dict(a.attrs), dict(b.attrs)
+            for name in sorted(set(before) | set(after)):
+                if before.get(name) != after.get(name):
+                    report(path, f"@{name} {before.get(name)!r} -> {after.get(name)!r}")
+        if a.text != b.text:
+            report(path, f"content {a.text!r} -> {b.text!r}")
+        compare_children(a.children, b.children, path)
+
+    def compare_children(old: List[Node], new: List[Node], path: str):
+        start = 0
+        while start < len(old) and start < len(new) and old[start].digest == new[start].digest:
+            start += 1
+        end_old, end_new = len(old), len(new)
+        while end_old > start and end_new > start and old[end_old - 1].digest == new[end_new - 1].digest:
+            end_old -= 1
+            end_new -= 1
+
+        # Children that only moved are not differences
+        unmatched: Dict[bytes, List[int]] = {}
+        for i in range(start, end_old):
+            unmatched.setdefault(old[i].digest, []).append(i)
+        remaining_new = []
+        for j in range(start, end_new):
+            candidates = unmatched.get(new[j].digest)
+            if candidates:
+                candidates.pop(0)
+            else:
+                remaining_new.append(j)
+        remaining_old = sorted(i for indices in unmatched.values() for i in indices)
+
+        # Pair what is left in order, by tag
+        k = 0
+        for i in remaining_old:
+            while k < len(remaining_new) and new[remaining_new[k]].tag != old[i].tag:
+                j = remaining_new[k]
+                report(f"{path}/{new[j].label()}[{j}]", f"added {_describe(new[j])}")
+                k += 1
+            if k < len(remaining_new):
+                j = remaining_new[k]
+                compare(old[i], new[j], f"{path}/{old[i].label()}[{i}]")
+                k += 1
+            else:
+                report(f"{path}/{old[i].label()}[{i}]", f"removed {_describe(old[i])}")
+        for j in remaining_new[k:]:
+            report(f"{path}/{new[j].label()}[{j}]", f"added {_describe(new[j])}")
+
+    compare(expected, actual, '')
+    return differences
+
+
+def _describe(node: Node) -> str:
+    if node.tag is None:
+        return repr(node.text if len(node.text) <= 60 else node.text[:57] + '...')
+    return f"<{node.label()}>"
+
+
+# Synthetic patient corpus: (name, unit, optimal range, normal range, low, high)
+_MARKERS = (
+    ('HomocysteÏne', 'µmol/L', '<8.0', '3.7-13.9', 4.0, 25.0),
+    ('Ferritine', 'µg/L', '50-120', '22-322', 15.0, 400.0),
+    ('Vitamine D', 'ng/ml', '45-60', '30-100', 15.0, 80.0),
+    ('Vitamine B12', 'pmol/L', '400-700', '145-569', 150.0, 900.0),
+    ('Foliumzuur', 'nmol/L', '20-45', '7-45', 5.0, 50.0),
+    ('CRP', 'mg/L', '<1.0', '0-5', 0.2, 12.0),
+    ('Zink', 'µmol/L', '12-18', '10-18', 8.0, 20.0),
+    ('Magnesium', 'mmol/L', '0.85-1.0', '0.7-1.0', 0.6, 1.1),
+    ('TSH', 'mU/L', '0.5-2.5', '0.4-4.0', 0.2, 6.0),
+)
+
+# (gene, rs number, genotypes, variant name, impact)
+_VARIANTS = (
+    ('MTHFR', 'rs1801133', ('GG', 'AG', 'AA'), 'C677T', 'Up to 40% reduction in gene function'),
+    ('CBS', 'rs234706', ('GG', 'AG', 'AA'), '', 'Thought to be the strongest indicator of increased (up to 10x) CBS activity'),
+    ('PEMT', 'rs7946', ('CC', 'CT', 'TT'), '', 'Potential for reduced choline synthesis'),
+    ('BHMT', 'rs567754', ('CC', 'CT', 'TT'), '', 'Reduced betaine-homocysteine methylation'),
+    ('COMT', 'rs4680', ('GG', 'AG', 'AA'), 'V158M', 'Slower breakdown of catecholamines'),
+    ('VDR', 'rs1544410', ('GG', 'AG', 'AA'), 'Bsm1', 'Altered vitamin D receptor activity'),
+    ('MTR', 'rs1805087', ('AA', 'AG', 'GG'), 'A2756G', 'Increased B12 utilization'),
+    ('MTRR', 'rs1801394', ('AA', 'AG', 'GG'), 'A66G', 'Reduced B12 recycling'),
+    ('MAOA', 'rs6323', ('GG', 'GT', 'TT'), '', 'Altered monoamine oxidase A activity'),
+)
+
+_NOTES = (
+    'Geen bijzonderheden.',
+    'Vermoeid en slaapt slecht.',
+    'Gebruikt levothyroxine.',
+    'Gebruikt warfarine sinds 2019.',
+    'Zwanger, 12 weken.',
+    'Verminderde nierfunctie.',
+    'Doel: meer energie.',
+    'Niet zwanger, wel hoofdpijn.',
+)
+
+_LOCALES = ('nl', 'nl', 'en', 'de')
+
+
+def _blood_line(rng: random.Random, marker: Tuple) -> str:
+    name, unit, optimal, normal, low, high = marker
+    value = round(rng.uniform(low, high), 1 if high >= 10 else 2)
+    bounds = optimal.lstrip('<>').split('-')
+    flag = ''
+    if value > float(bounds[-1]) and not optimal.startswith('>'):
+        flag = '+ '
+    elif value < float(bounds[0]) and not optimal.startswith('<'):
+        flag = '- '
+    if rng.random() < 0.5:
+        return f"{name} {flag}{value} Opt:{optimal} V.N {normal} {unit}"
+    return f"{name} {flag}{value} {optimal}:opt. {normal}:VN {unit}"
+
+
+def _dna_line(rng: random.Random, variant: Tuple) -> str:
+    gene, rs_number, genotypes, variant_name, impact = variant
+    bracket = f" [{variant_name}]" if variant_name else ''
+    return f"{gene} {rs_number} {rng.choice(genotypes)}{bracket} {impact}"
+
+
+def synthetic_patients(count: int, seed: int = 0) -> List[Dict]:
+    """
+    Deterministic corpus of synthetic patients
+
+    Returns:
+        One dict per patient: 'patient_id' plus generate_dashboard keyword
+        arguments. The same (count, seed) always gives the same corpus, and
+        a larger count extends a smaller one.
+    """
+    patients = []
+    for index in range(count):
+        rng = random.Random(f"{seed}:{index}")
+        markers = rng.sample(_MARKERS, rng.randint(2, len(_MARKERS)))
+        variants = rng.sample(_VARIANTS, rng.randint(2, len(_VARIANTS)))
+        patients.append({
+            'patient_id': f"patient_{seed}_{index:04d}",
+            'patient_name': f"Patiënt {index:04d}",
+            'consult_date': f"2025-{rng.randint(1, 12):02d}-{rng.randint(1, 28):02d}",
+            'consult_notes': ' '.join(rng.sample(_NOTES, 2)),
+            'blood_data': '\n'.join(_blood_line(rng, m) for m in markers),
+            'dna_data': '\n'.join(_dna_line(rng, v) for v in variants),
+            'welldium_link': f"https://welldium.com/r/{index:04d}" if rng.random() < 0.3 else '',
+            'locale': _LOCALES[index % len(_LOCALES)],
+        })
+    return patients
+
+
+def render_patient(generator, patient: Dict) -> str:
+    """Render one corpus patient as HTML"""
+    kwargs = {key: value for key, value in patient.items() if key != 'patient_id'}
+    return generator.generate_dashboard(**kwargs)
+
+
+def check_goldens(
+    generator,
+    patients: List[Dict],
+    golden_dir: Path = DEFAULT_GOLDEN_DIR,
+    update: bool = False
+) -> Dict[str, List[str]]:
+    """
+    Render every patient and diff it against its golden
+
+    Args:
+        generator: HELDDashboardGenerator
+        patients: Output of synthetic_patients
+        golden_dir: Directory with <patient_id>.html goldens
+        update: Rewrite the goldens instead of comparing
+
+    Returns:
+        {patient_id: differences} for every patient that does not match
+    """
+    golden_dir = Path(golden_dir)
+    if update:
+        golden_dir.mkdir(parents=True, exist_ok=True)
+
+    failures: Dict[str, List[str]] = {}
+    for patient in patients:
+        actual = parse_html(render_patient(generator, patient))
+        path = golden_dir / f"{patient['patient_id']}.html"
+        if update:
+            path.write_text(serialize(actual), encoding='utf-8')
+            continue
+        if not path.exists():
+            failures[patient['patient_id']] = ["missing golden (run with --update)"]
+            continue
+        differences = diff_trees(parse_html(path.read_text(encoding='utf-8')), actual)
+        if differences:
+            failures[patient['patient_id']] = differences
+    return failures
+
+
+def main(argv: List[str]) -> int:
+    """CLI: compare (or --update) the goldens for a synthetic corpus"""
+    import argparse
+    import time
+
+    from held_dashboard_generator import HELDDashboardGenerator
+
+    parser = argparse.ArgumentParser(description="Golden-file regression check for dashboards")
+    parser.add_argument('--count', type=int, default=12, help="Patients in the corpus (default: 12)")
+    parser.add_argument('--seed', type=int, default=0, help="Corpus seed (default: 0)")
+    parser.add_argument('--golden-dir', default=str(DEFAULT_GOLDEN_DIR),
+                        help="Golden directory (default: tests/golden)")
+    parser.add_argument('--update', action='store_true', help="Rewrite the goldens")
+    args = parser.parse_args(argv)
+
+    started = time.perf_counter()
+    patients = synthetic_patients(args.count, args.seed)
+    failures = check_goldens(HELDDashboardGenerator(), patients, Path(args.golden_dir), args.update)
+    elapsed = time.perf_counter() - started
+
+    if args.update:
+        print(f"{len(patients)} goldens geschreven naar {args.golden_dir} ({elapsed:.1f}s)")
+        return 0
+
+    for patient_id, differences in failures.items():
+        print(f"✗ {patient_id}")
+        for difference in differences:
+            print(f"    {difference}")
+    print(f"{len(patients) - len(failures)}/{len(patients)} dashboards gelijk ({elapsed:.1f}s)")
+    return 1 if failures else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main(sys.argv[1:]))
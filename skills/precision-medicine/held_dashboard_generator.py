@@ -8,10 +8,26 @@ import json
 import re
 from datetime import datetime
 from pathlib import Path
-from typing import Dict, List, Optional
-
+from typing import Callable, Dict, FrozenSet, Iterable, List, Optional
+
+import action_plan
+import dashboard_model
+import dna_section
+import supplement_protocol
+from action_plan import resolve_plan
+from biomarker_charts import range_bar, sparkline
+from consult_notes import NotesFacts, analyze_notes
+from dashboard_model import DashboardModel
+from interactions import default_checker
+from localization import Catalog, get_catalog
 from parsers.blood_parser import BloodParser
 from parsers.dna_parser import DNAParser
+from parsers.markers import resolve_marker
+from parsers.thresholds import ThresholdEngine, evaluated_range
+from priorities import PriorityEngine, deviation
+from supplement_protocol import resolve_protocol
+from supplement_schedule import schedule_protocol
+from themes import ThemeRegistry
 
 
 class HELDDashboardGenerator:
@@ -20,8 +36,20 @@ class HELDDashboardGenerator:
     def __init__(self, config_path: str = "config/brand_config.json"):
         """Initialize with HELD branding configuration"""
         self.config = self._load_config(config_path)
-        self.blood_parser = BloodParser()
+        self.blood_parser = BloodParser(ThresholdEngine.from_config(self.config))
         self.dna_parser = DNAParser()
+        self.interaction_checker = default_checker()
+        self.priority_engine = PriorityEngine.from_config(self.config)
+        # Every brand's stylesheet is compiled here, once
+        self.themes = ThemeRegistry.from_config(self.config)
+
+        # Output format -> callable(model) -> str; add entries for new formats
+        self.renderers: Dict[str, Callable[[DashboardModel], str]] = {
+            'html': lambda model: self.build_html(**model.to_dict()),
+            'json': dashboard_model.to_json,
+            'markdown': dashboard_model.render_markdown,
+            'text': dashboard_model.render_text,
+        }
 
     def _load_config(self, config_path: str) -> Dict:
         """Load brand configuration"""
@@ -39,7 +67,9 @@ class HELDDashboardGenerator:
         consult_notes: str,
         blood_data: str,
         dna_data: str,
-        welldium_link: str = ""
+        welldium_link: str = "",
+        brand: Optional[str] = None,
+        locale: Optional[str] = None
     ) -> str:
         """
         Generate complete HTML dashboard
@@ -51,24 +81,60 @@ class HELDDashboardGenerator:
             blood_data: Raw blood test results text
             dna_data: Raw DNA methylation results text
             welldium_link: Optional Welldium supplement order link
+            brand: Brand id to render with (see self.themes); HELD by default
+            locale: Dashboard language ('nl', 'en', 'de'); Dutch by default
 
         Returns:
             Complete HTML dashboard as string
         """
+        model = self.build_model(
+            patient_name=patient_name,
+            consult_date=consult_date,
+            consult_notes=consult_notes,
+            blood_data=blood_data,
+            dna_data=dna_data,
+            welldium_link=welldium_link,
+            brand=brand,
+            locale=locale
+        )
+        return self.render(model, 'html')
+
+    def build_model(
+        self,
+        patient_name: str,
+        consult_date: str,
+        consult_notes: str,
+        blood_data: str,
+        dna_data: str,
+        welldium_link: str = "",
+        brand: Optional[str] = None,
+        locale: Optional[str] = None
+    ) -> DashboardModel:
+        """
+        Parse and analyze patient data once, for rendering in any format
+
+        Takes the same arguments as generate_dashboard.
+        """
         # Parse data
         biomarkers = self.blood_parser.parse(blood_data)
         dna_variants = self.dna_parser.parse(dna_data)
+        notes = analyze_notes(consult_notes)
 
         # Analyze
-        critical_alerts = self.identify_critical_alerts(biomarkers)
+        critical_alerts = self.identify_critical_alerts(biomarkers, locale)
         priorities = self.generate_priorities(biomarkers, dna_variants)
 
         # Generate protocols
-        supplement_protocol = self.generate_supplement_protocol(dna_variants, biomarkers)
-        action_plan = self.generate_3month_plan(dna_variants, biomarkers)
+        supplement_protocol = self.generate_supplement_protocol(
+            dna_variants,
+            biomarkers,
+            medications=notes.medications,
+            locale=locale,
+            contraindications=notes.contraindications
+        )
+        action_plan = self.generate_3month_plan(dna_variants, biomarkers, locale, notes)
 
-        # Build HTML
-        html = self.build_html(
+        return DashboardModel(
             patient_name=patient_name,
             consult_date=consult_date,
             biomarkers=biomarkers,
@@ -77,76 +143,116 @@ class HELDDashboardGenerator:
             priorities=priorities,
             supplement_protocol=supplement_protocol,
             action_plan=action_plan,
-            welldium_link=welldium_link
+            welldium_link=welldium_link,
+            brand=brand,
+            locale=locale
         )
 
-        return html
+    def render(self, model: DashboardModel, output_format: str = 'html') -> str:
+        """
+        Render a dashboard model
 
-    def identify_critical_alerts(self, biomarkers: List[Dict]) -> List[Dict]:
+        Args:
+            model: Output of build_model
+            output_format: Key in self.renderers ('html', 'json', 'markdown', 'text')
+        """
+        renderer = self.renderers.get(output_format)
+        if renderer is None:
+            raise ValueError(
+                f"Unknown output format: {output_format} (choose from {', '.join(self.renderers)})"
+            )
+        return renderer(model)
+
+    def identify_critical_alerts(
+        self,
+        biomarkers: List[Dict],
+        locale: Optional[str] = None
+    ) -> List[Dict]:
         """
         Identify top 3 critical alerts for immediate attention
 
-        Priority order:
-        1. Homocysteine (cardiovascular risk)
-        2. Ferritin (inflammation)
-        3. Vitamin D (immune function)
+        Every critical or warning biomarker is a candidate; they are ranked
+        by priority score (see priorities.PriorityEngine), which puts
+        homocysteine, ferritin and vitamin D first for comparable deviations.
+        Markers without their own catalog texts get the generic ones.
         """
+        t = get_catalog(locale)
         alerts = []
+        for index in self.priority_engine.rank_biomarkers(biomarkers, 3):
+            marker = biomarkers[index]
+            key = resolve_marker(marker['name'])
+            status = marker['status']
+            direction = self._alert_direction(marker)
+
+            title_key = next(
+                (k for k in (
+                    f"alert.{key}.title_{status}", f"alert.{key}.title_{direction}", f"alert.{key}.title"
+                ) if k in t),
+                f"alert.generic.title_{direction}"
+            )
+            description_key = next(
+                (k for k in (f"alert.{key}.description_{direction}", f"alert.{key}.description") if k in t),
+                'alert.generic.description'
+            )
 
-        # Priority 1: Homocysteine
-        hcy = next((b for b in biomarkers if 'homocyst' in b['name'].lower()), None)
-        if hcy and hcy['status'] in ['critical', 'warning']:
             alerts.append({
-                'title': 'Kritieke Afwijking' if hcy['status'] == 'critical' else 'Verhoogd HomocysteÏne',
-                'icon': '🔴' if hcy['status'] == 'critical' else '🟡',
-                'marker': f"{hcy['name']}: {hcy['value']} {hcy['unit']}",
-                'optimal': f"Optimaal: {hcy['optimal_range']} {hcy['unit']}",
-                'description': 'Verhoogd risico op cardiovasculaire problematiek door methylatie-stoornis'
+                'title': t(title_key, name=marker['name']),
+                'icon': '🔴' if status == 'critical' else '🟡',
+                'marker': f"{marker['name']}: {marker['value']} {marker['unit']}",
+                'optimal': (
+                    t('alert.optimal', range=marker['optimal_range'], unit=marker['unit'])
+                    if marker['optimal_range'] else ''
+                ),
+                'description': t(description_key)
             })
 
-        # Priority 2: Ferritin (inflammation marker)
-        ferr = next((b for b in biomarkers if 'ferritin' in b['name'].lower()), None)
-        if ferr and ferr['status'] in ['critical', 'warning']:
-            alerts.append({
-                'title': 'Verhoogd Inflammatieprofiel',
-                'icon': '🔴' if ferr['status'] == 'critical' else '🟡',
-                'marker': f"{ferr['name']}: {ferr['value']} {ferr['unit']}",
-                'optimal': f"Optimaal: {ferr['optimal_range']} {ferr['unit']}",
-                'description': 'Wijst op actief ontstekingsproces - oorzaak identificeren'
-            })
+        return alerts
 
-        # Priority 3: Vitamin D
-        vitd = next((b for b in biomarkers
-                    if 'vitamine d' in b['name'].lower() or 'vitamin d' in b['name'].lower()),
-                   None)
-        if vitd and vitd['status'] in ['critical', 'warning']:
-            alerts.append({
-                'title': 'Vitamine D Deficiëntie',
-                'icon': '🟡',
-                'marker': f"{vitd['name']}: {vitd['value']} {vitd['unit']}",
-                'optimal': f"Optimaal: {vitd['optimal_range']} {vitd['unit']}",
-                'description': 'Immuunfunctie suboptimaal, receptor mogelijk downgereguleerd'
-            })
+    def _alert_direction(self, marker: Dict) -> str:
+        """
+        'high' or 'low' for an out-of-range marker
+
+        Taken from the evaluated range when it can be parsed, otherwise
+        from the lab flag ('-' means below range).
+        """
+        offset = deviation(evaluated_range(marker), marker['value'])
+        if offset:
+            return 'high' if offset > 0 else 'low'
+        return 'low' if marker.get('flag') == '-' else 'high'
 
-        return alerts[:3]  # Top 3 only
+    def _find_marker(self, biomarkers: List[Dict], key: str) -> Optional[Dict]:
+        """Return the first biomarker resolving to a canonical marker key"""
+        return next((b for b in biomarkers if resolve_marker(b['name']) == key), None)
 
     def generate_priorities(
         self,
         biomarkers: List[Dict],
-        dna_variants: List[Dict]
+        dna_variants: List[Dict],
+        k: int = 5
     ) -> List[Dict]:
-        """Generate priority action areas (stub for now)"""
-        # TODO: Implement in next task
-        return []
+        """
+        Rank all biomarkers and variants by severity-weighted deviation
+
+        Returns the top k findings (see PriorityEngine.top_priorities).
+        """
+        return self.priority_engine.top_priorities(biomarkers, dna_variants, k)
 
     def generate_supplement_protocol(
         self,
         dna_variants: List[Dict],
-        biomarkers: List[Dict]
+        biomarkers: List[Dict],
+        medications: Iterable[str] = (),
+        locale: Optional[str] = None,
+        contraindications: Iterable[str] = ()
     ) -> List[Dict]:
         """
         Generate personalized supplement protocol with timing
 
+        Items that interact with the patient's genotype, medications,
+        contraindications (e.g. 'pregnancy', see consult_notes) or another
+        supplement get an 'interactions' list of messages. Texts are
+        in the given locale (Dutch by default).
+
         Returns schedule with structure:
         {
             'time': '07:30',
@@ -157,153 +263,62 @@ class HELDDashboardGenerator:
             'badge': 'KERN' | 'KRITIEK' | 'ESSENTIEEL' | 'SUPPORT' | 'FASE 2'
         }
         """
-        protocol = []
-
-        # Detect key variants
-        has_pemt_tt = any(
-            v['gene'] == 'PEMT' and v['genotype'] == 'TT'
-            for v in dna_variants
-        )
-        has_bhmt_issues = any(
-            v['gene'] == 'BHMT' and v['severity'] in ['warning', 'critical']
-            for v in dna_variants
-        )
-        has_mthfr = any(v['gene'] == 'MTHFR' for v in dna_variants)
-        has_cbs_upregulation = any(
-            v['gene'] == 'CBS' and 'AA' in v['genotype'] and 'rs234706' in v['rs_number']
-            for v in dna_variants
-        )
-        has_comt_slow = any(
-            v['gene'] == 'COMT' and v['severity'] in ['warning', 'info']
-            for v in dna_variants
+        protocol = schedule_protocol(resolve_protocol(
+            self._protocol_conditions(dna_variants, biomarkers),
+            self._find_marker(biomarkers, 'vitamin_d'),
+            locale
+        ), locale)
+        return self.interaction_checker.annotate(
+            protocol, dna_variants, medications, contraindications
         )
-        has_vdr_variants = any(v['gene'] == 'VDR' for v in dna_variants)
 
-        # Check biomarkers
-        low_vitd = any(
-            ('vitamine d' in b['name'].lower() or 'vitamin d' in b['name'].lower())
-            and b['status'] in ['warning', 'critical']
-            for b in biomarkers
-        )
-        high_homocysteine = any(
-            'homocyst' in b['name'].lower() and b['status'] == 'critical'
-            for b in biomarkers
-        )
-
-        # 1. CHOLINE (if PEMT TT or BHMT issues) - ALWAYS FIRST
-        if has_pemt_tt or has_bhmt_issues:
-            reason_parts = []
-            if has_pemt_tt:
-                reason_parts.append("PEMT TT variant - geen endogene choline productie.")
-            if has_bhmt_issues:
-                reason_parts.append("BHMT downregulatie - shortcut pathway ondersteuning.")
-            reason_parts.append("Essentieel voor homocysteïne conversie.")
-
-            protocol.append({
-                'time': '07:30',
-                'time_label': 'Ochtend (nuchter)',
-                'name': 'Fosfatidylcholine',
-                'dosage': '600-800 mg (Sunflower Lecithin vorm)',
-                'reason': ' '.join(reason_parts),
-                'badge': 'KERN'
-            })
-
-        # 2. VITAMIN D (if low or VDR variants)
-        if low_vitd or has_vdr_variants:
-            vitd_marker = next(
-                (b for b in biomarkers
-                 if 'vitamine d' in b['name'].lower() or 'vitamin d' in b['name'].lower()),
-                None
-            )
-
-            reason_parts = []
-            if vitd_marker:
-                unit = vitd_marker.get('unit', 'ng/ml')
-                reason_parts.append(
-                    f"Huidige waarde {vitd_marker['value']} {unit} → doel 50-60 ng/ml."
-                )
-            reason_parts.append("Vloeibare vorm voor betere absorptie. K2 voor calcium metabolisme.")
-            if has_vdr_variants:
-                reason_parts.append("VDR variants vereisen hogere dosis.")
-
-            protocol.append({
-                'time': '08:00',
-                'time_label': 'Bij Ontbijt',
-                'name': 'Vitamine D3 + K2 (vloeibaar)',
-                'dosage': '4000-5000 IU D3 + 100 mcg K2-MK7',
-                'reason': ' '.join(reason_parts),
-                'badge': 'KRITIEK' if low_vitd else 'ESSENTIEEL'
-            })
-
-        # 3. ZINC (if BHMT or methylation issues)
-        if has_bhmt_issues or has_mthfr or high_homocysteine:
-            protocol.append({
-                'time': '12:30',
-                'time_label': 'Lunch',
-                'name': 'Zink Bisglycinaat',
-                'dosage': '25-30 mg elementair zink',
-                'reason': 'Cruciaal voor: BHMT cofactor, SAMe conversie, methylatie support. Bisglycinaat vorm voor optimale absorptie.',
-                'badge': 'ESSENTIEEL'
-            })
-
-        # 4. MAGNESIUM (if COMT slow or MTHFR)
-        if has_comt_slow or has_mthfr:
-            reason_parts = []
-            if has_comt_slow:
-                reason_parts.append("COMT ondersteuning voor neurotransmitter afbraak.")
-            reason_parts.append("SAMe conversie cofactor. Glycinaat vorm voor maximale absorptie en geen laxerend effect.")
-
-            protocol.append({
-                'time': '15:00',
-                'time_label': 'Middag',
-                'name': 'Magnesium Glycinaat',
-                'dosage': '400 mg elementair magnesium',
-                'reason': ' '.join(reason_parts),
-                'badge': 'SUPPORT'
-            })
+    def _protocol_conditions(
+        self,
+        dna_variants: List[Dict],
+        biomarkers: List[Dict]
+    ) -> int:
+        """Condition bitmask that selects the supplement protocol"""
+        mask = 0
 
-        # 5. METHYLATED B-COMPLEX (ONLY after 6 weeks if CBS upregulation)
-        if has_mthfr:
-            reason_parts = []
-            if has_cbs_upregulation:
-                reason_parts.append(
-                    "⚠️ START PAS NA 6 WEKEN als choline pathway geoptimaliseerd is."
-                )
-            reason_parts.append("MTHFR varianten ondersteuning. Actieve vormen vereist voor optimale methylatie.")
-            if has_cbs_upregulation:
-                reason_parts.append("P5P voor CBS upregulatie.")
-
-            protocol.append({
-                'time': '20:00',
-                'time_label': 'Avond',
-                'name': 'Methylated B-Complex',
-                'dosage': '5-MTHF 400mcg, Methylcobalamin 500mcg, P5P 25mg, R5P 25mg',
-                'reason': ' '.join(reason_parts),
-                'badge': 'FASE 2' if has_cbs_upregulation else 'KERN'
-            })
+        # Detect key variants
+        for v in dna_variants:
+            gene = v['gene']
+            if gene == 'PEMT' and v['genotype'] == 'TT':
+                mask |= supplement_protocol.PEMT_TT
+            elif gene == 'BHMT' and v['severity'] in ['warning', 'critical']:
+                mask |= supplement_protocol.BHMT_ISSUES
+            elif gene == 'MTHFR':
+                mask |= supplement_protocol.MTHFR
+            elif gene == 'CBS' and 'AA' in v['genotype'] and 'rs234706' in v['rs_number']:
+                mask |= supplement_protocol.CBS_UPREGULATION
+            elif gene == 'COMT' and v['severity'] in ['warning', 'info']:
+                mask |= supplement_protocol.COMT_SLOW
+            elif gene == 'VDR':
+                mask |= supplement_protocol.VDR_VARIANTS
 
-        # 6. TMG/BETAINE (if BHMT issues or CBS upregulation)
-        if has_bhmt_issues or has_cbs_upregulation:
-            protocol.append({
-                'time': '22:00',
-                'time_label': 'Voor Bed',
-                'name': 'Trimethylglycine (TMG/Betaine)',
-                'dosage': '500-1000 mg',
-                'reason': 'Direct cofactor voor BHMT "shortcut" pathway. Ondersteunt methylatie zonder CBS upregulatie. Synergistisch met choline.',
-                'badge': 'KERN'
-            })
+        # Check biomarkers
+        for b in biomarkers:
+            key = resolve_marker(b['name'])
+            if key == 'vitamin_d' and b['status'] in ['warning', 'critical']:
+                mask |= supplement_protocol.LOW_VITAMIN_D
+            elif key == 'homocysteine' and b['status'] == 'critical':
+                mask |= supplement_protocol.HIGH_HOMOCYSTEINE
 
-        # Sort by time
-        return sorted(protocol, key=lambda x: x['time'])
+        return mask
 
     def generate_3month_plan(
         self,
         dna_variants: List[Dict],
-        biomarkers: List[Dict]
+        biomarkers: List[Dict],
+        locale: Optional[str] = None,
+        notes: Optional[NotesFacts] = None
     ) -> List[Dict]:
         """
         Generate phased 3-month action plan
 
+        Facts from the consult notes (analyze_notes) add sleep actions and
+        pregnancy/kidney warnings.
+
         Returns phases with structure:
         {
             'phase': 'Fase 1: Fundament Leggen',
@@ -318,135 +333,50 @@ class HELDDashboardGenerator:
             'warnings': ['⚠️ GEEN B-complex...']
         }
         """
-        phases = []
+        return resolve_plan(self._plan_conditions(dna_variants, biomarkers, notes), locale)
+
+    def _plan_conditions(
+        self,
+        dna_variants: List[Dict],
+        biomarkers: List[Dict],
+        notes: Optional[NotesFacts] = None
+    ) -> FrozenSet[str]:
+        """Condition fingerprint that selects the 3-month plan template items"""
+        conditions = set()
 
         # Detect key issues
-        has_high_homocysteine = any(
-            'homocyst' in b['name'].lower() and b['status'] == 'critical'
+        if any(
+            resolve_marker(b['name']) == 'homocysteine' and b['status'] == 'critical'
             for b in biomarkers
-        )
-        has_inflammation = any(
-            ('ferritin' in b['name'].lower() or 'crp' in b['name'].lower())
+        ):
+            conditions.add(action_plan.HIGH_HOMOCYSTEINE)
+        if any(
+            resolve_marker(b['name']) in ('ferritin', 'crp')
             and b['status'] in ['critical', 'warning']
             for b in biomarkers
-        )
-        has_cbs_upregulation = any(
+        ):
+            conditions.add(action_plan.INFLAMMATION)
+        if any(
             v['gene'] == 'CBS' and 'AA' in v['genotype']
             for v in dna_variants
-        )
-        has_comt_variants = any(v['gene'] == 'COMT' for v in dna_variants)
-
-        # PHASE 1: Foundation (Week 1-6)
-        phase1_actions = []
-
-        if has_high_homocysteine:
-            phase1_actions.append({
-                'icon': '🥚',
-                'title': 'Choline Pathway Herstellen (PRIORITEIT)',
-                'description': 'Start fosfatidylcholine 600-800mg + TMG 500mg + zink 25mg. Dit is het fundament - BHMT shortcut moet werken voordat we methylatie verder pushen. Eet dagelijks 2-3 eieren + rund/kip/vis voor extra choline.'
-            })
-
-        phase1_actions.append({
-            'icon': '☀️',
-            'title': 'Vitamine D Normaliseren',
-            'description': 'Vloeibare D3 4000-5000 IU + K2 100mcg dagelijks. Doel: 50-60 ng/ml binnen 6-8 weken. Meet opnieuw bij hertest.'
-        })
-
-        if has_inflammation:
-            phase1_actions.append({
-                'icon': '🧘',
-                'title': 'Inflammatie Onderzoek',
-                'description': 'Ferritine te hoog wijst op onderliggende oorzaak. Zoek: infectie? Chronische inflammatie? Auto-immuun? Werk samen met arts voor verder onderzoek.'
-            })
-
-        if has_comt_variants:
-            phase1_actions.append({
-                'icon': '🧠',
-                'title': 'COMT Support Starten',
-                'description': 'Magnesium glycinaat 400mg vanaf week 1. COMT slow variants + lage SAMe = nog tragere catecholamine afbraak. Magnesium helpt COMT enzym werken.'
-            })
-
-        phase1_warnings = []
-        if has_cbs_upregulation:
-            phase1_warnings.append(
-                "⚠️ LET OP Week 1-6: Nog GEEN methylated B-complex starten! CBS upregulatie + onvoldoende choline = ammonia buildup risico. Wacht tot week 6 voor veilige implementatie."
-            )
-
-        phases.append({
-            'phase': 'Fase 1: Fundament Leggen',
-            'duration': 'Week 1-6',
-            'actions': phase1_actions,
-            'warnings': phase1_warnings
-        })
-
-        # PHASE 2: Optimization (Week 6-8)
-        phase2_actions = [
-            {
-                'icon': '📊',
-                'title': 'Hertest & Evaluatie (Week 6)',
-                'description': 'Meet opnieuw: HomocysteÏne (doel: <10), Ferritine (doel: <200), Vitamine D (doel: 50+), Triglyceriden, Zink, Magnesium RBC. Evalueer of choline pathway werkt voordat je verder gaat.'
-            },
-            {
-                'icon': '💊',
-                'title': 'B-Complex Toevoegen (NA Week 6)',
-                'description': 'ALS homocysteïne gedaald: Start methylated B-complex (5-MTHF 400mcg, methylcobalamin 500mcg, P5P 25mg). Start laag en bouw op. Monitor op overstimulatie. ALS niet gedaald: verhoog eerst choline/betaine dosis.'
-            },
-            {
-                'icon': '🥬',
-                'title': 'Voeding Optimaliseren',
-                'description': 'Verhoog: Groene bladgroenten (folaat), citrus (vitamine C), bonen, quinoa/spinazie/biet (betaine), eieren (choline), vette vis (omega-3). Modereer: Rood vlees (ammonia), alcohol (MAOA remming).'
-            },
-            {
-                'icon': '🔬',
-                'title': 'Antioxidant Support',
-                'description': 'NAC 600mg 2x/dag voor glutathione. Vitamine C 1000mg. NOS3 variants verhogen vrije radicalen - antioxidanten zijn essentieel.'
-            }
-        ]
-
-        phases.append({
-            'phase': 'Fase 2: Methylatie Optimaliseren',
-            'duration': 'Week 6-8',
-            'actions': phase2_actions,
-            'warnings': []
-        })
-
-        # PHASE 3: Fine-tuning (Week 8-12)
-        phase3_actions = [
-            {
-                'icon': '🎯',
-                'title': 'Symptoom Tracking',
-                'description': 'Monitor: energie levels, slaapkwaliteit, mentale helderheid, mood stabiliteit, stress tolerantie. COMT/MAOA/VDR variants beïnvloeden neurotransmitters - let op veranderingen.'
-            },
-            {
-                'icon': '⚖️',
-                'title': 'Dosering Aanpassen',
-                'description': 'Op basis van lab resultaten en symptomen: fine-tune B-complex dosis, overweeg SAMe (100-200mg) als homocysteïne laag genoeg, adjust choline indien nodig.'
-            },
-            {
-                'icon': '🔄',
-                'title': 'Lifestyle Optimalisatie',
-                'description': 'Slaap: 7-8u consistent. Stress: Meditatie/ademwerk (MAOA warrior gene). Beweging: Mix cardio/kracht, niet overtrainen. Hydratatie: 2-3L water.'
-            },
-            {
-                'icon': '📋',
-                'title': 'Week 12: Complete Hertest',
-                'description': 'Full panel: Homocysteïne (doel: <8), Ferritine (doel: 70-90), Vitamine D (doel: 50-60), Triglyceriden, Cholesterol, HbA1c, CRP, Complete bloedbeeld, Zink, Magnesium RBC, B12 actief.'
-            }
-        ]
-
-        phases.append({
-            'phase': 'Fase 3: Fine-tuning & Monitoring',
-            'duration': 'Week 8-12',
-            'actions': phase3_actions,
-            'warnings': []
-        })
-
-        return phases
+        ):
+            conditions.add(action_plan.CBS_UPREGULATION)
+        if any(v['gene'] == 'COMT' for v in dna_variants):
+            conditions.add(action_plan.COMT_VARIANTS)
+
+        # Consult notes
+        if notes is not None:
+            if 'poor_sleep' in notes.symptoms or 'sleep' in notes.goals:
+                conditions.add(action_plan.SLEEP_ISSUES)
+            if notes.contraindications & {'pregnancy', 'breastfeeding'}:
+                conditions.add(action_plan.PREGNANCY)
+            if 'kidney_disease' in notes.contraindications:
+                conditions.add(action_plan.KIDNEY_DISEASE)
+
+        return frozenset(conditions)
 
     def build_html(self, **kwargs) -> str:
-        """Build final HTML from data using HELD branded template"""
-        from template_builder import get_css
-
+        """Build final HTML from data using the brand's compiled theme"""
         patient_name = kwargs['patient_name']
         consult_date = kwargs['consult_date']
         biomarkers = kwargs['biomarkers']
@@ -455,13 +385,15 @@ class HELDDashboardGenerator:
         supplement_protocol = kwargs['supplement_protocol']
         action_plan = kwargs['action_plan']
         welldium_link = kwargs.get('welldium_link', '')
+        theme = self.themes.get(kwargs.get('brand'))
+        t = get_catalog(kwargs.get('locale'))
 
         # Build HTML sections
-        alerts_html = self._build_alerts_html(critical_alerts)
-        biomarkers_html = self._build_biomarkers_html(biomarkers)
-        dna_html = self._build_dna_html(dna_variants)
-        supplements_html = self._build_supplements_html(supplement_protocol)
-        plan_html = self._build_plan_html(action_plan)
+        alerts_html = self._build_alerts_html(critical_alerts, t)
+        biomarkers_html = self._build_biomarkers_html(biomarkers, t)
+        dna_html = self._build_dna_html(dna_variants, t)
+        supplements_html = self._build_supplements_html(supplement_protocol, t)
+        plan_html = self._build_plan_html(action_plan, t)
 
         # Format date
         from datetime import datetime
@@ -472,13 +404,13 @@ class HELDDashboardGenerator:
             formatted_date = consult_date
 
         return f"""<!DOCTYPE html>
-<html lang="nl">
+<html lang="{t('html.lang')}">
 <head>
     <meta charset="UTF-8">
     <meta name="viewport" content="width=device-width, initial-scale=1.0">
-    <title>{patient_name} - Precision Health Dashboard | HELD</title>
+    <title>{patient_name} - Precision Health Dashboard | {theme.name}</title>
     <style>
-        {get_css()}
+        {theme.css}
     </style>
 </head>
 <body>
@@ -487,22 +419,22 @@ class HELDDashboardGenerator:
         <div class="header">
             <div class="header-top">
                 <div>
-                    <div class="logo">HELD</div>
-                    <div class="tagline">Preventieve Gezondheid & Biohacking</div>
+                    <div class="logo">{theme.name}</div>
+                    <div class="tagline">{theme.tagline}</div>
                 </div>
                 <button onclick="window.print()" style="background: white; color: var(--jungle-green); padding: 0.75rem 1.5rem; border-radius: 9999px; border: 2px solid white; font-weight: 700; font-size: 0.95rem; cursor: pointer; transition: all 0.2s; display: flex; align-items: center; gap: 0.5rem; box-shadow: 0 4px 12px rgba(0,0,0,0.15);" onmouseover="this.style.transform='scale(1.05)'" onmouseout="this.style.transform='scale(1)'">
                     <span style="font-size: 1.2rem;">📄</span>
-                    Download als PDF
+                    {t('html.download_pdf')}
                 </button>
             </div>
 
             <div class="patient-info">
                 <div class="info-card">
-                    <div class="info-label">Patiënt</div>
+                    <div class="info-label">{t('html.patient')}</div>
                     <div class="info-value">{patient_name}</div>
                 </div>
                 <div class="info-card">
-                    <div class="info-label">Consult Datum</div>
+                    <div class="info-label">{t('html.consult_date')}</div>
                     <div class="info-value">{formatted_date}</div>
                 </div>
             </div>
@@ -516,8 +448,8 @@ class HELDDashboardGenerator:
         <!-- Blood Biomarkers -->
         <div class="section">
             <div class="section-header">
-                <h2 class="section-title">🩸 Bloedwaarden Analyse</h2>
-                <p class="section-subtitle">Focus op optimale (functionele) ranges</p>
+                <h2 class="section-title">{t('section.biomarkers.title')}</h2>
+                <p class="section-subtitle">{t('section.biomarkers.subtitle')}</p>
             </div>
             <div class="biomarkers-grid">
                 {biomarkers_html}
@@ -527,8 +459,8 @@ class HELDDashboardGenerator:
         <!-- DNA Variants -->
         <div class="section">
             <div class="section-header">
-                <h2 class="section-title">🧬 DNA Methylatie Analyse</h2>
-                <p class="section-subtitle">32-gene panel resultaten met impact assessments</p>
+                <h2 class="section-title">{t('section.dna.title')}</h2>
+                <p class="section-subtitle">{t('section.dna.subtitle')}</p>
             </div>
             <div class="dna-grid">
                 {dna_html}
@@ -538,20 +470,20 @@ class HELDDashboardGenerator:
         <!-- Supplement Protocol -->
         <div class="section">
             <div class="section-header">
-                <h2 class="section-title">💊 Dagelijks Supplementenprotocol</h2>
-                <p class="section-subtitle">Gepersonaliseerd op basis van DNA & biomarkers - timing is cruciaal</p>
+                <h2 class="section-title">{t('section.supplements.title')}</h2>
+                <p class="section-subtitle">{t('section.supplements.subtitle')}</p>
             </div>
             <div class="supplement-grid">
                 {supplements_html}
             </div>
-            {f'<a href="{welldium_link}" target="_blank" style="display: inline-block; margin-top: 1rem; padding: 1rem 2rem; background: var(--american-orange); color: white; text-decoration: none; border-radius: 9999px; font-weight: 700;">Bestel via Welldium →</a>' if welldium_link else ''}
+            {f'<a href="{welldium_link}" target="_blank" style="display: inline-block; margin-top: 1rem; padding: 1rem 2rem; background: var(--american-orange); color: white; text-decoration: none; border-radius: 9999px; font-weight: 700;">{t("html.order_welldium")}</a>' if welldium_link else ''}
         </div>
 
         <!-- 3-Month Action Plan -->
         <div class="section">
             <div class="section-header">
-                <h2 class="section-title">📅 3-Maanden Actieplan</h2>
-                <p class="section-subtitle">Gefaseerde aanpak voor optimale resultaten</p>
+                <h2 class="section-title">{t('section.plan.title')}</h2>
+                <p class="section-subtitle">{t('section.plan.subtitle')}</p>
             </div>
             <div class="timeline">
                 {plan_html}
@@ -560,24 +492,26 @@ class HELDDashboardGenerator:
 
         <!-- Footer -->
         <div class="footer">
-            <div class="footer-text">HELD Preventieve Gezondheid & Biohacking</div>
-            <div class="footer-note">&copy; 2025 HELD. Alle rechten voorbehouden.</div>
+            <div class="footer-text">{f'{theme.name} {theme.tagline}'.strip()}</div>
+            <div class="footer-note">{t('html.rights', brand=theme.name)}</div>
             <div class="disclaimer">
-                <strong>Medische Disclaimer:</strong> Dit rapport is uitsluitend bedoeld voor informatieve doeleinden en vormt geen medisch advies, diagnose of behandeling. Consulteer altijd een bevoegde arts of gezondheidsprofessional voordat u wijzigingen aanbrengt in uw supplementgebruik, medicatie of levensstijl. De informatie in dit rapport is gebaseerd op genetische en biomarker analyses en moet worden geïnterpreteerd in de context van uw individuele gezondheidssituatie. HELD is niet aansprakelijk voor enige gevolgen die voortvloeien uit het gebruik van deze informatie.
+                <strong>{t('html.disclaimer_title')}</strong> {t('html.disclaimer', brand=theme.name)}
             </div>
         </div>
     </div>
 </body>
 </html>"""
 
-    def _build_alerts_html(self, alerts: List[Dict]) -> str:
+    def _build_alerts_html(self, alerts: List[Dict], t: Optional[Catalog] = None) -> str:
         """Build HTML for critical alerts section"""
         if not alerts:
-            return '<div class="alert-card alert-good"><div class="alert-title"><span class="alert-icon">✅</span><span>Geen Kritieke Afwijkingen</span></div><div class="alert-description">Alle kritieke markers binnen acceptabele ranges.</div></div>'
+            t = t or get_catalog()
+            return f'<div class="alert-card alert-good"><div class="alert-title"><span class="alert-icon">✅</span><span>{t("alerts.none.title")}</span></div><div class="alert-description">{t("alerts.none.description")}</div></div>'
 
         html_parts = []
         for alert in alerts:
             alert_class = 'alert-critical' if alert['icon'] == '🔴' else 'alert-warning'
+            optimal = f" ({alert['optimal']})" if alert['optimal'] else ''
             html_parts.append(f"""
             <div class="alert-card {alert_class}">
                 <div class="alert-title">
@@ -585,7 +519,7 @@ class HELDDashboardGenerator:
                     <span>{alert['title']}</span>
                 </div>
                 <div class="alert-description">
-                    <strong>{alert['marker']}</strong> ({alert['optimal']})<br>
+                    <strong>{alert['marker']}</strong>{optimal}<br>
                     {alert['description']}
                 </div>
             </div>
@@ -593,10 +527,11 @@ class HELDDashboardGenerator:
 
         return '\n'.join(html_parts)
 
-    def _build_biomarkers_html(self, biomarkers: List[Dict]) -> str:
+    def _build_biomarkers_html(self, biomarkers: List[Dict], t: Optional[Catalog] = None) -> str:
         """Build HTML for biomarkers grid"""
+        t = t or get_catalog()
         if not biomarkers:
-            return '<p>Geen bloedwaarden beschikbaar.</p>'
+            return f"<p>{t('biomarkers.none')}</p>"
 
         html_parts = []
         for marker in biomarkers:
@@ -610,29 +545,49 @@ class HELDDashboardGenerator:
                 </div>
                 <div class="biomarker-values">
                     <div class="value-row">
-                        <span class="value-label">Waarde:</span>
+                        <span class="value-label">{t('biomarkers.value')}</span>
                         <span class="value-number">{marker['value']} {marker['unit']}</span>
                     </div>
                     <div class="value-row">
-                        <span class="value-label">Optimaal:</span>
+                        <span class="value-label">{t('biomarkers.optimal')}</span>
                         <span class="value-number">{marker['optimal_range']} {marker['unit']}</span>
                     </div>
                 </div>
+                {self._build_biomarker_charts(marker)}
             </div>
             """)
 
         return '\n'.join(html_parts)
 
-    def _build_dna_html(self, dna_variants: List[Dict]) -> str:
+    def _build_biomarker_charts(self, marker: Dict) -> str:
+        """Range bar, plus a sparkline when the marker has a 'history' of earlier values"""
+        status = marker['status']
+        # Drawn against the range that decided the status
+        charts = range_bar(evaluated_range(marker), marker['value'], status)
+        history = marker.get('history')
+        if history:
+            charts += sparkline(list(history) + [marker['value']], status)
+        return charts
+
+    def _build_dna_html(self, dna_variants: List[Dict], t: Optional[Catalog] = None) -> str:
         """Build HTML for DNA variants section"""
+        t = t or get_catalog()
         if not dna_variants:
-            return '<p>Geen DNA data beschikbaar.</p>'
+            return f"<p>{t('dna.none')}</p>"
 
-        html_parts = []
-        for variant in dna_variants:
-            severity_class = variant['severity']
+        def render_card(variant: Dict) -> str:
+            return self._build_dna_card(variant, t)
 
-            html_parts.append(f"""
+        # Raw genotype imports: embed the data and render rows client-side
+        if len(dna_variants) > dna_section.VIRTUALIZE_THRESHOLD:
+            return dna_section.build_virtual_dna_html(dna_variants, render_card, t)
+
+        return '\n'.join(render_card(variant) for variant in dna_variants)
+
+    def _build_dna_card(self, variant: Dict, t: Optional[Catalog] = None) -> str:
+        """Build HTML for one DNA variant card"""
+        t = t or get_catalog()
+        return f"""
             <div class="dna-card">
                 <div class="dna-header">
                     <div class="gene-name">{variant['gene']} {variant['rs_number']}</div>
@@ -640,18 +595,17 @@ class HELDDashboardGenerator:
                 </div>
                 {f"<div style='font-size: 0.9rem; color: var(--jungle-green); font-weight: 600; margin-bottom: 0.5rem;'>[{variant['variant_name']}]</div>" if variant['variant_name'] else ''}
                 <div class="variant-impact">
-                    <div class="impact-title">Impact</div>
+                    <div class="impact-title">{t('dna.impact')}</div>
                     <div class="impact-text">{variant['impact']}</div>
                 </div>
             </div>
-            """)
+            """
 
-        return '\n'.join(html_parts)
-
-    def _build_supplements_html(self, supplements: List[Dict]) -> str:
+    def _build_supplements_html(self, supplements: List[Dict], t: Optional[Catalog] = None) -> str:
         """Build HTML for supplement protocol"""
+        t = t or get_catalog()
         if not supplements:
-            return '<p>Geen supplementenprotocol gegenereerd.</p>'
+            return f"<p>{t('supplements.none')}</p>"
 
         html_parts = []
         for supp in supplements:
@@ -667,17 +621,25 @@ class HELDDashboardGenerator:
                     <div class="supplement-name">{supp['name']}</div>
                     <div class="supplement-dosage">{supp['dosage']}</div>
                     <div class="supplement-reason">{supp['reason']}</div>
+                    {self._build_interactions_html(supp.get('interactions'))}
                 </div>
-                <div class="supplement-badge badge-{badge_class}">{supp['badge']}</div>
+                <div class="supplement-badge badge-{badge_class}">{t('badge.' + badge_class)}</div>
             </div>
             """)
 
         return '\n'.join(html_parts)
 
-    def _build_plan_html(self, phases: List[Dict]) -> str:
+    def _build_interactions_html(self, interactions: Optional[List[str]]) -> str:
+        """Build HTML for a supplement's interaction warnings"""
+        if not interactions:
+            return ''
+        items = ''.join(f'<li>{message}</li>' for message in interactions)
+        return f'<ul class="supplement-interactions">{items}</ul>'
+
+    def _build_plan_html(self, phases: List[Dict], t: Optional[Catalog] = None) -> str:
         """Build HTML for 3-month action plan"""
         if not phases:
-            return '<p>Geen actieplan gegenereerd.</p>'
+            return f"<p>{(t or get_catalog())('plan.none')}</p>"
 
         html_parts = []
         for phase in phases:
@@ -844,6 +806,7 @@ def main():
     print(f"   1. Open het bestand in een browser")
     print(f"   2. Klik op 'Download als PDF' knop")
     print(f"   3. Of gebruik Print -> Save as PDF")
+    print(f"   4. Of exporteer alles in één keer: python3 pdf_export.py outputs/")
     print("=" * 70)
 
     return 0
@@ -0,0 +1,186 @@
+"""
+Concurrent ingestion of patient source files
+
+Blood panels, DNA panels and consult notes are read from the archive by a
+thread pool (the work is I/O-bound, typically on network storage) and
+handed to the parsers in the calling thread as soon as each file arrives.
+"""
+
+import json
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from pathlib import Path
+from typing import Dict, Iterator, Optional, Tuple
+
+from parsers.blood_parser import BloodParser
+from parsers.diagnostics import ParseDiagnostics
+from parsers.dna_parser import DNAParser
+from parsers.thresholds import ThresholdEngine
+
+BLOOD = 'blood'
+DNA = 'dna'
+NOTES = 'notes'
+
+# Filename keywords used by discover_sources (NL and EN exports)
+_KIND_KEYWORDS = (
+    (BLOOD, ('blood', 'bloed', 'labo')),
+    (DNA, ('dna', 'methyl', 'genotype')),
+    (NOTES, ('notes', 'notities', 'consult')),
+)
+
+# Lab exports are UTF-8 (µ, Ï) but older Windows exports use cp1252;
+# latin-1 is the last resort because it decodes any byte sequence
+_ENCODINGS = ('utf-8-sig', 'cp1252')
+
+
+def read_text(path: str) -> str:
+    """Read a source file, trying UTF-8 first and falling back to cp1252"""
+    data = Path(path).read_bytes()
+    for encoding in _ENCODINGS:
+        try:
+            return data.decode(encoding)
+        except UnicodeDecodeError:
+            continue
+    return data.decode('latin-1')
+
+
+def discover_sources(patient_dir: str) -> Dict[str, str]:
+    """
+    Map the files in a patient's archive folder to source kinds
+
+    Returns:
+        {'blood': path, 'dna': path, 'notes': path} for the kinds found
+    """
+    sources = {}
+    for path in sorted(Path(patient_dir).iterdir()):
+        if not path.is_file():
+            continue
+        name = path.name.lower()
+        for kind, keywords in _KIND_KEYWORDS:
+            if kind not in sources and any(k in name for k in keywords):
+                sources[kind] = str(path)
+                break
+    return sources
+
+
+class PatientLoader:
+    """Reads patient source files concurrently and parses them on arrival"""
+
+    def __init__(
+        self,
+        blood_parser: Optional[BloodParser] = None,
+        dna_parser: Optional[DNAParser] = None,
+        workers: int = 8,
+        config_path: str = "config/brand_config.json"
+    ):
+        """
+        Args:
+            blood_parser: Defaults to one with the configured status
+                thresholds, like HELDDashboardGenerator uses
+            dna_parser: Defaults to DNAParser()
+            workers: Concurrent file reads
+            config_path: Brand config for the default blood parser
+        """
+        if blood_parser is None:
+            with open(config_path, 'r', encoding='utf-8') as f:
+                blood_parser = BloodParser(ThresholdEngine.from_config(json.load(f)))
+        self.blood_parser = blood_parser
+        self.dna_parser = dna_parser or DNAParser()
+        self.workers = workers
+
+    def _empty_record(self, patient_id: str) -> Dict:
+        return {
+            'patient_id': patient_id,
+            'biomarkers': [],
+            'dna_variants': [],
+            'consult_notes': '',
+            'diagnostics': {},
+            'errors': {},
+        }
+
+    def _consume(self, record: Dict, kind: str, path: str, text: str):
+        """Parse one source file into the patient record"""
+        if kind == NOTES:
+            record['consult_notes'] = text
+            return
+
+        diagnostics = ParseDiagnostics(path)
+        if kind == BLOOD:
+            record['biomarkers'].extend(self.blood_parser.parse(text, diagnostics))
+        elif kind == DNA:
+            record['dna_variants'].extend(self.dna_parser.parse(text, diagnostics))
+        else:
+            raise ValueError(f"Unknown source kind: {kind}")
+        record['diagnostics'][kind] = diagnostics.summary()
+
+    def load(self, patient_id: str, sources: Dict[str, str]) -> Dict:
+        """
+        Load one patient
+
+        Args:
+            patient_id: Identifier stored in the record
+            sources: {'blood'|'dna'|'notes': path}
+
+        Returns:
+            Record with the structure:
+            {
+                'patient_id': str,
+                'biomarkers': [...],
+                'dna_variants': [...],
+                'consult_notes': str,
+                'diagnostics': {kind: ParseDiagnostics.summary()},
+                'errors': {kind: message} for files that could not be read
+            }
+        """
+        for _, record in self.load_many({patient_id: sources}):
+            return record
+        return self._empty_record(patient_id)
+
+    def load_many(self, patients: Dict[str, Dict[str, str]]) -> Iterator[Tuple[str, Dict]]:
+        """
+        Load many patients through one shared pool
+
+        At most two reads per worker are in flight, so a slow consumer
+        never has the whole batch in memory. A file that cannot be read is
+        recorded in the patient's 'errors' and the batch carries on.
+
+        Yields:
+            (patient_id, record) as soon as all of a patient's files are parsed
+        """
+        records = {patient_id: self._empty_record(patient_id) for patient_id in patients}
+        remaining = {patient_id: len(sources) for patient_id, sources in patients.items()}
+
+        for patient_id, count in remaining.items():
+            if count == 0:
+                yield patient_id, records[patient_id]
+
+        jobs = (
+            (patient_id, kind, path)
+            for patient_id, sources in patients.items()
+            for kind, path in sources.items()
+        )
+        with ThreadPoolExecutor(max_workers=self.workers) as pool:
+            pending = {}
+            while True:
+                while len(pending) < self.workers * 2:
+                    job = next(jobs, None)
+                    if job is None:
+                        break
+                    pending[pool.submit(read_text, job[2])] = job
+
+                if not pending:
+                    break
+
+                done, _ = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    patient_id, kind, path = pending.pop(future)
+                    record = records[patient_id]
+                    try:
+                        text = future.result()
+                    except OSError as e:
+                        record['errors'][kind] = f"{type(e).__name__}: {e}"
+                    else:
+                        self._consume(record, kind, path, text)
+
+                    remaining[patient_id] -= 1
+                    if remaining[patient_id] == 0:
+                        yield patient_id, records.pop(patient_id)
@@ -0,0 +1,239 @@
+"""
+Supplement, genotype and medication interaction checking
+
+Every item a patient is exposed to gets an id:
+
+    supplement:INGREDIENT     e.g. 'supplement:methylfolate'
+    medication:NAME           e.g. 'medication:warfarine'
+    condition:NAME            e.g. 'condition:pregnancy' (see consult_notes)
+    GENE:GENOTYPE             e.g. 'COMT:AA' (see pathways.variant_features)
+    GENE:rsNUMBER:GENOTYPE    e.g. 'CBS:rs234706:AA'
+
+The interaction library is compiled once into a sparse, symmetric conflict
+matrix (one row of neighbours per item). Checking a protocol walks the rows
+of the items that are present, so its cost depends on the patient, not on
+the size of the library.
+"""
+
+from typing import Dict, Iterable, List, NamedTuple, Optional, Sequence, Set
+
+from pathways import variant_features
+from supplement_protocol import INGREDIENTS
+
+# Severity order, most urgent first
+SEVERITIES = ('critical', 'warning', 'info')
+_SEVERITY_RANK = {severity: rank for rank, severity in enumerate(SEVERITIES)}
+
+
+class Interaction(NamedTuple):
+    """A conflict between two items"""
+    first: str
+    second: str
+    severity: str
+    message: str
+
+
+INTERACTIONS: Sequence[Interaction] = (
+    # Genotype x supplement
+    Interaction(
+        'CBS:rs234706:AA', 'supplement:methylfolate', 'warning',
+        "CBS upregulatie: methylfolaat/B12 pas na 6 weken choline-ondersteuning starten (ammonia risico)."
+    ),
+    Interaction(
+        'COMT:AA', 'supplement:same', 'warning',
+        "COMT slow: SAMe laag doseren (100-200 mg) - kans op overstimulatie."
+    ),
+    Interaction(
+        'COMT:AA', 'supplement:methylfolate', 'info',
+        "COMT slow: methylfolaat laag starten en langzaam opbouwen."
+    ),
+    # Medication x supplement
+    Interaction(
+        'medication:methotrexaat', 'supplement:methylfolate', 'critical',
+        "Methylfolaat beïnvloedt de werking van methotrexaat - alleen in overleg met de arts."
+    ),
+    Interaction(
+        'medication:warfarine', 'supplement:vitamin_k2', 'critical',
+        "Vitamine K2 gaat de werking van warfarine tegen - niet starten zonder INR-controle."
+    ),
+    Interaction(
+        'medication:acenocoumarol', 'supplement:vitamin_k2', 'critical',
+        "Vitamine K2 gaat de werking van acenocoumarol tegen - niet starten zonder INR-controle."
+    ),
+    Interaction(
+        'medication:ssri', 'supplement:same', 'critical',
+        "SAMe met een SSRI: risico op serotoninesyndroom."
+    ),
+    Interaction(
+        'medication:levodopa', 'supplement:p5p', 'warning',
+        "Vitamine B6 (P5P) kan levodopa zonder carbidopa minder effectief maken."
+    ),
+    Interaction(
+        'medication:thiazide', 'supplement:vitamin_d3', 'warning',
+        "Thiazidediuretica met vitamine D: risico op hypercalciëmie - calcium controleren."
+    ),
+    Interaction(
+        'medication:levothyroxine', 'supplement:magnesium', 'info',
+        "Levothyroxine minimaal 4 uur gescheiden van magnesium innemen."
+    ),
+    Interaction(
+        'medication:doxycycline', 'supplement:zinc', 'warning',
+        "Zink vermindert de opname van doxycycline - minimaal 2 uur afstand."
+    ),
+    Interaction(
+        'medication:doxycycline', 'supplement:magnesium', 'warning',
+        "Magnesium vermindert de opname van doxycycline - minimaal 2 uur afstand."
+    ),
+    Interaction(
+        'medication:ciprofloxacine', 'supplement:zinc', 'warning',
+        "Zink vermindert de opname van ciprofloxacine - minimaal 2 uur afstand."
+    ),
+    Interaction(
+        'medication:ciprofloxacine', 'supplement:magnesium', 'warning',
+        "Magnesium vermindert de opname van ciprofloxacine - minimaal 2 uur afstand."
+    ),
+    # Condition x supplement
+    Interaction(
+        'condition:kidney_disease', 'supplement:magnesium', 'warning',
+        "Verminderde nierfunctie: magnesium kan stapelen - alleen in overleg met de arts."
+    ),
+    Interaction(
+        'condition:kidney_disease', 'supplement:zinc', 'info',
+        "Verminderde nierfunctie: zinkdosering laten afstemmen door de arts."
+    ),
+    Interaction(
+        'condition:pregnancy', 'supplement:betaine', 'warning',
+        "Zwangerschap: TMG/betaïne is onvoldoende onderzocht - niet zonder overleg gebruiken."
+    ),
+    Interaction(
+        'condition:breastfeeding', 'supplement:betaine', 'warning',
+        "Borstvoeding: TMG/betaïne is onvoldoende onderzocht - niet zonder overleg gebruiken."
+    ),
+    # Supplement x supplement
+    Interaction(
+        'supplement:zinc', 'supplement:copper', 'info',
+        "Zink en koper concurreren om opname - minimaal 2 uur uit elkaar innemen."
+    ),
+)
+
+
+def supplement_id(ingredient: str) -> str:
+    """Item id for a supplement ingredient"""
+    return f"supplement:{ingredient}"
+
+
+def medication_id(name: str) -> str:
+    """Item id for a medication"""
+    return f"medication:{name.lower()}"
+
+
+def condition_id(name: str) -> str:
+    """Item id for a patient condition or contraindication"""
+    return f"condition:{name}"
+
+
+class InteractionChecker:
+    """Checks sets of items against a precompiled sparse conflict matrix"""
+
+    def __init__(self, interactions: Iterable[Interaction] = INTERACTIONS):
+        self.interactions: List[Interaction] = list(interactions)
+
+        # Item id -> row; row -> {neighbour row: interaction index}
+        self._ids: Dict[str, int] = {}
+        self._rows: List[Dict[int, int]] = []
+        for index, interaction in enumerate(self.interactions):
+            if interaction.severity not in _SEVERITY_RANK:
+                raise ValueError(f"Unknown severity: {interaction.severity}")
+            a = self._intern(interaction.first)
+            b = self._intern(interaction.second)
+            self._rows[a][b] = index
+            self._rows[b][a] = index
+
+    def _intern(self, item: str) -> int:
+        row = self._ids.get(item)
+        if row is None:
+            row = self._ids[item] = len(self._rows)
+            self._rows.append({})
+        return row
+
+    def check(self, items: Iterable[str]) -> List[Interaction]:
+        """
+        All interactions between the given items, most severe first
+
+        Items that are not in the library are ignored.
+        """
+        present: Set[int] = {self._ids[i] for i in items if i in self._ids}
+        found = set()
+        for row in present:
+            neighbours = self._rows[row]
+            # Walk whichever side is smaller: the row or the present set
+            if len(neighbours) <= len(present):
+                found.update(index for other, index in neighbours.items() if other in present)
+            else:
+                found.update(neighbours[other] for other in present if other in neighbours)
+
+        return sorted(
+            (self.interactions[index] for index in found),
+            key=lambda i: (_SEVERITY_RANK[i.severity], i.first, i.second)
+        )
+
+    def check_protocol(
+        self,
+        protocol: List[Dict],
+        dna_variants: List[Dict],
+        medications: Iterable[str] = (),
+        conditions: Iterable[str] = ()
+    ) -> List[Interaction]:
+        """Interactions for a generated protocol, a patient's variants, medications and conditions"""
+        items = set(medication_id(m) for m in medications)
+        items.update(condition_id(c) for c in conditions)
+        for supplement in protocol:
+            items.update(supplement_id(i) for i in INGREDIENTS.get(supplement['name'], ()))
+        for variant in dna_variants:
+            items.update(
+                variant_features(variant['gene'], variant['rs_number'], variant['genotype'])
+            )
+        return self.check(items)
+
+    def annotate(
+        self,
+        protocol: List[Dict],
+        dna_variants: List[Dict],
+        medications: Iterable[str] = (),
+        conditions: Iterable[str] = ()
+    ) -> List[Dict]:
+        """
+        Add an 'interactions' list of messages to affected protocol items
+
+        Items without interactions are left untouched. Returns the protocol.
+        """
+        interactions = self.check_protocol(protocol, dna_variants, medications, conditions)
+        if not interactions:
+            return protocol
+
+        by_item: Dict[str, List[Interaction]] = {}
+        for interaction in interactions:
+            by_item.setdefault(interaction.first, []).append(interaction)
+            by_item.setdefault(interaction.second, []).append(interaction)
+
+        for supplement in protocol:
+            messages: List[str] = []
+            for ingredient in INGREDIENTS.get(supplement['name'], ()):
+                for interaction in by_item.get(supplement_id(ingredient), ()):
+                    if interaction.message not in messages:
+                        messages.append(interaction.message)
+            if messages:
+                supplement['interactions'] = messages
+
+        return protocol
+
+
+_default_checker: Optional[InteractionChecker] = None
+
+
+def default_checker() -> InteractionChecker:
+    """Checker for the built-in interaction library, compiled on first use"""
+    global _default_checker
+    if _default_checker is None:
+        _default_checker = InteractionChecker()
+    return _default_checker
@@ -0,0 +1,95 @@
+"""
+Compiled message catalogs for dashboard text
+
+Catalogs live in locales/<locale>.json as flat {message id: template}
+maps, with Dutch (nl) as the source language. Each catalog is loaded and
+compiled once per process: templates without placeholders become plain
+strings, the others are split into literal/field parts up front, so
+rendering a message is a dict lookup plus a join. Messages missing from a
+catalog fall back to Dutch.
+"""
+
+import json
+from functools import lru_cache
+from pathlib import Path
+from string import Formatter
+from typing import Dict, List, Optional, Tuple, Union
+
+LOCALES_DIR = Path(__file__).resolve().parent / 'locales'
+
+DEFAULT_LOCALE = 'nl'
+
+# Literal text, then the field that follows it (None after the last literal)
+_Parts = Tuple[Tuple[str, Optional[str], str], ...]
+
+
+def _compile(template: str) -> Union[str, _Parts]:
+    """Split a template into (literal, field, format spec) parts once"""
+    parts = tuple(
+        (literal, field, spec or '')
+        for literal, field, spec, _ in Formatter().parse(template)
+    )
+    if all(field is None for _, field, _ in parts):
+        return template.replace('{{', '{').replace('}}', '}')
+    return parts
+
+
+def _render(parts: _Parts, params: Dict) -> str:
+    return ''.join(
+        literal if field is None else literal + format(params[field], spec)
+        for literal, field, spec in parts
+    )
+
+
+class Catalog:
+    """Compiled messages for one locale"""
+
+    def __init__(self, locale: str, messages: Dict[str, str], fallback: Optional['Catalog'] = None):
+        self.locale = locale
+        self._messages: Dict[str, Union[str, _Parts]] = {}
+        if fallback is not None:
+            self._messages.update(fallback._messages)
+        self._messages.update((key, _compile(text)) for key, text in messages.items())
+
+    def __call__(self, key: str, **params) -> str:
+        """
+        Render a message
+
+        Raises:
+            KeyError: If no catalog defines the message id
+        """
+        message = self._messages[key]
+        if isinstance(message, str):
+            return message
+        return _render(message, params)
+
+    def __contains__(self, key: str) -> bool:
+        return key in self._messages
+
+
+def available_locales() -> List[str]:
+    """Locales with a catalog file"""
+    return sorted(path.stem for path in LOCALES_DIR.glob('*.json'))
+
+
+def _load(locale: str) -> Dict[str, str]:
+    path = LOCALES_DIR / f"{locale}.json"
+    if not path.exists():
+        raise ValueError(
+            f"Unknown locale: {locale} (choose from {', '.join(available_locales())})"
+        )
+    with open(path, 'r', encoding='utf-8') as f:
+        return json.load(f)
+
+
+@lru_cache(maxsize=None)
+def _compiled(locale: str) -> Catalog:
+    if locale == DEFAULT_LOCALE:
+        return Catalog(locale, _load(locale))
+    return Catalog(locale, _load(locale), fallback=_compiled(DEFAULT_LOCALE))
+
+
+def get_catalog(locale: Optional[str] = None) -> Catalog:
+    """Compiled catalog for a locale (Dutch for None), loaded once per process"""
+    return _compiled(locale or DEFAULT_LOCALE)
+
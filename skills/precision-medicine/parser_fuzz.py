@@ -0,0 +1,188 @@
+"""
+Fuzzing and worst-case throughput harness for the line parsers
+
+Blood and DNA panels are pasted by users, so every line the parsers see is
+untrusted. This harness generates adversarial lines (very long lines,
+unicode-heavy text, pathological digit/unit/rs runs, mutated real lines),
+feeds them to BloodParser._parse_line and DNAParser._parse_line one at a
+time, and records per-line timings. A run fails when a parser raises or
+when any single line takes longer than the time budget, so a malformed
+upload can never stall a worker.
+
+    python parser_fuzz.py --count 2000 --max-length 50000
+"""
+
+import random
+import sys
+import time
+from typing import Callable, Dict, Iterator, List, NamedTuple, Optional, Sequence
+
+from parsers.blood_parser import BloodParser
+from parsers.dna_parser import DNAParser
+
+# Seconds any single line may take, at MAX_LINE_LENGTH characters
+LINE_BUDGET = 0.05
+
+MAX_LINE_LENGTH = 20000
+
+BLOOD_SEEDS = (
+    'HomocysteÏne + 18.0 Opt:<8.0 V.N 3.7-13.9 µmol/L',
+    'Ferritine + 307 50-120:opt. 22-322:VN µg/L',
+    'Vitamine D - 39.7 45-60:opt. 30-100:VN ng/ml',
+)
+
+DNA_SEEDS = (
+    'MTHFR rs1801133 AG [C677T] Up to 40% reduction in gene function',
+    'CBS rs234706 AA Thought to be the strongest indicator of increased (up to 10x) CBS activity',
+    'PEMT rs7946 TT Potential for reduced choline synthesis',
+)
+
+# Fragments the parser patterns react to; repeated, they stress backtracking
+_FRAGMENTS = (
+    '1', '1.', '-', '1.2-3', ':opt', ':op', ':VN', 'Opt:', 'V.N ', 'VN', 'µ', 'μ', 'mg/dL',
+    'mol', '%', 'rs', 'rs1', 'rs1 ', 'AG', '[', '[A1', ']', '+', ' ', '\t', 'Ï',
+)
+
+# Unicode that lab exports and copy-paste produce (and some they should not)
+_UNICODE = (
+    'Ï', 'ë', 'é', 'µ', 'μ', 'ß', '́', '​', ' ', '‮', '﻿',
+    '½', '²', '٣', '①', '𝟙', '🧬', '中', '\x00', '\x7f',
+)
+
+
+class FuzzReport(NamedTuple):
+    """Outcome of fuzzing one parser"""
+    lines: int
+    total_seconds: float
+    worst_seconds: float
+    worst_line: str
+    errors: List[str]  # 'ExceptionType: line prefix' per line that raised
+
+    @property
+    def lines_per_second(self) -> float:
+        return self.lines / self.total_seconds if self.total_seconds else float('inf')
+
+
+def _repeat(fragment: str, length: int) -> str:
+    return (fragment * (length // max(1, len(fragment)) + 1))[:length]
+
+
+def _mutate(rng: random.Random, line: str, max_length: int) -> str:
+    """Random insertions, deletions and duplications of a real line"""
+    chars = list(line)
+    for _ in range(rng.randint(1, 8)):
+        position = rng.randint(0, len(chars))
+        operation = rng.random()
+        if operation < 0.4:
+            chars[position:position] = rng.choice(_FRAGMENTS + _UNICODE)
+        elif operation < 0.7 and chars:
+            del chars[min(position, len(chars) - 1)]
+        else:
+            chars[position:position] = chars[position:position + rng.randint(1, 12)] * rng.randint(2, 50)
+    return ''.join(chars)[:max_length]
+
+
+def adversarial_lines(
+    seeds: Sequence[str] = BLOOD_SEEDS + DNA_SEEDS,
+    count: int = 500,
+    max_length: int = MAX_LINE_LENGTH,
+    seed: int = 0
+) -> Iterator[str]:
+    """
+    Deterministic adversarial lines
+
+    Every run starts with the known worst cases at max_length (one long run
+    per fragment, and the valid lines with a run appended), then produces
+    count random lines: long repeated fragments, unicode noise, and
+    mutated valid lines.
+    """
+    for fragment in _FRAGMENTS:
+        yield _repeat(fragment, max_length)
+        for line in seeds:
+            yield (line + ' ' + _repeat(fragment, max_length))[:max_length]
+            yield (_repeat(fragment, max_length - len(line) - 1) + ' ' + line)
+
+    rng = random.Random(seed)
+    for _ in range(count):
+        kind = rng.random()
+        length = rng.randint(1, max_length)
+        if kind < 0.3:
+            pieces = rng.sample(_FRAGMENTS, rng.randint(1, 4))
+            yield _repeat(''.join(pieces), length)
+        elif kind < 0.5:
+            yield ''.join(rng.choice(_UNICODE + _FRAGMENTS) for _ in range(min(length, 2000)))
+        elif kind < 0.8:
+            yield _mutate(rng, rng.choice(seeds), max_length)
+        else:
+            line = rng.choice(seeds)
+            yield (line + _repeat(rng.choice(_FRAGMENTS), length))[:max_length]
+
+
+def fuzz(parse_line: Callable[[str], Optional[Dict]], lines: Iterator[str]) -> FuzzReport:
+    """Parse every line, timing each one and collecting exceptions"""
+    count = 0
+    total = worst = 0.0
+    worst_line = ''
+    errors: List[str] = []
+    clock = time.perf_counter
+
+    for line in lines:
+        started = clock()
+        try:
+            parse_line(line)
+        except Exception as e:
+            errors.append(f"{type(e).__name__}: {line[:80]!r}")
+        elapsed = clock() - started
+
+        count += 1
+        total += elapsed
+        if elapsed > worst:
+            worst, worst_line = elapsed, line
+
+    return FuzzReport(count, total, worst, worst_line, errors)
+
+
+def fuzz_parsers(
+    count: int = 500,
+    max_length: int = MAX_LINE_LENGTH,
+    seed: int = 0
+) -> Dict[str, FuzzReport]:
+    """Fuzz the blood and DNA line parsers with the same adversarial corpus"""
+    blood_parser = BloodParser()
+    dna_parser = DNAParser()
+    return {
+        'blood': fuzz(blood_parser._parse_line, adversarial_lines(count=count, max_length=max_length, seed=seed)),
+        'dna': fuzz(dna_parser._parse_line, adversarial_lines(count=count, max_length=max_length, seed=seed)),
+    }
+
+
+def main(argv: List[str]) -> int:
+    """CLI: fuzz both parsers and fail on errors or a line over budget"""
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Fuzz the blood and DNA line parsers")
+    parser.add_argument('--count', type=int, default=500, help="Random lines per parser (default: 500)")
+    parser.add_argument('--max-length', type=int, default=MAX_LINE_LENGTH,
+                        help=f"Longest generated line (default: {MAX_LINE_LENGTH})")
+    parser.add_argument('--seed', type=int, default=0, help="Random seed (default: 0)")
+    parser.add_argument('--budget', type=float, default=LINE_BUDGET,
+                        help=f"Seconds allowed per line (default: {LINE_BUDGET})")
+    args = parser.parse_args(argv)
+
+    failed = False
+    for name, report in fuzz_parsers(args.count, args.max_length, args.seed).items():
+        print(
+            f"{name}: {report.lines} regels, {report.lines_per_second:,.0f} regels/s, "
+            f"slechtste regel {report.worst_seconds * 1000:.2f} ms ({len(report.worst_line)} tekens)"
+        )
+        for error in report.errors[:10]:
+            print(f"    {error}")
+        if report.errors or report.worst_seconds > args.budget:
+            failed = True
+            print(f"    ✗ {len(report.errors)} fouten, budget {args.budget * 1000:.0f} ms per regel")
+
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main(sys.argv[1:]))
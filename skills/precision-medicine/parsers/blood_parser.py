@@ -1,17 +1,44 @@
 """Blood test data parser with focus on optimal ranges"""
 import re
-from typing import Dict, List, Optional
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from parsers.diagnostics import (
+    HEADER, MALFORMED, NO_VALUE, TOO_FEW_FIELDS, ParseDiagnostics
+)
+from parsers.line_reader import has_digit, iter_lines
+from parsers.markers import resolve_marker
+from parsers.thresholds import ThresholdEngine
+from parsers.units import normalize_biomarker
+
+# Range and unit patterns. Lines are untrusted pasted text, so every pattern
+# must run in linear time: the runs before ':opt'/':VN' and the trailing unit
+# only start where the previous character cannot extend them, instead of
+# being re-scanned from every position of a long run.
+_OPT = re.compile(r'Opt:([<>]?[\d\.\-]+)')
+_OPT_SUFFIX = re.compile(r'(?<![\d\.\-<>])([<>]?[\d\.\-]+):opt\.?')
+_VN = re.compile(r'V\.?N\.?\s+([\d\.\-]+)')
+_VN_SUFFIX = re.compile(r'(?<![\d\.\-])([\d\.\-]+):VN')
+_UNIT = re.compile(r'(?<![µμumcg/dLIUngpmol%])([µμumcg/dLIUngpmol%]+)$')
 
 
 class BloodParser:
     """Parser for blood test results focusing on optimal (functional) ranges"""
 
-    def parse(self, text: str) -> List[Dict]:
+    def __init__(self, thresholds: Optional[ThresholdEngine] = None):
+        """
+        Args:
+            thresholds: Configured status thresholds; markers without one
+                fall back to the range printed by the lab
+        """
+        self.thresholds = thresholds
+
+    def parse(self, text: str, diagnostics: Optional[ParseDiagnostics] = None) -> List[Dict]:
         """
         Parse blood test results text into structured biomarker data
 
         Args:
             text: Raw blood test results (one biomarker per line)
+            diagnostics: Optional collector for rejected lines
 
         Returns:
             List of biomarker dictionaries with structure:
@@ -19,29 +46,69 @@ class BloodParser:
                 'name': str,
                 'value': float,
                 'unit': str,
-                'optimal_range': str,
+                'optimal_range': str (as printed by the lab),
+                'configured_range': str (config range that decided the status, or ''),
                 'normal_range': str,
                 'status': str ('critical'|'warning'|'optimal'),
-                'flag': str ('+'|'-'|'')
+                'flag': str ('+'|'-'|''),
+                'raw_value': float (value as printed by the lab),
+                'raw_unit': str (unit as printed by the lab)
             }
+
+            Values and ranges are converted to the marker's canonical unit
+            (see parsers.units) when the lab used a different one.
         """
         if not text or not text.strip():
             return []
 
-        biomarkers = []
         lines = text.strip().split('\n')
+        # Line numbers refer to the original text, before leading blank lines were stripped
+        first_line = text[:len(text) - len(text.lstrip())].count('\n') + 1
+
+        return self._parse_lines(enumerate(lines, first_line), diagnostics)
+
+    def parse_file(self, path: str, diagnostics: Optional[ParseDiagnostics] = None) -> List[Dict]:
+        """
+        Parse a blood test results file without loading it as one string
 
-        for line in lines:
-            if not line.strip() or line.startswith('Naam'):
+        Lines without a digit cannot hold a value and are skipped before
+        decoding (see parsers.line_reader).
+        """
+        return self._parse_lines(iter_lines(path, has_digit, diagnostics), diagnostics)
+
+    def _parse_lines(
+        self,
+        lines: Iterable[Tuple[int, str]],
+        diagnostics: Optional[ParseDiagnostics]
+    ) -> List[Dict]:
+        """Parse numbered lines, skipping blanks and header lines"""
+        biomarkers = []
+
+        for line_number, line in lines:
+            if not line.strip():
+                continue
+            if diagnostics is not None:
+                diagnostics.lines += 1
+            if line.startswith('Naam'):
+                if diagnostics is not None:
+                    diagnostics.reject(line_number, HEADER, line)
                 continue
 
-            biomarker = self._parse_line(line)
+            biomarker = self._parse_line(line, diagnostics, line_number)
             if biomarker:
                 biomarkers.append(biomarker)
 
+        if diagnostics is not None:
+            diagnostics.parsed += len(biomarkers)
+
         return biomarkers
 
-    def _parse_line(self, line: str) -> Optional[Dict]:
+    def _parse_line(
+        self,
+        line: str,
+        diagnostics: Optional[ParseDiagnostics] = None,
+        line_number: int = 0
+    ) -> Optional[Dict]:
         """Parse a single biomarker line"""
         # Pattern: Name [+/-] Value Opt:range V.N:range unit
         # Example: HomocysteÏne + 18.0 Opt:<8.0 V.N 3.7-13.9 µmol/L
@@ -49,8 +116,11 @@ class BloodParser:
         # Extract components
         parts = line.split()
         if len(parts) < 3:
+            if diagnostics is not None:
+                diagnostics.reject(line_number, TOO_FEW_FIELDS, line)
             return None
 
+        reason = NO_VALUE
         try:
             # Find the flag (+/-)
             flag = ''
@@ -80,50 +150,71 @@ class BloodParser:
 
             # Value
             value = float(parts[value_idx])
+            reason = MALFORMED
 
             # Extract optimal range (priority)
             optimal_range = ''
             normal_range = ''
-            opt_match = re.search(r'Opt:([<>]?[\d\.\-]+)', line)
+            opt_match = _OPT.search(line)
             if opt_match:
                 optimal_range = opt_match.group(1)
             else:
                 # Try alternative format: "45-60:opt."
-                alt_match = re.search(r'([\d\.\-]+):opt\.?', line)
+                alt_match = _OPT_SUFFIX.search(line)
                 if alt_match:
                     optimal_range = alt_match.group(1)
 
             # Extract normal range
-            vn_match = re.search(r'V\.?N\.?\s+([\d\.\-]+)', line)
+            vn_match = _VN.search(line)
             if vn_match:
                 normal_range = vn_match.group(1)
             else:
                 # Try alternative: "22-322:VN"
-                alt_match = re.search(r'([\d\.\-]+):VN', line)
+                alt_match = _VN_SUFFIX.search(line)
                 if alt_match:
                     normal_range = alt_match.group(1)
 
             # Extract unit (last token, typically contains letters or special chars)
             unit = ''
-            unit_match = re.search(r'([µmg/dLIUngpmol%]+)$', line)
+            unit_match = _UNIT.search(line)
             if unit_match:
                 unit = unit_match.group(1)
 
-            # Determine status
-            status = self.determine_status(value, optimal_range, flag)
-
-            return {
+            biomarker = normalize_biomarker({
                 'name': name.strip(),
                 'value': value,
                 'unit': unit,
                 'optimal_range': optimal_range,
                 'normal_range': normal_range,
-                'status': status,
-                'flag': flag
-            }
+                'status': '',
+                'flag': flag,
+                'configured_range': ''
+            })
+
+            # Determine status: configured thresholds first, printed range as fallback
+            status = None
+            if self.thresholds is not None:
+                status = self.thresholds.evaluate(
+                    biomarker['name'], biomarker['value'], biomarker['unit']
+                )
+                if status is not None:
+                    # Keep the lab's range; the evaluated one goes alongside
+                    configured = self.thresholds.optimal_range(resolve_marker(biomarker['name']))
+                    biomarker['configured_range'] = configured
+                    if not biomarker['optimal_range']:
+                        biomarker['optimal_range'] = configured
+            if status is None:
+                status = self.determine_status(
+                    biomarker['value'], biomarker['optimal_range'], flag
+                )
+            biomarker['status'] = status
+
+            return biomarker
 
-        except (ValueError, IndexError) as e:
+        except (ValueError, IndexError):
             # Malformed line, skip it
+            if diagnostics is not None:
+                diagnostics.reject(line_number, reason, line)
             return None
 
     def determine_status(self, value: float, optimal_range: str, flag: str) -> str:
@@ -0,0 +1,69 @@
+"""Line-level diagnostics for rejected parser input"""
+from collections import Counter
+from typing import Dict, List, NamedTuple
+
+# Reason codes
+HEADER = 'header'
+TOO_FEW_FIELDS = 'too_few_fields'
+NO_VALUE = 'no_value'
+MALFORMED = 'malformed'
+NO_GENE = 'no_gene'
+NO_RS_NUMBER = 'no_rs_number'
+NO_GENOTYPE = 'no_genotype'
+PREFILTERED = 'prefiltered'
+
+# Reasons that do not indicate lost data
+_NOT_DATA = frozenset((HEADER, PREFILTERED))
+
+SNIPPET_LENGTH = 80
+
+
+class RejectedLine(NamedTuple):
+    """One input line a parser could not turn into a record"""
+    line_number: int
+    reason: str
+    snippet: str
+
+
+class ParseDiagnostics:
+    """
+    Collects rejected lines and per-reason counters for one input file
+
+    Parsers only touch the collector when one is passed in, so parsing
+    without diagnostics costs nothing extra.
+    """
+
+    def __init__(self, source: str = '', max_samples: int = 100):
+        """
+        Args:
+            source: Name of the file or input being parsed (for reports)
+            max_samples: Keep at most this many rejected lines verbatim;
+                counters keep counting past the limit
+        """
+        self.source = source
+        self.max_samples = max_samples
+        self.lines = 0
+        self.parsed = 0
+        self.reasons: Counter = Counter()
+        self.rejected: List[RejectedLine] = []
+
+    def reject(self, line_number: int, reason: str, line: str):
+        """Record a line that produced no record"""
+        self.reasons[reason] += 1
+        if len(self.rejected) < self.max_samples:
+            self.rejected.append(RejectedLine(line_number, reason, line[:SNIPPET_LENGTH]))
+
+    @property
+    def skipped(self) -> int:
+        """Lines rejected for a reason that may mean lost data"""
+        return sum(n for reason, n in self.reasons.items() if reason not in _NOT_DATA)
+
+    def summary(self) -> Dict:
+        """Per-file counters, suitable for logging or JSON"""
+        return {
+            'source': self.source,
+            'lines': self.lines,
+            'parsed': self.parsed,
+            'skipped': self.skipped,
+            'reasons': dict(self.reasons),
+        }
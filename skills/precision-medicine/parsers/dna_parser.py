@@ -1,17 +1,64 @@
 """DNA methylation data parser"""
 import re
-from typing import Dict, List, Optional
+from functools import lru_cache
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from parsers.diagnostics import NO_GENE, NO_GENOTYPE, NO_RS_NUMBER, ParseDiagnostics
+from parsers.line_reader import has_rs_number, iter_lines
+
+# Severity by genotype for specific SNPs: (gene, rs_number) -> {genotype: severity}
+SNP_RULES: Dict[Tuple[str, str], Dict[str, str]] = {
+    # CBS upregulation
+    ('CBS', 'rs234706'): {'AA': 'critical'},
+}
+
+# Severity by genotype for any SNP of a gene: gene -> {genotype: severity}
+GENE_RULES: Dict[str, Dict[str, str]] = {
+    # No endogenous choline production
+    'PEMT': {'TT': 'warning'},
+    # Heterozygous variants
+    'MTHFR': {'AG': 'warning', 'GT': 'warning', 'CT': 'warning'},
+    # BHMT downregulation
+    'BHMT': {'TT': 'warning', 'CC': 'warning'},
+}
+
+
+# Longer lines are parsed without caching, so pasted junk cannot fill the
+# cache with huge keys
+MAX_CACHED_LINE_LENGTH = 1024
 
 
 class DNAParser:
     """Parser for DNA methylation test results (32-gene panel)"""
 
-    def parse(self, text: str) -> List[Dict]:
+    def __init__(self, cache_size: int = 4096):
+        """
+        Args:
+            cache_size: Distinct raw lines whose parse result is kept (LRU).
+                Panel lines repeat verbatim across patients, so a repeated
+                line skips regex parsing and severity evaluation. 0 disables
+                the cache.
+        """
+        self._parse_cached = lru_cache(maxsize=cache_size)(self._parse_variant)
+
+    def cache_info(self):
+        """Line cache statistics (hits, misses, maxsize, currsize)"""
+        return self._parse_cached.cache_info()
+
+    @property
+    def cache_hit_rate(self) -> float:
+        """Fraction of cacheable lines served from the line cache"""
+        info = self._parse_cached.cache_info()
+        lookups = info.hits + info.misses
+        return info.hits / lookups if lookups else 0.0
+
+    def parse(self, text: str, diagnostics: Optional[ParseDiagnostics] = None) -> List[Dict]:
         """
         Parse DNA methylation results into structured variant data
 
         Args:
             text: Raw DNA test results (one variant per line)
+            diagnostics: Optional collector for rejected lines
 
         Returns:
             List of variant dictionaries with structure:
@@ -27,71 +74,115 @@ class DNAParser:
         if not text or not text.strip():
             return []
 
-        variants = []
         lines = text.strip().split('\n')
+        # Line numbers refer to the original text, before leading blank lines were stripped
+        first_line = text[:len(text) - len(text.lstrip())].count('\n') + 1
+
+        return self._parse_lines(enumerate(lines, first_line), diagnostics)
+
+    def parse_file(self, path: str, diagnostics: Optional[ParseDiagnostics] = None) -> List[Dict]:
+        """
+        Parse a DNA results file without loading it as one string
+
+        Lines without an rs number are skipped before decoding
+        (see parsers.line_reader).
+        """
+        return self._parse_lines(iter_lines(path, has_rs_number, diagnostics), diagnostics)
+
+    def _parse_lines(
+        self,
+        lines: Iterable[Tuple[int, str]],
+        diagnostics: Optional[ParseDiagnostics]
+    ) -> List[Dict]:
+        """Parse numbered lines, skipping blanks"""
+        variants = []
 
-        for line in lines:
+        for line_number, line in lines:
             if not line.strip():
                 continue
+            if diagnostics is not None:
+                diagnostics.lines += 1
 
-            variant = self._parse_line(line)
+            variant = self._parse_line(line, diagnostics, line_number)
             if variant:
                 variants.append(variant)
 
+        if diagnostics is not None:
+            diagnostics.parsed += len(variants)
+
         return variants
 
-    def _parse_line(self, line: str) -> Optional[Dict]:
-        """Parse a single DNA variant line"""
+    def _parse_line(
+        self,
+        line: str,
+        diagnostics: Optional[ParseDiagnostics] = None,
+        line_number: int = 0
+    ) -> Optional[Dict]:
+        """Parse a single DNA variant line, from the line cache when possible"""
+        if len(line) <= MAX_CACHED_LINE_LENGTH:
+            variant, reason = self._parse_cached(line)
+        else:
+            variant, reason = self._parse_variant(line)
+
+        if variant is None:
+            if diagnostics is not None:
+                diagnostics.reject(line_number, reason, line)
+            return None
+        # The cached dict is shared; callers get their own
+        return dict(variant)
+
+    def _parse_variant(self, line: str) -> Tuple[Optional[Dict], Optional[str]]:
+        """
+        Parse one raw line
+
+        Returns:
+            (variant, None), or (None, rejection reason)
+        """
         # Pattern: GENE rs##### GENOTYPE [VARIANT] Impact description
         # Example: MTHFR rs1801133 AG [C677T] Up to 40% reduction...
 
-        try:
-            # Extract gene (uppercase letters at start)
-            gene_match = re.match(r'^([A-Z]+)', line)
-            if not gene_match:
-                return None
-            gene = gene_match.group(1)
-
-            # Extract rs number
-            rs_match = re.search(r'(rs\d+)', line)
-            if not rs_match:
-                return None
-            rs_number = rs_match.group(1)
-
-            # Extract genotype (2-letter combination after rs number)
-            genotype_match = re.search(r'rs\d+\s+([AGTC]{2})', line)
-            if not genotype_match:
-                return None
-            genotype = genotype_match.group(1)
-
-            # Extract variant name from brackets (optional)
-            variant_name = ''
-            variant_match = re.search(r'\[([A-Z]\d+[A-Z])\]', line)
-            if variant_match:
-                variant_name = variant_match.group(1)
-
-            # Extract impact (everything after genotype/variant)
-            if variant_name:
-                impact_start = line.find(']') + 1
-            else:
-                impact_start = line.find(genotype) + len(genotype)
-            impact = line[impact_start:].strip()
-
-            # Determine severity
-            severity = self.determine_severity(gene, rs_number, genotype, impact)
-
-            return {
-                'gene': gene,
-                'rs_number': rs_number,
-                'genotype': genotype,
-                'variant_name': variant_name,
-                'impact': impact,
-                'severity': severity
-            }
-
-        except Exception as e:
-            # Malformed line, skip it
-            return None
+        # Extract gene (uppercase letters at start)
+        gene_match = re.match(r'^([A-Z]+)', line)
+        if not gene_match:
+            return None, NO_GENE
+        gene = gene_match.group(1)
+
+        # Extract rs number
+        rs_match = re.search(r'(rs\d+)', line)
+        if not rs_match:
+            return None, NO_RS_NUMBER
+        rs_number = rs_match.group(1)
+
+        # Extract genotype (2-letter combination after rs number)
+        genotype_match = re.search(r'rs\d+\s+([AGTC]{2})', line)
+        if not genotype_match:
+            return None, NO_GENOTYPE
+        genotype = genotype_match.group(1)
+
+        # Extract variant name from brackets (optional)
+        variant_name = ''
+        variant_match = re.search(r'\[([A-Z]\d+[A-Z])\]', line)
+        if variant_match:
+            variant_name = variant_match.group(1)
+
+        # Extract impact (everything after genotype/variant)
+        if variant_name:
+            impact_start = line.find(']') + 1
+        else:
+            impact_start = line.find(genotype) + len(genotype)
+        impact = line[impact_start:].strip()
+
+        # Determine severity
+        severity = self.determine_severity(gene, rs_number, genotype, impact)
+
+        return {
+            'gene': gene,
+            'rs_number': rs_number,
+            'genotype': genotype,
+            'variant_name': variant_name,
+            'impact': impact,
+            'severity': severity
+        }, None
 
     def determine_severity(
         self,
@@ -105,21 +196,13 @@ class DNAParser:
 
         Returns: 'critical' | 'warning' | 'info'
         """
-        # CRITICAL: CBS upregulation (rs234706 AA)
-        if gene == 'CBS' and rs_number == 'rs234706' and genotype == 'AA':
-            return 'critical'
-
-        # WARNING: PEMT TT (no endogenous choline production)
-        if gene == 'PEMT' and genotype == 'TT':
-            return 'warning'
-
-        # WARNING: MTHFR heterozygous variants
-        if gene == 'MTHFR' and genotype in ['AG', 'GT', 'CT']:
-            return 'warning'
-
-        # WARNING: BHMT downregulation
-        if gene == 'BHMT' and genotype in ['TT', 'CC']:
-            return 'warning'
+        # Genotype rules: SNP-specific first, then gene-wide
+        severity = SNP_RULES.get((gene, rs_number), {}).get(genotype)
+        if severity:
+            return severity
+        severity = GENE_RULES.get(gene, {}).get(genotype)
+        if severity:
+            return severity
 
         # Severity based on impact text
         impact_lower = impact.lower()
@@ -0,0 +1,149 @@
+"""
+Batch genotype classification for raw genotype arrays
+
+Raw imports (hundreds of thousands of SNPs) are classified against the
+same genotype rules as DNAParser.determine_severity, but without a Python
+call per variant: each SNP is packed into one byte (rule slot of its gene
+in the high nibble, 4-bit genotype code in the low nibble) and mapped to a
+severity code with a single bytes.translate. No-calls get the reserved
+code NO_CALL and always classify as 'info'.
+"""
+from array import array
+from typing import Dict, List, Sequence
+
+from parsers.dna_parser import GENE_RULES, SNP_RULES
+
+# Two bits per allele; a genotype code is (first << 2) | second
+ALLELE_CODES: Dict[str, int] = {'A': 0, 'C': 1, 'G': 2, 'T': 3}
+
+# Reserved code for no-calls and indel calls in raw genotype exports
+NO_CALL = 0xFF
+NO_CALLS = frozenset({'--', '00', 'DD', 'DI', 'ID', 'II'})
+
+_VALID_CODES = bytes(range(16)) + bytes([NO_CALL])
+# NO_CALL packs as code 0; its severity is masked to 'info' afterwards
+_PACK_TABLE = bytes(range(255)) + b'\x00'
+_NO_CALL_MASK = b'\xff' * 255 + b'\x00'
+
+# Severity codes returned by classify()
+SEVERITIES = ('info', 'warning', 'critical')
+_SEVERITY_CODES = {severity: code for code, severity in enumerate(SEVERITIES)}
+
+
+def encode_genotype(genotype: str) -> int:
+    """Encode a two-letter genotype ('AG') as a 4-bit code, or NO_CALL ('--')"""
+    if genotype in NO_CALLS:
+        return NO_CALL
+    return (ALLELE_CODES[genotype[0]] << 2) | ALLELE_CODES[genotype[1]]
+
+
+def encode_genotypes(genotypes: Sequence[str]) -> bytes:
+    """Encode many two-letter genotypes into one code per byte"""
+    table = {g: encode_genotype(g) for g in set(genotypes)}
+    return bytes(table[g] for g in genotypes)
+
+
+class GenotypeClassifier:
+    """Classifies arrays of (gene id, rs id, genotype code) in one pass"""
+
+    def __init__(self, genes: Sequence[str]):
+        """
+        Compile the rule tables for a gene vocabulary
+
+        Args:
+            genes: Gene names; a gene id is an index into this list
+                (at most 256 genes, so ids fit in one byte)
+        """
+        if len(genes) > 256:
+            raise ValueError(f"At most 256 genes supported, got {len(genes)}")
+        self.genes: List[str] = list(genes)
+        self.gene_ids: Dict[str, int] = {gene: i for i, gene in enumerate(self.genes)}
+
+        # Slot 0 means "no gene-wide rule"; ruled genes get slots 1..15
+        ruled = [gene for gene in GENE_RULES if gene in self.gene_ids]
+        if len(ruled) > 15:
+            raise ValueError("At most 15 genes with gene-wide rules supported")
+
+        slots = bytearray(256)
+        packed = bytearray(256)
+        for slot, gene in enumerate(ruled, 1):
+            slots[self.gene_ids[gene]] = slot
+            for genotype, severity in GENE_RULES[gene].items():
+                packed[(slot << 4) | encode_genotype(genotype)] = _SEVERITY_CODES[severity]
+
+        # gene id -> slot, then (slot << 4 | genotype) -> severity
+        self._slot_table = bytes(slots)
+        self._severity_table = bytes(packed)
+
+        # SNP-specific rules are few; they are applied as overrides
+        self._snp_rules = [
+            (self.gene_ids[gene], int(rs_number[2:]), {
+                encode_genotype(genotype): _SEVERITY_CODES[severity]
+                for genotype, severity in rules.items()
+            })
+            for (gene, rs_number), rules in SNP_RULES.items()
+            if gene in self.gene_ids
+        ]
+
+    def classify(self, gene_ids: bytes, rs_ids: 'array', genotypes: bytes) -> bytes:
+        """
+        Classify every SNP
+
+        Args:
+            gene_ids: One gene id byte per SNP
+            rs_ids: array('I') of rs numbers without the 'rs' prefix
+            genotypes: One genotype code byte per SNP (see encode_genotypes);
+                each code is < 16 or NO_CALL
+
+        Returns:
+            One severity code byte per SNP (index into SEVERITIES)
+        """
+        count = len(genotypes)
+        if len(gene_ids) != count or len(rs_ids) != count:
+            raise ValueError("gene_ids, rs_ids and genotypes must have equal length")
+        if not count:
+            return b''
+
+        genotypes = bytes(genotypes)
+        invalid = genotypes.translate(None, _VALID_CODES)
+        if invalid:
+            raise ValueError(
+                f"Genotype codes must be < 16 or NO_CALL ({NO_CALL}), got {invalid[0]}"
+            )
+
+        # Slots are < 16 and codes < 16, so slot * 16 + code never carries
+        # into the neighbouring byte: big-integer arithmetic packs all bytes
+        slots = bytes(gene_ids).translate(self._slot_table)
+        combined = (
+            int.from_bytes(slots, 'big') * 16
+            + int.from_bytes(genotypes.translate(_PACK_TABLE), 'big')
+        ).to_bytes(count, 'big')
+        result = bytearray(combined.translate(self._severity_table))
+
+        if self._snp_rules:
+            self._apply_snp_rules(result, gene_ids, rs_ids, genotypes)
+
+        if NO_CALL in genotypes:
+            # Bytewise AND: no-calls become 0 ('info'), everything else is kept
+            masked = int.from_bytes(result, 'big') & int.from_bytes(
+                genotypes.translate(_NO_CALL_MASK), 'big'
+            )
+            return masked.to_bytes(count, 'big')
+
+        return bytes(result)
+
+    def _apply_snp_rules(self, result: bytearray, gene_ids, rs_ids, genotypes):
+        """Override severities for SNP-specific rules, found by byte search"""
+        packed_ids = array('I', rs_ids).tobytes()
+        width = array('I').itemsize
+
+        for gene_id, rs_id, rules in self._snp_rules:
+            needle = array('I', [rs_id]).tobytes()
+            position = packed_ids.find(needle)
+            while position != -1:
+                if position % width == 0:
+                    index = position // width
+                    severity = rules.get(genotypes[index])
+                    if gene_ids[index] == gene_id and severity is not None:
+                        result[index] = severity
+                position = packed_ids.find(needle, position + 1)
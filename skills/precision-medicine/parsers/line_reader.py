@@ -0,0 +1,95 @@
+"""Memory-mapped line reader for large lab files"""
+import codecs
+import mmap
+import re
+from pathlib import Path
+from typing import Callable, Iterator, Optional, Tuple
+
+from parsers.diagnostics import PREFILTERED, ParseDiagnostics
+
+_DIGIT = re.compile(rb'\d')
+
+# ASCII-compatible encodings tried per line; a newline byte is always '\n'
+_LINE_ENCODINGS = ('utf-8', 'cp1252')
+
+
+def has_digit(line: bytes) -> bool:
+    """Prefilter for blood panels: every biomarker line carries a value"""
+    return _DIGIT.search(line) is not None
+
+
+def has_rs_number(line: bytes) -> bool:
+    """Prefilter for DNA panels: every variant line carries an rs number"""
+    return b'rs' in line
+
+
+def _decode(line: bytes) -> str:
+    for encoding in _LINE_ENCODINGS:
+        try:
+            return line.decode(encoding)
+        except UnicodeDecodeError:
+            continue
+    return line.decode('latin-1')
+
+
+def _iter_utf16(path: Path) -> Iterator[Tuple[int, str]]:
+    """UTF-16 has no single-byte newline, so decode it the ordinary way"""
+    text = path.read_bytes().decode('utf-16')
+    for line_number, line in enumerate(text.split('\n'), 1):
+        yield line_number, line.rstrip('\r')
+
+
+def iter_lines(
+    path: str,
+    prefilter: Optional[Callable[[bytes], bool]] = None,
+    diagnostics: Optional[ParseDiagnostics] = None
+) -> Iterator[Tuple[int, str]]:
+    """
+    Yield (line_number, line) from a file without decoding all of it
+
+    The file is memory-mapped and split on newline bytes. Only non-blank
+    lines that pass the byte-level prefilter are decoded (UTF-8, falling
+    back to cp1252 per line). Lines rejected by the prefilter are recorded
+    in diagnostics as 'prefiltered' when a collector is given.
+
+    Args:
+        path: File to read
+        prefilter: Cheap test on the raw line bytes, e.g. has_digit
+        diagnostics: Optional collector for prefiltered lines
+    """
+    source = Path(path)
+    if source.stat().st_size == 0:
+        return
+
+    with open(source, 'rb') as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as data:
+        head = data[:4]
+        if head.startswith((codecs.BOM_UTF16_LE, codecs.BOM_UTF16_BE)):
+            yield from _iter_utf16(source)
+            return
+
+        start = len(codecs.BOM_UTF8) if head.startswith(codecs.BOM_UTF8) else 0
+        size = len(data)
+        line_number = 0
+
+        while start < size:
+            end = data.find(b'\n', start)
+            if end == -1:
+                end = size
+            line = data[start:end]
+            start = end + 1
+            line_number += 1
+
+            if line.endswith(b'\r'):
+                line = line[:-1]
+            if not line.strip():
+                continue
+
+            if prefilter is not None and not prefilter(line):
+                if diagnostics is not None:
+                    diagnostics.lines += 1
+                    diagnostics.reject(
+                        line_number, PREFILTERED, line[:160].decode('utf-8', 'replace')
+                    )
+                continue
+
+            yield line_number, _decode(line)
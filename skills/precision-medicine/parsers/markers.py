@@ -0,0 +1,132 @@
+"""Multilingual biomarker name resolution"""
+import re
+import unicodedata
+from functools import lru_cache
+from typing import Dict, Optional, Tuple
+
+# Canonical marker key -> aliases (NL/EN/DE/FR and common lab abbreviations)
+MARKER_ALIASES: Dict[str, Tuple[str, ...]] = {
+    'homocysteine': (
+        'homocysteïne', 'homocystein', 'homocystéine', 'hcy',
+    ),
+    'ferritin': (
+        'ferritine', 'ferritin', 'serum ferritin',
+    ),
+    'vitamin_d': (
+        'vitamine d', 'vitamin d', 'vit d', 'vitamine d3', 'vitamin d3',
+        '25 oh vitamine d', '25 oh vitamin d', '25 oh d', '25 hydroxyvitamine d',
+        '25 hydroxyvitamin d', '25 hydroxy vitamin d', 'calcidiol', 'calcifediol',
+    ),
+    'vitamin_b12': (
+        'vitamine b12', 'vitamin b12', 'vit b12', 'cobalamine', 'cobalamin',
+        'holotranscobalamine', 'holotranscobalamin', 'actief b12', 'active b12',
+    ),
+    'folate': (
+        'foliumzuur', 'folaat', 'folate', 'folic acid', 'folsäure', 'acide folique',
+        'folsaure',
+    ),
+    'crp': (
+        'crp', 'hs crp', 'c reactive protein', 'c reactief proteine', 'c reactief proteïne',
+        'c reaktives protein', 'proteine c reactive',
+    ),
+    'zinc': (
+        'zink', 'zinc', 'zn',
+    ),
+    'magnesium': (
+        'magnesium', 'magnésium', 'mg rbc', 'magnesium rbc',
+    ),
+    'triglycerides': (
+        'triglyceriden', 'triglyceride', 'triglycerides', 'triglyzeride', 'triglycérides',
+    ),
+    'cholesterol': (
+        'cholesterol', 'totaal cholesterol', 'total cholesterol', 'cholestérol',
+        'gesamtcholesterin', 'cholesterin',
+    ),
+    'hba1c': (
+        'hba1c', 'hb a1c', 'geglyceerd hemoglobine', 'glycated hemoglobin',
+        'hémoglobine glyquée',
+    ),
+    'tsh': (
+        'tsh', 'thyreotropine', 'thyrotropin',
+    ),
+}
+
+_END = object()
+_NON_ALNUM = re.compile(r'[^a-z0-9]+')
+
+
+def fold(text: str) -> str:
+    """
+    Fold a marker name for matching
+
+    Strips accents (HomocysteÏne -> homocysteine), case-folds and reduces
+    every run of punctuation or whitespace to a single space.
+    """
+    decomposed = unicodedata.normalize('NFKD', text)
+    stripped = ''.join(ch for ch in decomposed if not unicodedata.combining(ch))
+    return _NON_ALNUM.sub(' ', stripped.casefold()).strip()
+
+
+class MarkerResolver:
+    """Resolves lab marker names to canonical keys via a prebuilt trie"""
+
+    def __init__(self, aliases: Dict[str, Tuple[str, ...]] = MARKER_ALIASES, cache_size: int = 4096):
+        """Compile the alias dictionary into a character trie"""
+        self._trie: Dict = {}
+        for key, names in aliases.items():
+            for alias in (key.replace('_', ' '),) + tuple(names):
+                node = self._trie
+                for ch in fold(alias):
+                    node = node.setdefault(ch, {})
+                node[_END] = key
+
+        self.resolve = lru_cache(maxsize=cache_size)(self._resolve)
+
+    def cache_info(self):
+        """Name cache statistics (hits, misses, maxsize, currsize)"""
+        return self.resolve.cache_info()
+
+    @property
+    def cache_hit_rate(self) -> float:
+        """Fraction of lookups served from the name cache"""
+        info = self.resolve.cache_info()
+        lookups = info.hits + info.misses
+        return info.hits / lookups if lookups else 0.0
+
+    def _resolve(self, name: str) -> Optional[str]:
+        """
+        Return the canonical key for a marker name, or None
+
+        Aliases match whole words anywhere in the name ("Ferritin (serum)",
+        "25-OH Vit D"); the longest matching alias wins.
+        """
+        text = fold(name)
+        length = len(text)
+        best = None
+        best_length = 0
+
+        for start in range(length):
+            if start and text[start - 1] != ' ':
+                continue
+
+            node = self._trie
+            position = start
+            while position < length:
+                node = node.get(text[position])
+                if node is None:
+                    break
+                position += 1
+                if _END in node and (position == length or text[position] == ' '):
+                    if position - start > best_length:
+                        best = node[_END]
+                        best_length = position - start
+
+        return best
+
+
+_default_resolver = MarkerResolver()
+
+
+def resolve_marker(name: str) -> Optional[str]:
+    """Resolve a marker name with the shared default resolver"""
+    return _default_resolver.resolve(name)
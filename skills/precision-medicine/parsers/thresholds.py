@@ -0,0 +1,107 @@
+"""Config-driven biomarker status thresholds"""
+from typing import Dict, Optional, Tuple
+
+from parsers.markers import resolve_marker
+from parsers.units import canonical_unit
+
+INF = float('inf')
+
+# Margins used when config gives no normal bound for a side; these match
+# BloodParser.determine_status for printed ranges
+_CRITICAL_MARGIN_HIGH = {'range': 1.2, 'max_only': 1.5}
+_CRITICAL_MARGIN_LOW = {'range': 0.8, 'min_only': 0.7}
+
+
+def evaluated_range(biomarker: Dict) -> str:
+    """
+    Range a biomarker's status was evaluated against
+
+    The configured range when thresholds decided the status, otherwise the
+    range printed by the lab.
+    """
+    return biomarker.get('configured_range') or biomarker['optimal_range']
+
+
+class ThresholdEngine:
+    """
+    Status lookup compiled from config status_thresholds.biomarkers
+
+    Every marker compiles to (unit, optimal_min, optimal_max, critical_low,
+    critical_high). A value inside the optimal bounds is 'optimal', beyond
+    a critical bound 'critical', and anything in between 'warning'.
+    """
+
+    def __init__(self, biomarker_thresholds: Dict[str, Dict]):
+        """Compile per-marker config entries into lookup tuples"""
+        self._rules: Dict[str, Tuple[str, float, float, float, float]] = {
+            key: self._compile(entry) for key, entry in biomarker_thresholds.items()
+        }
+
+    @classmethod
+    def from_config(cls, config: Dict) -> 'ThresholdEngine':
+        """Build the engine from a loaded brand config"""
+        return cls(config.get('status_thresholds', {}).get('biomarkers', {}))
+
+    @staticmethod
+    def _compile(entry: Dict) -> Tuple[str, float, float, float, float]:
+        optimal_min = entry.get('optimal_min')
+        optimal_max = entry.get('optimal_max')
+        shape = 'range' if optimal_min is not None and optimal_max is not None else None
+
+        if 'normal_min' in entry:
+            critical_low = entry['normal_min']
+        elif optimal_min is not None:
+            critical_low = optimal_min * _CRITICAL_MARGIN_LOW[shape or 'min_only']
+        else:
+            critical_low = -INF
+
+        if 'normal_max' in entry:
+            critical_high = entry['normal_max']
+        elif optimal_max is not None:
+            critical_high = optimal_max * _CRITICAL_MARGIN_HIGH[shape or 'max_only']
+        else:
+            critical_high = INF
+
+        return (
+            canonical_unit(entry.get('unit', '')),
+            -INF if optimal_min is None else optimal_min,
+            INF if optimal_max is None else optimal_max,
+            critical_low,
+            critical_high,
+        )
+
+    def __contains__(self, key: str) -> bool:
+        return key in self._rules
+
+    def optimal_range(self, key: str) -> str:
+        """Format a marker's optimal bounds like a lab range ('<8.0', '45-60')"""
+        # str() keeps the precision written in the config (8.0 stays '8.0')
+        _, optimal_min, optimal_max, _, _ = self._rules[key]
+        if optimal_min == -INF:
+            return f"<{optimal_max}"
+        if optimal_max == INF:
+            return f">{optimal_min}"
+        return f"{optimal_min}-{optimal_max}"
+
+    def evaluate(self, name: str, value: float, unit: str) -> Optional[str]:
+        """
+        Status for a biomarker value in canonical units
+
+        Returns:
+            'critical' | 'warning' | 'optimal', or None when the marker has
+            no configured thresholds or the unit does not match
+        """
+        key = resolve_marker(name)
+        rule = self._rules.get(key) if key else None
+        if rule is None:
+            return None
+
+        rule_unit, optimal_min, optimal_max, critical_low, critical_high = rule
+        if rule_unit and unit != rule_unit:
+            return None
+
+        if optimal_min <= value <= optimal_max:
+            return 'optimal'
+        if value < critical_low or value > critical_high:
+            return 'critical'
+        return 'warning'
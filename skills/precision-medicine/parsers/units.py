@@ -0,0 +1,142 @@
+"""Biomarker unit registry and conversion to canonical units"""
+import re
+import sys
+from typing import Dict, Optional, Tuple
+
+from parsers.markers import resolve_marker
+
+# Canonical unit per analyte (matches status_thresholds in brand_config.json)
+CANONICAL_UNITS: Dict[str, str] = {
+    'homocysteine': 'µmol/L',
+    'ferritin': 'µg/L',
+    'vitamin_d': 'ng/ml',
+}
+
+# Spelling variants labs use, keyed by lowercase form
+_UNIT_ALIASES: Dict[str, str] = {
+    'µmol/l': 'µmol/L',
+    'μmol/l': 'µmol/L',  # Greek mu instead of micro sign
+    'umol/l': 'µmol/L',
+    'nmol/l': 'nmol/L',
+    'pmol/l': 'pmol/L',
+    'mmol/l': 'mmol/L',
+    'µg/l': 'µg/L',
+    'μg/l': 'µg/L',
+    'ug/l': 'µg/L',
+    'mcg/l': 'µg/L',
+    'ng/ml': 'ng/ml',
+    'mg/l': 'mg/L',
+    'mg/dl': 'mg/dL',
+    'g/l': 'g/L',
+    'g/dl': 'g/dL',
+    'iu/l': 'IU/L',
+    'u/l': 'U/L',
+    '%': '%',
+}
+
+# Factors that hold for any analyte: (from, to) -> multiply by
+_GENERIC_FACTORS: Dict[Tuple[str, str], float] = {
+    ('ng/ml', 'µg/L'): 1.0,
+    ('µg/L', 'ng/ml'): 1.0,
+    ('mg/dL', 'mg/L'): 10.0,
+    ('mg/L', 'mg/dL'): 0.1,
+    ('g/dL', 'g/L'): 10.0,
+    ('g/L', 'g/dL'): 0.1,
+}
+
+# Analyte-specific factors to the canonical unit (molar mass dependent)
+_ANALYTE_FACTORS: Dict[Tuple[str, str], float] = {
+    ('homocysteine', 'mg/L'): 1000 / 135.18,
+    ('homocysteine', 'mg/dL'): 10000 / 135.18,
+    ('ferritin', 'pmol/L'): 1 / 2.247,
+    ('vitamin_d', 'nmol/L'): 1 / 2.496,
+}
+
+_NUMBER = re.compile(r'\d+(?:\.\d+)?')
+
+
+def _build_factor_table() -> Dict[Tuple[str, str], float]:
+    """Precompute (analyte, unit) -> factor for every known combination"""
+    table = {}
+    for analyte, canonical in CANONICAL_UNITS.items():
+        table[(analyte, canonical)] = 1.0
+        for (source, target), factor in _GENERIC_FACTORS.items():
+            if target == canonical:
+                table[(analyte, source)] = factor
+    table.update(_ANALYTE_FACTORS)
+    return table
+
+
+_FACTORS = _build_factor_table()
+_canonical_cache: Dict[str, str] = {}
+
+
+def canonical_unit(unit: str) -> str:
+    """
+    Return the registered spelling of a unit, interned
+
+    Unknown units are returned stripped (and interned) so equal spellings
+    still share one string object.
+    """
+    cached = _canonical_cache.get(unit)
+    if cached is None:
+        key = unit.strip()
+        cached = sys.intern(_UNIT_ALIASES.get(key.lower(), key))
+        _canonical_cache[unit] = cached
+    return cached
+
+
+def analyte_key(name: str) -> Optional[str]:
+    """Map a biomarker name to its analyte key, if it has a canonical unit"""
+    analyte = resolve_marker(name)
+    return analyte if analyte in CANONICAL_UNITS else None
+
+
+def conversion_factor(analyte: Optional[str], unit: str) -> Optional[float]:
+    """
+    Factor that converts a value in unit to the analyte's canonical unit
+
+    Returns:
+        The factor, or None when the analyte has no canonical unit or the
+        conversion is unknown
+    """
+    if analyte is None:
+        return None
+    return _FACTORS.get((analyte, canonical_unit(unit)))
+
+
+def _format_number(value: float) -> str:
+    """Format a converted number without float noise"""
+    text = f"{value:.2f}".rstrip('0').rstrip('.')
+    return text or '0'
+
+
+def convert_range(range_text: str, factor: float) -> str:
+    """Scale every number in a range string such as '<8.0' or '45-60'"""
+    if not range_text or factor == 1.0:
+        return range_text
+    return _NUMBER.sub(lambda m: _format_number(float(m.group(0)) * factor), range_text)
+
+
+def normalize_biomarker(biomarker: Dict) -> Dict:
+    """
+    Convert a parsed biomarker to its canonical unit in place
+
+    The value and both ranges are scaled together, so status stays valid.
+    The lab's original value and unit are kept in 'raw_value'/'raw_unit'.
+    """
+    unit = canonical_unit(biomarker['unit']) if biomarker['unit'] else ''
+    biomarker['raw_value'] = biomarker['value']
+    biomarker['raw_unit'] = biomarker['unit']
+    biomarker['unit'] = unit
+
+    analyte = analyte_key(biomarker['name'])
+    factor = conversion_factor(analyte, unit) if unit else None
+    if factor is None or factor == 1.0:
+        return biomarker
+
+    biomarker['value'] = round(biomarker['value'] * factor, 2)
+    biomarker['unit'] = CANONICAL_UNITS[analyte]
+    biomarker['optimal_range'] = convert_range(biomarker['optimal_range'], factor)
+    biomarker['normal_range'] = convert_range(biomarker['normal_range'], factor)
+    return biomarker
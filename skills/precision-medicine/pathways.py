@@ -0,0 +1,109 @@
+"""
+Polygenic pathway scoring
+
+Each patient is reduced to a set of features:
+
+    GENE:GENOTYPE             e.g. 'PEMT:TT'
+    GENE:rsNUMBER:GENOTYPE    e.g. 'CBS:rs234706:AA'
+    marker:status             e.g. 'homocysteine:critical'
+
+Pathway weights come from the config ``pathway_weights`` section and are
+compiled into a feature x pathway matrix. A score is the sum of the rows of
+the active features. Patients with the same feature set share one score, so
+re-scoring a cohort costs one matrix product per distinct feature set.
+"""
+
+from typing import Dict, FrozenSet, Iterable, List, Sequence, Tuple
+
+from cohort import Cohort
+from parsers.markers import resolve_marker
+
+PATHWAYS = ('methylation', 'transsulfuration', 'choline', 'catecholamine')
+
+
+def variant_features(gene: str, rs_number: str, genotype: str) -> Tuple[str, str]:
+    """Gene-wide and SNP-specific feature names for one variant"""
+    return f"{gene}:{genotype}", f"{gene}:{rs_number}:{genotype}"
+
+
+def patient_features(biomarkers: List[Dict], dna_variants: List[Dict]) -> FrozenSet[str]:
+    """Feature set for one patient's parser output"""
+    features = set()
+    for variant in dna_variants:
+        features.update(
+            variant_features(variant['gene'], variant['rs_number'], variant['genotype'])
+        )
+    for marker in biomarkers:
+        key = resolve_marker(marker['name'])
+        if key:
+            features.add(f"{key}:{marker['status']}")
+    return frozenset(features)
+
+
+class PathwayScorer:
+    """Scores feature sets against a precompiled feature x pathway matrix"""
+
+    def __init__(self, weights: Dict[str, Dict[str, float]]):
+        """
+        Args:
+            weights: {pathway: {feature: weight}}
+        """
+        self.pathways: Tuple[str, ...] = tuple(weights)
+        width = len(self.pathways)
+
+        # One row of pathway weights per feature; features not listed score 0
+        rows: Dict[str, List[float]] = {}
+        for column, pathway in enumerate(self.pathways):
+            for feature, weight in weights[pathway].items():
+                rows.setdefault(feature, [0.0] * width)[column] = float(weight)
+        self._rows: Dict[str, Tuple[float, ...]] = {f: tuple(r) for f, r in rows.items()}
+        self._zero = (0.0,) * width
+
+    @classmethod
+    def from_config(cls, config: Dict) -> 'PathwayScorer':
+        """Build the scorer from a loaded brand config"""
+        weights = config.get('pathway_weights', {})
+        return cls({pathway: weights.get(pathway, {}) for pathway in PATHWAYS})
+
+    def _score_features(self, features: Iterable[str]) -> Tuple[float, ...]:
+        rows = [self._rows[f] for f in features if f in self._rows]
+        if not rows:
+            return self._zero
+        return tuple(sum(column) for column in zip(*rows))
+
+    def score(self, biomarkers: List[Dict], dna_variants: List[Dict]) -> Dict[str, float]:
+        """Pathway scores for one patient"""
+        totals = self._score_features(patient_features(biomarkers, dna_variants))
+        return dict(zip(self.pathways, totals))
+
+    def score_many(self, feature_sets: Sequence[FrozenSet[str]]) -> List[Tuple[float, ...]]:
+        """
+        Score many feature sets, computing each distinct set once
+
+        Returns:
+            One tuple of pathway scores per input, in self.pathways order
+        """
+        cache: Dict[FrozenSet[str], Tuple[float, ...]] = {}
+        scores = []
+        for features in feature_sets:
+            totals = cache.get(features)
+            if totals is None:
+                totals = cache[features] = self._score_features(features)
+            scores.append(totals)
+        return scores
+
+    def score_cohort(self, cohort: Cohort) -> List[Tuple[float, ...]]:
+        """Pathway scores for every patient row in a cohort"""
+        # Only features with a weight matter, which keeps the distinct sets few
+        features: List[set] = [set() for _ in range(len(cohort))]
+        weighted = self._rows
+        for patient, gene, rs_number, genotype in cohort.variant_rows():
+            for feature in variant_features(gene, rs_number, genotype):
+                if feature in weighted:
+                    features[patient].add(feature)
+        for patient, marker, status in cohort.biomarker_rows():
+            feature = f"{marker}:{status}"
+            if feature in weighted:
+                features[patient].add(feature)
+
+        return self.score_many([frozenset(f) for f in features])
@@ -0,0 +1,187 @@
+#!/usr/bin/env python3
+"""
+Parallel PDF export for generated HELD dashboards
+
+Renders saved dashboards headless with WeasyPrint (optional dependency,
+``pip install weasyprint``) in a bounded process pool. Each worker parses
+the HELD stylesheet once and reuses it for every document it renders, and
+PDFs are written straight into the output store.
+"""
+
+import os
+import re
+import sys
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+from pathlib import Path
+from typing import Dict, Iterator, List, Optional, Tuple
+
+from template_builder import get_css
+
+# Matches the timestamp save_dashboard puts in every filename
+_DASHBOARD_DATE = re.compile(r'_HELD_Dashboard_(\d{8})\.html$')
+
+# Per-process state, filled in by _init_worker
+_worker_state: Dict = {}
+
+
+def _load_weasyprint():
+    """Import WeasyPrint lazily so the generator itself stays stdlib-only"""
+    try:
+        import weasyprint
+    except ImportError as e:
+        raise ImportError(
+            "PDF export requires WeasyPrint: pip install weasyprint"
+        ) from e
+    return weasyprint
+
+
+def select_dashboards(input_dir: str, month: Optional[str] = None) -> List[Path]:
+    """
+    Find saved dashboards, optionally limited to one month
+
+    Args:
+        input_dir: Directory with saved dashboards (usually outputs/)
+        month: 'YYYY-MM' to only export dashboards saved in that month
+
+    Returns:
+        Sorted list of dashboard paths
+    """
+    prefix = month.replace('-', '') if month else None
+    selected = []
+    for path in sorted(Path(input_dir).glob('*.html')):
+        if prefix:
+            match = _DASHBOARD_DATE.search(path.name)
+            if not match or not match.group(1).startswith(prefix):
+                continue
+        selected.append(path)
+    return selected
+
+
+def strip_inline_css(html: str, css: str) -> str:
+    """Remove the embedded HELD stylesheet so the cached one can be used"""
+    return html.replace(css, '', 1)
+
+
+def _init_worker():
+    """Parse the HELD stylesheet once per worker process"""
+    weasyprint = _load_weasyprint()
+    css = get_css()
+    _worker_state['weasyprint'] = weasyprint
+    _worker_state['css'] = css
+    _worker_state['stylesheet'] = weasyprint.CSS(string=css)
+
+
+def _render(html_path: str, pdf_path: str) -> Tuple[str, int]:
+    """Render one dashboard to PDF inside a worker"""
+    if not _worker_state:
+        _init_worker()
+
+    weasyprint = _worker_state['weasyprint']
+    source = Path(html_path)
+    html = source.read_text(encoding='utf-8')
+
+    # Only skip the inline <style> when it is exactly our stylesheet
+    stylesheets = []
+    if _worker_state['css'] in html:
+        html = strip_inline_css(html, _worker_state['css'])
+        stylesheets.append(_worker_state['stylesheet'])
+
+    document = weasyprint.HTML(string=html, base_url=str(source.parent))
+    with open(pdf_path, 'wb') as f:
+        document.write_pdf(f, stylesheets=stylesheets)
+
+    return pdf_path, Path(pdf_path).stat().st_size
+
+
+def export_pdfs(
+    dashboards: List[Path],
+    output_dir: str,
+    workers: Optional[int] = None
+) -> Iterator[Tuple[str, int, Optional[str]]]:
+    """
+    Render dashboards to PDF in a bounded process pool
+
+    At most two documents per worker are in flight, so memory stays flat
+    no matter how many dashboards are exported. A document that fails to
+    render is reported and the rest of the batch carries on.
+
+    Args:
+        dashboards: HTML files to export
+        output_dir: Destination directory for the PDFs
+        workers: Number of worker processes (default: all cores)
+
+    Yields:
+        (pdf_path, size_in_bytes, None) as each PDF finishes, or
+        (pdf_path, 0, 'ExceptionType: message') when it failed
+    """
+    _load_weasyprint()
+
+    destination = Path(output_dir)
+    destination.mkdir(parents=True, exist_ok=True)
+    workers = workers or os.cpu_count() or 1
+
+    jobs = iter(dashboards)
+    with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker) as pool:
+        pending = {}
+        while True:
+            while len(pending) < workers * 2:
+                path = next(jobs, None)
+                if path is None:
+                    break
+                pdf_path = str(destination / (Path(path).stem + '.pdf'))
+                pending[pool.submit(_render, str(path), pdf_path)] = pdf_path
+
+            if not pending:
+                break
+
+            done, _ = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                pdf_path = pending.pop(future)
+                try:
+                    _, size = future.result()
+                except Exception as e:
+                    yield pdf_path, 0, f"{type(e).__name__}: {e}"
+                else:
+                    yield pdf_path, size, None
+
+
+def main(argv: List[str]) -> int:
+    """CLI: export every dashboard in a directory (or one month of it)"""
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Export HELD dashboards to PDF")
+    parser.add_argument('input_dir', nargs='?', default='outputs',
+                        help="Directory with saved dashboards (default: outputs)")
+    parser.add_argument('--month', help="Only export dashboards from this month (YYYY-MM)")
+    parser.add_argument('--output', default='outputs/pdf',
+                        help="Destination directory (default: outputs/pdf)")
+    parser.add_argument('--workers', type=int, help="Worker processes (default: all cores)")
+    args = parser.parse_args(argv)
+
+    dashboards = select_dashboards(args.input_dir, args.month)
+    if not dashboards:
+        print(f"Geen dashboards gevonden in {args.input_dir}")
+        return 1
+
+    try:
+        total = failed = 0
+        for pdf_path, size, error in export_pdfs(dashboards, args.output, args.workers):
+            total += 1
+            if error:
+                failed += 1
+                print(f"[{total}/{len(dashboards)}] ✗ {pdf_path}: {error}")
+            else:
+                print(f"[{total}/{len(dashboards)}] {pdf_path} ({size // 1024} KB)")
+    except ImportError as e:
+        print(f"Error: {e}")
+        return 1
+
+    print(f"{total - failed} PDF's opgeslagen in {args.output}")
+    if failed:
+        print(f"{failed} dashboards mislukt")
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main(sys.argv[1:]))
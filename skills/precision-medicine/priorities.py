@@ -0,0 +1,171 @@
+"""
+Severity-weighted priority ranking for biomarkers and variants
+
+Every biomarker gets a score
+
+    severity weight x marker weight x (1 + relative deviation from optimal)
+
+and every variant
+
+    severity weight x (1 + summed pathway weight of its features)
+
+Scores are computed column by column over the whole panel and the top-k is
+taken with a heap, so ranking a large panel is a few list passes and works
+for any marker, not just the ones with hand-written alerts.
+"""
+
+import heapq
+from typing import Dict, List, Optional, Sequence
+
+from biomarker_charts import parse_range
+from parsers.markers import resolve_marker
+from parsers.thresholds import evaluated_range
+from pathways import PATHWAYS, variant_features
+
+SEVERITY_WEIGHTS: Dict[str, float] = {
+    'critical': 3.0,
+    'warning': 1.5,
+    'info': 0.25,
+    'optimal': 0.0,
+}
+
+# Clinical weight per canonical marker key; unlisted markers weigh 1.0
+MARKER_WEIGHTS: Dict[str, float] = {
+    'homocysteine': 3.0,
+    'ferritin': 2.0,
+    'crp': 2.0,
+    'hba1c': 2.0,
+    'vitamin_d': 1.5,
+    'vitamin_b12': 1.5,
+    'folate': 1.5,
+}
+
+# Deviations are capped so one extreme value cannot swamp the ranking
+MAX_DEVIATION = 5.0
+
+
+def deviation(optimal_range: str, value: float) -> float:
+    """
+    Relative distance of a value from its optimal range
+
+    Returns:
+        Positive above the range, negative below it, 0.0 inside it or when
+        the range cannot be parsed
+    """
+    bounds = parse_range(optimal_range) if optimal_range else None
+    if bounds is None:
+        return 0.0
+    low, high = bounds
+    if high is not None and value > high:
+        return (value - high) / high if high else MAX_DEVIATION
+    if low is not None and value < low:
+        return (value - low) / low if low else -MAX_DEVIATION
+    return 0.0
+
+
+class PriorityEngine:
+    """Scores and ranks a patient's biomarkers and variants"""
+
+    def __init__(
+        self,
+        marker_weights: Optional[Dict[str, float]] = None,
+        feature_weights: Optional[Dict[str, float]] = None
+    ):
+        """
+        Args:
+            marker_weights: {canonical marker key: weight} (MARKER_WEIGHTS by default)
+            feature_weights: {variant feature: weight}, e.g. 'CBS:rs234706:AA'
+        """
+        self.marker_weights = MARKER_WEIGHTS if marker_weights is None else marker_weights
+        self.feature_weights = feature_weights or {}
+
+    @classmethod
+    def from_config(cls, config: Dict) -> 'PriorityEngine':
+        """Build the engine from a loaded brand config (variant weights from pathway_weights)"""
+        feature_weights: Dict[str, float] = {}
+        weights = config.get('pathway_weights', {})
+        for pathway in PATHWAYS:
+            for feature, weight in weights.get(pathway, {}).items():
+                feature_weights[feature] = feature_weights.get(feature, 0.0) + float(weight)
+        return cls(feature_weights=feature_weights)
+
+    def score_biomarkers(self, biomarkers: Sequence[Dict]) -> List[float]:
+        """Priority score per biomarker, in input order"""
+        severities = [SEVERITY_WEIGHTS.get(b['status'], 0.0) for b in biomarkers]
+        weights = [self.marker_weights.get(resolve_marker(b['name']), 1.0) for b in biomarkers]
+        deviations = [
+            min(abs(deviation(evaluated_range(b), b['value'])), MAX_DEVIATION)
+            for b in biomarkers
+        ]
+        return [s * w * (1.0 + d) for s, w, d in zip(severities, weights, deviations)]
+
+    def score_variants(self, dna_variants: Sequence[Dict]) -> List[float]:
+        """Priority score per variant, in input order"""
+        get = self.feature_weights.get
+        severities = [SEVERITY_WEIGHTS.get(v['severity'], 0.0) for v in dna_variants]
+        weights = [
+            sum(get(f, 0.0) for f in variant_features(v['gene'], v['rs_number'], v['genotype']))
+            for v in dna_variants
+        ]
+        return [s * (1.0 + w) for s, w in zip(severities, weights)]
+
+    def rank_biomarkers(
+        self,
+        biomarkers: Sequence[Dict],
+        k: int,
+        statuses: Sequence[str] = ('critical', 'warning')
+    ) -> List[int]:
+        """Indices of the k highest-scoring biomarkers with one of the given statuses"""
+        scores = self.score_biomarkers(biomarkers)
+        candidates = [i for i, b in enumerate(biomarkers) if b['status'] in statuses]
+        return heapq.nlargest(k, candidates, key=scores.__getitem__)
+
+    def top_priorities(
+        self,
+        biomarkers: Sequence[Dict],
+        dna_variants: Sequence[Dict],
+        k: int = 5
+    ) -> List[Dict]:
+        """
+        The k highest-scoring findings across biomarkers and variants
+
+        Returns entries with structure:
+        {
+            'kind': 'biomarker' | 'variant',
+            'name': 'HomocysteÏne',
+            'label': 'HomocysteÏne: 18.0 µmol/L',
+            'severity': 'critical',
+            'score': 20.25
+        }
+        Findings scoring 0 (optimal) are left out.
+        """
+        scored = [
+            (score, 'biomarker', i)
+            for i, score in enumerate(self.score_biomarkers(biomarkers)) if score > 0
+        ]
+        scored += [
+            (score, 'variant', i)
+            for i, score in enumerate(self.score_variants(dna_variants)) if score > 0
+        ]
+
+        priorities = []
+        for score, kind, i in heapq.nlargest(k, scored, key=lambda entry: entry[0]):
+            if kind == 'biomarker':
+                marker = biomarkers[i]
+                priorities.append({
+                    'kind': kind,
+                    'name': marker['name'],
+                    'label': f"{marker['name']}: {marker['value']} {marker['unit']}",
+                    'severity': marker['status'],
+                    'score': round(score, 2),
+                })
+            else:
+                variant = dna_variants[i]
+                priorities.append({
+                    'kind': kind,
+                    'name': variant['gene'],
+                    'label': f"{variant['gene']} {variant['rs_number']} {variant['genotype']}",
+                    'severity': variant['severity'],
+                    'score': round(score, 2),
+                })
+        return priorities
@@ -0,0 +1,170 @@
+"""
+Supplement protocol rules, memoized per condition bitmask
+
+The protocol only depends on which conditions a patient has, apart from
+the measured vitamin D value quoted in one reason. The rule cascade runs
+once per bitmask and locale; the patient-specific sentence is added per
+call. Supplement names are product names and are not translated.
+"""
+
+from functools import lru_cache
+from typing import Dict, List, Optional, Tuple
+
+from localization import DEFAULT_LOCALE, Catalog, get_catalog
+
+# Condition bits
+PEMT_TT = 1 << 0
+BHMT_ISSUES = 1 << 1
+MTHFR = 1 << 2
+CBS_UPREGULATION = 1 << 3
+COMT_SLOW = 1 << 4
+VDR_VARIANTS = 1 << 5
+LOW_VITAMIN_D = 1 << 6
+HIGH_HOMOCYSTEINE = 1 << 7
+
+VITAMIN_D_SUPPLEMENT = 'Vitamine D3 + K2 (vloeibaar)'
+
+# Active ingredients per protocol item (interaction checks, timing rules)
+INGREDIENTS: Dict[str, Tuple[str, ...]] = {
+    'Fosfatidylcholine': ('phosphatidylcholine',),
+    VITAMIN_D_SUPPLEMENT: ('vitamin_d3', 'vitamin_k2'),
+    'Zink Bisglycinaat': ('zinc',),
+    'Magnesium Glycinaat': ('magnesium',),
+    'Methylated B-Complex': ('methylfolate', 'methylcobalamin', 'p5p', 'riboflavin'),
+    'Trimethylglycine (TMG/Betaine)': ('betaine',),
+    'Koper Bisglycinaat': ('copper',),
+}
+
+
+def _item(t: Catalog, time: str, name: str, dosage: str, reason: str, badge: str) -> Dict:
+    return {
+        'time': time,
+        'time_label': t(f"slot.{time}"),
+        'name': name,
+        'dosage': dosage,
+        'reason': reason,
+        'badge': badge
+    }
+
+
+@lru_cache(maxsize=256)
+def _build_protocol(mask: int, locale: Optional[str] = None) -> Tuple[Dict, ...]:
+    """Run the rule cascade for one condition bitmask"""
+    t = get_catalog(locale)
+    protocol = []
+
+    has_pemt_tt = bool(mask & PEMT_TT)
+    has_bhmt_issues = bool(mask & BHMT_ISSUES)
+    has_mthfr = bool(mask & MTHFR)
+    has_cbs_upregulation = bool(mask & CBS_UPREGULATION)
+    has_comt_slow = bool(mask & COMT_SLOW)
+    has_vdr_variants = bool(mask & VDR_VARIANTS)
+    low_vitd = bool(mask & LOW_VITAMIN_D)
+    high_homocysteine = bool(mask & HIGH_HOMOCYSTEINE)
+
+    # 1. CHOLINE (if PEMT TT or BHMT issues) - ALWAYS FIRST
+    if has_pemt_tt or has_bhmt_issues:
+        reason_parts = []
+        if has_pemt_tt:
+            reason_parts.append(t('protocol.choline.pemt'))
+        if has_bhmt_issues:
+            reason_parts.append(t('protocol.choline.bhmt'))
+        reason_parts.append(t('protocol.choline.reason'))
+
+        protocol.append(_item(
+            t, '07:30', 'Fosfatidylcholine', t('protocol.choline.dosage'),
+            ' '.join(reason_parts), 'KERN'
+        ))
+
+    # 2. VITAMIN D (if low or VDR variants); current value is added per patient
+    if low_vitd or has_vdr_variants:
+        reason_parts = [t('protocol.vitamin_d.reason')]
+        if has_vdr_variants:
+            reason_parts.append(t('protocol.vitamin_d.vdr'))
+
+        protocol.append(_item(
+            t, '08:00', VITAMIN_D_SUPPLEMENT, t('protocol.vitamin_d.dosage'),
+            ' '.join(reason_parts), 'KRITIEK' if low_vitd else 'ESSENTIEEL'
+        ))
+
+    # 3. ZINC (if BHMT or methylation issues)
+    if has_bhmt_issues or has_mthfr or high_homocysteine:
+        protocol.append(_item(
+            t, '12:30', 'Zink Bisglycinaat', t('protocol.zinc.dosage'),
+            t('protocol.zinc.reason'), 'ESSENTIEEL'
+        ))
+
+    # 4. MAGNESIUM (if COMT slow or MTHFR)
+    if has_comt_slow or has_mthfr:
+        reason_parts = []
+        if has_comt_slow:
+            reason_parts.append(t('protocol.magnesium.comt'))
+        reason_parts.append(t('protocol.magnesium.reason'))
+
+        protocol.append(_item(
+            t, '15:00', 'Magnesium Glycinaat', t('protocol.magnesium.dosage'),
+            ' '.join(reason_parts), 'SUPPORT'
+        ))
+
+    # 5. METHYLATED B-COMPLEX (ONLY after 6 weeks if CBS upregulation)
+    if has_mthfr:
+        reason_parts = []
+        if has_cbs_upregulation:
+            reason_parts.append(t('protocol.b_complex.delay'))
+        reason_parts.append(t('protocol.b_complex.reason'))
+        if has_cbs_upregulation:
+            reason_parts.append(t('protocol.b_complex.cbs'))
+
+        protocol.append(_item(
+            t, '20:00', 'Methylated B-Complex', t('protocol.b_complex.dosage'),
+            ' '.join(reason_parts), 'FASE 2' if has_cbs_upregulation else 'KERN'
+        ))
+
+    # 6. TMG/BETAINE (if BHMT issues or CBS upregulation)
+    if has_bhmt_issues or has_cbs_upregulation:
+        protocol.append(_item(
+            t, '22:00', 'Trimethylglycine (TMG/Betaine)', t('protocol.tmg.dosage'),
+            t('protocol.tmg.reason'), 'KERN'
+        ))
+
+    # Sort by time
+    return tuple(sorted(protocol, key=lambda x: x['time']))
+
+
+def resolve_protocol(
+    mask: int,
+    vitamin_d: Optional[Dict] = None,
+    locale: Optional[str] = None
+) -> List[Dict]:
+    """
+    Supplement protocol for a condition bitmask
+
+    Args:
+        mask: OR of the condition bits
+        vitamin_d: The patient's vitamin D biomarker, if measured; its value
+            is quoted in the vitamin D reason
+        locale: Catalog locale for the texts (Dutch by default)
+
+    Returns:
+        Fresh list of protocol entries (safe to modify); 'badge' is a code,
+        its display text is the catalog's badge.* message
+    """
+    locale = locale or DEFAULT_LOCALE
+    protocol = [dict(item) for item in _build_protocol(mask, locale)]
+
+    if vitamin_d is not None:
+        for item in protocol:
+            if item['name'] == VITAMIN_D_SUPPLEMENT:
+                current = get_catalog(locale)(
+                    'protocol.vitamin_d.current',
+                    value=vitamin_d['value'],
+                    unit=vitamin_d.get('unit', 'ng/ml')
+                )
+                item['reason'] = current + item['reason']
+
+    return protocol
+
+
+def cache_info():
+    """Memoization statistics for protocols"""
+    return _build_protocol.cache_info()
@@ -0,0 +1,184 @@
+"""
+Supplement timing as a small constraint problem
+
+The protocol rules propose a time for every supplement. The scheduler
+keeps that time when it is allowed and otherwise moves the item to the
+nearest slot that satisfies its rules:
+
+    - food: some items need a meal, others an empty stomach
+    - period: e.g. magnesium and TMG belong in the evening
+    - spacing: competing minerals (zinc/copper) at least two hours apart
+    - capacity: at most MAX_PER_SLOT items share a slot
+
+Solutions are memoized per set of (supplement, proposed time), so a batch
+of patients with the same protocol solves it once.
+"""
+
+from functools import lru_cache
+from typing import Dict, FrozenSet, List, NamedTuple, Optional, Tuple
+
+from localization import get_catalog
+from supplement_protocol import INGREDIENTS, VITAMIN_D_SUPPLEMENT
+
+MORNING = 'morning'
+MIDDAY = 'midday'
+EVENING = 'evening'
+BEDTIME = 'bedtime'
+
+
+class Slot(NamedTuple):
+    """A moment of the day supplements can be taken (label: catalog slot.<time>)"""
+    time: str
+    with_food: bool
+    period: str
+
+
+class Rule(NamedTuple):
+    """Timing constraints for one supplement"""
+    with_food: Optional[bool]  # None: either
+    periods: FrozenSet[str]
+
+
+SLOTS: Tuple[Slot, ...] = (
+    Slot('07:30', False, MORNING),
+    Slot('08:00', True, MORNING),
+    Slot('12:30', True, MIDDAY),
+    Slot('15:00', False, MIDDAY),
+    Slot('18:30', True, EVENING),
+    Slot('20:00', False, EVENING),
+    Slot('22:00', False, BEDTIME),
+)
+
+_DAYTIME = frozenset((MORNING, MIDDAY))
+_ANY_TIME = frozenset((MORNING, MIDDAY, EVENING, BEDTIME))
+
+RULES: Dict[str, Rule] = {
+    'Fosfatidylcholine': Rule(None, _DAYTIME),
+    # Fat-soluble: take with a meal
+    VITAMIN_D_SUPPLEMENT: Rule(True, _DAYTIME),
+    # Nausea on an empty stomach
+    'Zink Bisglycinaat': Rule(True, _ANY_TIME),
+    'Koper Bisglycinaat': Rule(True, _ANY_TIME),
+    'Magnesium Glycinaat': Rule(None, frozenset((MIDDAY, EVENING, BEDTIME))),
+    'Methylated B-Complex': Rule(None, frozenset((MORNING, MIDDAY, EVENING))),
+    'Trimethylglycine (TMG/Betaine)': Rule(None, frozenset((EVENING, BEDTIME))),
+}
+
+# Minimum minutes between ingredients that compete for absorption
+SPACING: Dict[FrozenSet[str], int] = {
+    frozenset(('zinc', 'copper')): 120,
+    frozenset(('zinc', 'iron')): 120,
+}
+
+MAX_PER_SLOT = 2
+
+
+def _minutes(time: str) -> int:
+    hours, minutes = time.split(':')
+    return int(hours) * 60 + int(minutes)
+
+
+def _candidates(name: str, proposed: str) -> List[int]:
+    """Allowed slot indices for an item, the proposed time first, then nearest"""
+    rule = RULES.get(name)
+    allowed = [
+        i for i, slot in enumerate(SLOTS)
+        if rule is None or (
+            slot.period in rule.periods
+            and (rule.with_food is None or slot.with_food == rule.with_food)
+        )
+    ]
+    target = _minutes(proposed)
+    return sorted(allowed, key=lambda i: (
+        SLOTS[i].time != proposed, abs(_minutes(SLOTS[i].time) - target)
+    ))
+
+
+def _required_gap(first: str, second: str) -> int:
+    """Minimum minutes between two protocol items"""
+    return max(
+        (
+            SPACING.get(frozenset((a, b)), 0)
+            for a in INGREDIENTS.get(first, ())
+            for b in INGREDIENTS.get(second, ())
+        ),
+        default=0
+    )
+
+
+@lru_cache(maxsize=256)
+def _solve(items: Tuple[Tuple[str, str], ...]) -> Tuple[int, ...]:
+    """
+    Slot index per (name, proposed time) item
+
+    Depth-first search with the most constrained item first; candidates are
+    tried in preference order, so the first solution is the preferred one.
+    """
+    candidates = [_candidates(name, proposed) for name, proposed in items]
+    order = sorted(range(len(items)), key=lambda i: (len(candidates[i]), items[i][0]))
+    gaps = {
+        (i, j): _required_gap(items[i][0], items[j][0])
+        for i in range(len(items)) for j in range(len(items)) if i != j
+    }
+
+    assignment: Dict[int, int] = {}
+    load = [0] * len(SLOTS)
+
+    def fits(item: int, slot: int) -> bool:
+        if load[slot] >= MAX_PER_SLOT:
+            return False
+        at = _minutes(SLOTS[slot].time)
+        return all(
+            abs(at - _minutes(SLOTS[other_slot].time)) >= gaps[item, other]
+            for other, other_slot in assignment.items()
+        )
+
+    def search(depth: int) -> bool:
+        if depth == len(order):
+            return True
+        item = order[depth]
+        for slot in candidates[item]:
+            if fits(item, slot):
+                assignment[item] = slot
+                load[slot] += 1
+                if search(depth + 1):
+                    return True
+                del assignment[item]
+                load[slot] -= 1
+        return False
+
+    if not search(0):
+        names = ', '.join(name for name, _ in items)
+        raise ValueError(f"No schedule satisfies the timing rules for: {names}")
+
+    return tuple(assignment[i] for i in range(len(items)))
+
+
+def schedule_protocol(protocol: List[Dict], locale: Optional[str] = None) -> List[Dict]:
+    """
+    Assign every protocol item a time slot that satisfies the timing rules
+
+    Args:
+        protocol: Protocol entries with a proposed 'time'
+        locale: Catalog locale for the slot labels (Dutch by default)
+
+    Returns:
+        New list of entries with 'time' and 'time_label' set, sorted by time
+
+    Raises:
+        ValueError: If no assignment satisfies the rules
+    """
+    key = tuple(sorted((item['name'], item['time']) for item in protocol))
+    slots = dict(zip(key, _solve(key)))
+
+    t = get_catalog(locale)
+    scheduled = []
+    for item in protocol:
+        slot = SLOTS[slots[item['name'], item['time']]]
+        scheduled.append(dict(item, time=slot.time, time_label=t(f"slot.{slot.time}")))
+    return sorted(scheduled, key=lambda x: x['time'])
+
+
+def cache_info():
+    """Memoization statistics for schedules"""
+    return _solve.cache_info()
@@ -262,6 +262,17 @@ def get_css() -> str:
             transition: width 0.3s ease;
         }
 
+        .biomarker-bar svg {
+            display: block;
+        }
+
+        .biomarker-sparkline {
+            display: block;
+            width: 100%;
+            height: 24px;
+            margin-top: 0.75rem;
+        }
+
         /* DNA Variants */
         .dna-grid {
             display: grid;
@@ -505,6 +516,18 @@ def get_css() -> str:
             opacity: 0.7;
         }
 
+        .supplement-interactions {
+            list-style: none;
+            margin-top: 0.5rem;
+            padding: 0.5rem 0.75rem;
+            background: rgba(239, 68, 68, 0.1);
+            border-left: 3px solid var(--status-critical);
+            border-radius: 6px;
+            font-size: 0.85rem;
+            font-weight: 600;
+            color: #DC2626;
+        }
+
         .supplement-badge {
             background: var(--american-orange);
             color: white;
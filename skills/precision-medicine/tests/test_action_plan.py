@@ -0,0 +1,51 @@
+"""Tests for the 3-month action plan template"""
+import action_plan
+from action_plan import CBS_UPREGULATION, HIGH_HOMOCYSTEINE, resolve_plan
+from held_dashboard_generator import HELDDashboardGenerator
+
+
+def test_conditions_select_actions_and_warnings():
+    """Test conditional items appear only for matching fingerprints"""
+    base = resolve_plan(frozenset())
+    full = resolve_plan(frozenset({HIGH_HOMOCYSTEINE, CBS_UPREGULATION}))
+
+    assert [p['phase'][:6] for p in base] == ['Fase 1', 'Fase 2', 'Fase 3']
+    assert len(full[0]['actions']) == len(base[0]['actions']) + 1
+    assert full[0]['actions'][0]['icon'] == '🥚'
+    assert base[0]['warnings'] == []
+    assert 'GEEN methylated B-complex' in full[0]['warnings'][0]
+
+
+def test_resolved_plans_are_memoized():
+    """Test repeated fingerprints are cache hits"""
+    conditions = frozenset({HIGH_HOMOCYSTEINE, 'test_only_condition'})
+    resolve_plan(conditions)
+    hits = action_plan.cache_info().hits
+
+    for _ in range(10):
+        resolve_plan(conditions)
+
+    assert action_plan.cache_info().hits == hits + 10
+
+
+def test_returned_plan_is_a_copy():
+    """Test callers cannot modify the cached plan"""
+    plan = resolve_plan(frozenset())
+    plan[0]['actions'][0]['title'] = 'changed'
+    plan[0]['warnings'].append('extra')
+
+    fresh = resolve_plan(frozenset())
+
+    assert fresh[0]['actions'][0]['title'] == 'Vitamine D Normaliseren'
+    assert fresh[0]['warnings'] == []
+
+
+def test_generator_plan_conditions():
+    """Test the generator derives the fingerprint from parsed data"""
+    generator = HELDDashboardGenerator()
+    biomarkers = [{'name': 'HomocysteÏne', 'status': 'critical'}]
+    dna_variants = [{'gene': 'CBS', 'genotype': 'AA'}, {'gene': 'COMT', 'genotype': 'AG'}]
+
+    conditions = generator._plan_conditions(dna_variants, biomarkers)
+
+    assert conditions == {'high_homocysteine', 'cbs_upregulation', 'comt_variants'}
@@ -0,0 +1,71 @@
+"""Tests for biomarker range bars and sparklines"""
+import re
+
+import biomarker_charts
+from biomarker_charts import parse_range, range_bar, sparkline
+from held_dashboard_generator import HELDDashboardGenerator
+
+
+def _fill_width(svg):
+    return float(re.search(r'class="biomarker-fill" width="([\d.]+)"', svg).group(1))
+
+
+def test_parse_range():
+    """Test printed range formats"""
+    assert parse_range('<8.0') == (None, 8.0)
+    assert parse_range('>30') == (30.0, None)
+    assert parse_range('45-60') == (45.0, 60.0)
+    assert parse_range('n.v.t.') is None
+
+
+def test_range_bar_positions():
+    """Test the fill tracks the value within the range"""
+    low = range_bar('45-60', 40.0, 'warning')
+    high = range_bar('45-60', 70.0, 'warning')
+
+    assert 'class="biomarker-bar"' in low
+    assert _fill_width(low) < _fill_width(high)
+    assert _fill_width(range_bar('<8.0', 18.0, 'critical')) == 100.0
+
+
+def test_unusable_range_renders_nothing():
+    """Test cards without a drawable range get no bar"""
+    assert range_bar('', 5.0, 'optimal') == ''
+    assert range_bar('5-5', 5.0, 'optimal') == ''
+    assert range_bar('>0', 5.0, 'optimal') == ''
+
+
+def test_range_bars_cached_per_bucket():
+    """Test values in the same bucket reuse one SVG"""
+    range_bar('50-120', 80.0, 'optimal')
+    before = biomarker_charts.cache_info()
+
+    range_bar('50-120', 80.1, 'optimal')
+
+    after = biomarker_charts.cache_info()
+    assert after.hits == before.hits + 1
+    assert after.misses == before.misses
+
+
+def test_sparkline():
+    """Test trend lines need at least two points"""
+    assert sparkline([18.0], 'critical') == ''
+    svg = sparkline([22.0, 18.0, 12.0], 'warning')
+    assert svg.count(',') == 3
+    assert svg.startswith('<svg class="biomarker-sparkline"')
+
+
+def test_biomarker_cards_include_charts():
+    """Test cards render a bar, and a sparkline when history is known"""
+    marker = {
+        'name': 'Ferritine', 'value': 307.0, 'unit': 'µg/L',
+        'optimal_range': '50-120', 'status': 'warning',
+    }
+    generator = HELDDashboardGenerator()
+
+    html = generator._build_biomarkers_html([marker])
+    assert 'biomarker-bar' in html
+    assert 'biomarker-sparkline' not in html
+
+    html = generator._build_biomarkers_html([dict(marker, history=[410.0, 350.0])])
+    assert 'biomarker-sparkline' in html
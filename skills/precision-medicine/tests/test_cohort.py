@@ -0,0 +1,104 @@
+"""Tests for cohort analytics"""
+import json
+import time
+
+from cohort import Cohort
+from parsers.blood_parser import BloodParser
+from parsers.dna_parser import DNAParser
+
+
+def _records():
+    blood = BloodParser()
+    dna = DNAParser()
+    return [
+        {
+            'patient_id': 'p1',
+            'biomarkers': blood.parse("HomocysteÏne + 18.0 Opt:<8.0 V.N 3.7-13.9 µmol/L"),
+            'dna_variants': dna.parse("PEMT rs7946 TT Potential for reduced choline synthesis")
+        },
+        {
+            'patient_id': 'p2',
+            'biomarkers': blood.parse("HomocysteÏne 7.0 Opt:<8.0 V.N 3.7-13.9 µmol/L"),
+            'dna_variants': dna.parse("PEMT rs7946 TT Potential for reduced choline synthesis")
+        },
+        {
+            'patient_id': 'p3',
+            'biomarkers': blood.parse("HomocysteÏne + 18.0 Opt:<8.0 V.N 3.7-13.9 µmol/L"),
+            'dna_variants': dna.parse("PEMT rs7946 CT Normal choline synthesis")
+        },
+    ]
+
+
+def test_status_distribution():
+    """Test status counts per marker"""
+    cohort = Cohort.from_records(_records())
+
+    distribution = cohort.status_distribution()
+
+    assert distribution['homocysteine'] == {'optimal': 1, 'warning': 0, 'critical': 2}
+    assert cohort.status_distribution('Hcy') == distribution
+    assert cohort.status_distribution('unknown') == {}
+
+
+def test_genotype_frequencies():
+    """Test genotype frequencies per gene"""
+    cohort = Cohort.from_records(_records())
+
+    frequencies = cohort.genotype_frequencies('PEMT')
+
+    assert frequencies == {'PEMT': {'rs7946': {'CT': 1 / 3, 'TT': 2 / 3}}}
+
+
+def test_genotype_frequencies_keep_snps_of_one_gene_apart():
+    """Test two MTHFR SNPs get separate distributions"""
+    dna = DNAParser()
+    cohort = Cohort()
+    for i, (c677t, a1298c) in enumerate([('AA', 'TT'), ('AG', 'TT'), ('GG', 'GG')]):
+        cohort.add_patient(str(i), [], dna.parse(
+            f"MTHFR rs1801133 {c677t} [C677T]\nMTHFR rs1801131 {a1298c} [A1298C]"
+        ))
+
+    mthfr = cohort.genotype_frequencies('MTHFR')['MTHFR']
+
+    assert set(mthfr) == {'rs1801133', 'rs1801131'}
+    assert mthfr['rs1801133'] == {'AA': 1 / 3, 'AG': 1 / 3, 'GG': 1 / 3}
+    assert mthfr['rs1801131'] == {'TT': 2 / 3, 'GG': 1 / 3}
+
+
+def test_co_occurrence_pemt_tt_high_homocysteine():
+    """Test 2x2 contingency of PEMT TT against critical homocysteine"""
+    cohort = Cohort.from_records(_records())
+
+    result = cohort.co_occurrence('PEMT', 'TT', 'HomocysteÏne', ['critical'])
+
+    assert result == {'both': 1, 'variant_only': 1, 'marker_only': 1, 'neither': 0}
+
+
+def test_load_directory(tmp_path):
+    """Test loading single and list records from a directory"""
+    records = _records()
+    (tmp_path / 'a.json').write_text(json.dumps(records[0]), encoding='utf-8')
+    (tmp_path / 'b.json').write_text(json.dumps(records[1:]), encoding='utf-8')
+
+    cohort = Cohort.load(str(tmp_path))
+
+    assert cohort.patient_ids == ['p1', 'p2', 'p3']
+
+
+def test_queries_scale_to_100k_patients():
+    """Test aggregate queries over a large cohort stay columnar (~0.2 s)"""
+    records = _records()
+    cohort = Cohort()
+    for i in range(100_000):
+        record = records[i % 3]
+        cohort.add_patient(str(i), record['biomarkers'], record['dna_variants'])
+
+    start = time.perf_counter()
+    cohort.status_distribution()
+    cohort.genotype_frequencies()
+    result = cohort.co_occurrence('PEMT', 'TT', 'HomocysteÏne')
+    elapsed = time.perf_counter() - start
+
+    assert sum(result.values()) == 100_000
+    # Generous bound so loaded CI machines do not flake
+    assert elapsed < 5.0
@@ -0,0 +1,98 @@
+"""Tests for consult-notes analysis"""
+import json
+from pathlib import Path
+
+import action_plan
+from consult_notes import MEDICATION, SYMPTOM, KeywordMatcher, analyze_notes
+from held_dashboard_generator import HELDDashboardGenerator
+
+NOTES = """
+## Consult 5 november
+Patiënt is erg vermoeid en slaapt slecht. Geen hoofdpijn.
+Medicatie: Sertraline 50 mg, L-Dopa.
+Niet zwanger. Wel chronische nierziekte (verminderde nierfunctie).
+Doel: meer energie.
+"""
+
+
+def _model(generator, consult_notes):
+    fixtures_path = Path(__file__).parent / 'fixtures' / 'test_data.json'
+    data = json.loads(fixtures_path.read_text(encoding='utf-8'))
+    return generator.build_model(
+        patient_name=data['patient_name'],
+        consult_date=data['consult_date'],
+        consult_notes=consult_notes,
+        blood_data=data['blood_sample'],
+        dna_data=data['dna_sample']
+    )
+
+
+def test_extracts_facts_in_all_categories():
+    """Test symptoms, medications, goals and contraindications are extracted"""
+    facts = analyze_notes(NOTES)
+
+    assert facts.symptoms == {'fatigue', 'poor_sleep'}
+    assert facts.medications == {'ssri', 'levodopa'}
+    assert facts.goals == {'energy'}
+    assert facts.contraindications == {'kidney_disease'}
+
+
+def test_negated_keywords_are_ignored():
+    """Test 'geen'/'niet'/'no' right before a keyword negates it"""
+    facts = analyze_notes("Geen hoofdpijn, niet zwanger, no insomnia. Keine Müdigkeit.")
+
+    assert facts.symptoms == frozenset()
+    assert facts.contraindications == frozenset()
+
+
+def test_matches_whole_words_only():
+    """Test keywords inside longer words do not match"""
+    assert analyze_notes("moeder en moeheid") == analyze_notes("")
+    assert analyze_notes("MOE!").symptoms == {'fatigue'}
+
+
+def test_overlapping_keywords():
+    """Test a keyword that is a suffix of another still matches"""
+    matcher = KeywordMatcher({
+        SYMPTOM: {'pain': ('pijn',), 'joint_pain': ('gewrichtspijn',)},
+        MEDICATION: {'ssri': ('sertraline',)},
+    })
+
+    values = [m.value for m in matcher.matches("gewrichtspijn en pijn")]
+
+    assert values == ['joint_pain', 'pain']
+
+
+def test_matches_index_folded_text():
+    """Test match positions point at the keyword in the folded notes"""
+    matcher = KeywordMatcher({SYMPTOM: {'fatigue': ('müde',)}})
+
+    match = matcher.matches("Sehr MÜDE.")[0]
+
+    assert (match.start, match.end) == (5, 9)
+
+
+def test_long_notes_single_pass():
+    """Test a long export is analyzed as a whole"""
+    text = "Normaal consult zonder bijzonderheden. " * 20000 + "Gebruikt warfarine."
+
+    assert analyze_notes(text).medications == {'warfarine'}
+
+
+def test_notes_feed_protocol_and_plan():
+    """Test extracted medications, symptoms and contraindications reach the dashboard"""
+    generator = HELDDashboardGenerator()
+    plain = _model(generator, 'Test consultation notes')
+    model = _model(generator, NOTES)
+
+    magnesium = next(s for s in model.supplement_protocol if s['name'] == 'Magnesium Glycinaat')
+    assert any('nierfunctie' in message for message in magnesium['interactions'])
+    b_complex = next(s for s in model.supplement_protocol if s['name'] == 'Methylated B-Complex')
+    assert any('levodopa' in message for message in b_complex['interactions'])
+
+    conditions = generator._plan_conditions(model.dna_variants, model.biomarkers, analyze_notes(NOTES))
+    assert action_plan.SLEEP_ISSUES in conditions
+    assert action_plan.KIDNEY_DISEASE in conditions
+    assert action_plan.PREGNANCY not in conditions
+    assert len(model.action_plan[0]['actions']) == len(plain.action_plan[0]['actions']) + 1
+    assert len(model.action_plan[0]['warnings']) == len(plain.action_plan[0]['warnings']) + 1
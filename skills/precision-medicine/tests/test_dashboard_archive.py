@@ -0,0 +1,110 @@
+"""Tests for the deduplicated dashboard archive"""
+import json
+from pathlib import Path
+
+import pytest
+
+from dashboard_archive import DashboardArchive, archive_outputs, train_dictionary
+from held_dashboard_generator import HELDDashboardGenerator
+
+
+def _render_dashboards(count):
+    test_data_path = Path(__file__).parent / 'fixtures' / 'test_data.json'
+    with open(test_data_path) as f:
+        test_data = json.load(f)
+
+    generator = HELDDashboardGenerator()
+    return [
+        generator.generate_dashboard(
+            patient_name=f"Patient {i}",
+            consult_date=test_data['consult_date'],
+            consult_notes='',
+            blood_data=test_data['blood_sample'],
+            dna_data=test_data['dna_sample'] if i % 2 else ''
+        )
+        for i in range(count)
+    ]
+
+
+def test_round_trip_is_exact(tmp_path):
+    """Test archived dashboards reconstruct byte-for-byte"""
+    dashboards = _render_dashboards(4)
+    archive = DashboardArchive.create(str(tmp_path / 'a.heldarc'), train_dictionary(dashboards))
+
+    for i, html in enumerate(dashboards):
+        archive.add(f"patient_{i}.html", html)
+
+    reopened = DashboardArchive(str(tmp_path / 'a.heldarc'))
+    assert reopened.names() == [f"patient_{i}.html" for i in range(4)]
+    for i, html in enumerate(dashboards):
+        assert reopened.read(f"patient_{i}.html") == html
+
+
+def test_archive_is_much_smaller_than_html(tmp_path):
+    """Test the shared dictionary removes the repeated template cost"""
+    output_dir = tmp_path / 'outputs'
+    output_dir.mkdir()
+    dashboards = _render_dashboards(20)
+    for i, html in enumerate(dashboards):
+        (output_dir / f"patient_{i}.html").write_text(html, encoding='utf-8')
+
+    archive = archive_outputs(str(output_dir), str(tmp_path / 'outputs.heldarc'))
+
+    original = sum(len(html.encode('utf-8')) for html in dashboards)
+    assert len(archive) == 20
+    assert archive.path.stat().st_size * 10 < original
+
+
+def test_empty_dictionary_still_round_trips(tmp_path):
+    """Test an archive without a dictionary falls back to plain deflate"""
+    archive = DashboardArchive.create(str(tmp_path / 'a.heldarc'), b'')
+    archive.add('x.html', '<html>µ Ï</html>')
+
+    assert DashboardArchive(str(tmp_path / 'a.heldarc')).read('x.html') == '<html>µ Ï</html>'
+
+
+def test_corrupt_entry_is_detected(tmp_path):
+    """Test checksum mismatch raises instead of returning bad HTML"""
+    path = tmp_path / 'a.heldarc'
+    archive = DashboardArchive.create(str(path), b'')
+    archive.add('x.html', '<html>' + 'a' * 100 + '</html>')
+    archive._index['x.html'] = archive._index['x.html'][:3] + (0,)
+
+    with pytest.raises(ValueError):
+        archive.read('x.html')
+
+
+def test_not_an_archive(tmp_path):
+    """Test opening a foreign file fails clearly"""
+    path = tmp_path / 'x.html'
+    path.write_text('<html></html>')
+
+    with pytest.raises(ValueError):
+        DashboardArchive(str(path))
+
+
+@pytest.mark.parametrize('cut', [10, 14, 40, -5])
+def test_truncated_archive_fails_clearly(tmp_path, cut):
+    """Test a file cut off in the header, an entry header or entry data raises ValueError"""
+    path = tmp_path / 'a.heldarc'
+    archive = DashboardArchive.create(str(path), b'<html><head>')
+    archive.add('x.html', '<html>' + 'a' * 100 + '</html>')
+    data = path.read_bytes()
+    path.write_bytes(data[:cut])
+
+    with pytest.raises(ValueError, match='Truncated|Corrupt'):
+        DashboardArchive(str(path))
+
+
+def test_oversized_name_is_rejected_before_writing(tmp_path):
+    """Test a name over 65535 UTF-8 bytes raises and leaves the archive intact"""
+    path = tmp_path / 'a.heldarc'
+    archive = DashboardArchive.create(str(path), b'')
+    size = path.stat().st_size
+
+    with pytest.raises(ValueError, match='too long'):
+        archive.add('µ' * 40000, '<html></html>')
+
+    assert path.stat().st_size == size
+    archive.add('x.html', '<html></html>')
+    assert DashboardArchive(str(path)).read('x.html') == '<html></html>'
@@ -0,0 +1,92 @@
+"""Tests for the dashboard model and its renderers"""
+import json
+from pathlib import Path
+
+import pytest
+
+from dashboard_model import DashboardModel, from_json, to_json
+from held_dashboard_generator import HELDDashboardGenerator
+
+
+@pytest.fixture
+def model():
+    """Dashboard model for the Mario fixture"""
+    fixtures_path = Path(__file__).parent / 'fixtures' / 'test_data.json'
+    with open(fixtures_path, 'r', encoding='utf-8') as f:
+        data = json.load(f)
+
+    return HELDDashboardGenerator().build_model(
+        patient_name=data['patient_name'],
+        consult_date=data['consult_date'],
+        consult_notes='',
+        blood_data=data['blood_sample'],
+        dna_data=data['dna_sample']
+    )
+
+
+def test_model_is_slotted(model):
+    """Test the model has fixed fields"""
+    with pytest.raises(AttributeError):
+        model.extra = 1
+
+
+def test_json_round_trip(model):
+    """Test JSON serialization preserves the model"""
+    text = to_json(model)
+
+    assert from_json(text) == model
+    assert json.loads(text)['patient_name'] == 'Mario Test'
+
+
+def test_html_renders_from_model(model):
+    """Test the HTML renderer matches generate_dashboard"""
+    generator = HELDDashboardGenerator()
+    fixtures_path = Path(__file__).parent / 'fixtures' / 'test_data.json'
+    data = json.loads(fixtures_path.read_text(encoding='utf-8'))
+
+    html = generator.generate_dashboard(
+        patient_name=data['patient_name'],
+        consult_date=data['consult_date'],
+        consult_notes='',
+        blood_data=data['blood_sample'],
+        dna_data=data['dna_sample']
+    )
+
+    assert generator.render(model, 'html') == html
+
+
+def test_markdown_and_text_renderers(model):
+    """Test every format renders from the same model"""
+    generator = HELDDashboardGenerator()
+
+    markdown = generator.render(model, 'markdown')
+    text = generator.render(model, 'text')
+
+    assert markdown.startswith('# Mario Test')
+    assert '| CBS | rs234706 | AA |' in markdown
+    assert 'Fosfatidylcholine' in text
+
+
+def test_unknown_format_rejected(model):
+    """Test an unknown output format raises"""
+    with pytest.raises(ValueError):
+        HELDDashboardGenerator().render(model, 'docx')
+
+
+def test_custom_renderer(model):
+    """Test renderers can be plugged in per generator"""
+    generator = HELDDashboardGenerator()
+    generator.renderers['names'] = lambda m: ','.join(v['gene'] for v in m.dna_variants)
+
+    assert generator.render(model, 'names') == 'MTHFR,CBS,PEMT'
+
+
+def test_from_dict_defaults_welldium_link():
+    """Test models can be rebuilt from partial dicts"""
+    model = DashboardModel.from_dict({
+        'patient_name': 'X', 'consult_date': '2025-01-01', 'biomarkers': [],
+        'dna_variants': [], 'critical_alerts': [], 'priorities': [],
+        'supplement_protocol': [], 'action_plan': [],
+    })
+
+    assert model.welldium_link == ''
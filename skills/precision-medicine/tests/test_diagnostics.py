@@ -0,0 +1,65 @@
+"""Tests for parser line-level diagnostics"""
+from parsers.blood_parser import BloodParser
+from parsers.diagnostics import ParseDiagnostics
+from parsers.dna_parser import DNAParser
+
+
+def test_blood_rejections_are_recorded():
+    """Test rejected blood lines keep line number, reason and snippet"""
+    diagnostics = ParseDiagnostics('blood.txt')
+    text = """
+Naam Waarde Range
+Invalid line
+HomocysteÏne + 18.0 Opt:<8.0 V.N 3.7-13.9 µmol/L
+Ferritine + abc 50-120:opt. µg/L"""
+
+    result = BloodParser().parse(text, diagnostics)
+
+    assert len(result) == 1
+    assert [(r.line_number, r.reason) for r in diagnostics.rejected] == [
+        (2, 'header'), (3, 'too_few_fields'), (5, 'no_value')
+    ]
+    assert diagnostics.rejected[1].snippet == 'Invalid line'
+    assert diagnostics.summary() == {
+        'source': 'blood.txt',
+        'lines': 4,
+        'parsed': 1,
+        'skipped': 2,
+        'reasons': {'header': 1, 'too_few_fields': 1, 'no_value': 1},
+    }
+
+
+def test_dna_rejections_are_recorded():
+    """Test rejected DNA lines report which field was missing"""
+    diagnostics = ParseDiagnostics('dna.txt')
+    text = """MTHFR rs1801133 AG [C677T] Up to 40% reduction
+lowercase rs123 AG
+COMT AG no rs number
+VDR rs1544410 XX bad genotype"""
+
+    result = DNAParser().parse(text, diagnostics)
+
+    assert len(result) == 1
+    assert [r.reason for r in diagnostics.rejected] == [
+        'no_gene', 'no_rs_number', 'no_genotype'
+    ]
+    assert diagnostics.skipped == 3
+
+
+def test_samples_are_bounded_but_counters_are_not():
+    """Test max_samples caps stored lines while counting all of them"""
+    diagnostics = ParseDiagnostics(max_samples=2)
+
+    DNAParser().parse('\n'.join(['bad line'] * 10), diagnostics)
+
+    assert len(diagnostics.rejected) == 2
+    assert diagnostics.reasons['no_gene'] == 10
+
+
+def test_snippet_is_truncated():
+    """Test very long lines are not stored in full"""
+    diagnostics = ParseDiagnostics()
+
+    DNAParser().parse('x' * 10000, diagnostics)
+
+    assert len(diagnostics.rejected[0].snippet) == 80
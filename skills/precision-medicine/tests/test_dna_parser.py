@@ -1,6 +1,7 @@
 """Tests for DNA methylation data parser"""
 import pytest
-from parsers.dna_parser import DNAParser
+from parsers.diagnostics import NO_GENOTYPE, ParseDiagnostics
+from parsers.dna_parser import MAX_CACHED_LINE_LENGTH, DNAParser
 
 
 def test_parse_single_variant():
@@ -103,3 +104,53 @@ def test_parse_no_variant_name():
     assert len(result) == 1
     assert result[0]['gene'] == 'COMT'
     assert result[0]['variant_name'] == ''
+
+
+def test_repeated_lines_hit_the_cache():
+    """Test identical lines across panels are parsed once"""
+    parser = DNAParser()
+    text = "MTHFR rs1801133 AG [C677T] Up to 40% reduction in gene function"
+
+    first = parser.parse(text)
+    second = parser.parse(text)
+
+    assert first == second
+    assert parser.cache_info().hits == 1
+    assert parser.cache_hit_rate == pytest.approx(0.5)
+
+
+def test_cached_variants_are_copies():
+    """Test mutating a returned variant does not leak into later parses"""
+    parser = DNAParser()
+    text = "COMT rs4680 AG Some impact"
+
+    parser.parse(text)[0]['severity'] = 'changed'
+
+    assert parser.parse(text)[0]['severity'] != 'changed'
+
+
+def test_cached_rejections_are_still_recorded():
+    """Test a rejected line is reported on every occurrence"""
+    parser = DNAParser()
+    diagnostics = ParseDiagnostics()
+
+    parser.parse("MTHFR rs1801133 geen genotype\nMTHFR rs1801133 geen genotype", diagnostics)
+
+    assert [r.reason for r in diagnostics.rejected] == [NO_GENOTYPE, NO_GENOTYPE]
+    assert parser.cache_info().hits == 1
+
+
+def test_long_lines_and_disabled_cache_bypass():
+    """Test overlong lines are not cached and cache_size=0 disables caching"""
+    parser = DNAParser(cache_size=2)
+    long_line = "MTHFR rs1801133 AG " + 'x' * MAX_CACHED_LINE_LENGTH
+
+    assert parser.parse(long_line)[0]['gene'] == 'MTHFR'
+    assert parser.cache_info().currsize == 0
+
+    parser.parse("A rs1 AG\nB rs2 AG\nC rs3 AG")
+    assert parser.cache_info().currsize == 2
+
+    disabled = DNAParser(cache_size=0)
+    disabled.parse("A rs1 AG\nA rs1 AG")
+    assert disabled.cache_info().hits == 0
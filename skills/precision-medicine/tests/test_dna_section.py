@@ -0,0 +1,76 @@
+"""Tests for the virtualized DNA section"""
+import json
+import re
+
+import dna_section
+from held_dashboard_generator import HELDDashboardGenerator
+from localization import get_catalog
+
+
+def _variants(count):
+    severities = ['info'] * 8 + ['warning', 'critical']
+    return [
+        {
+            'gene': f'GENE{i % 30}',
+            'rs_number': f'rs{1000 + i}',
+            'genotype': 'AG',
+            'variant_name': '',
+            'impact': 'Up to 40% reduction in gene function' if i % 2 else 'Unknown',
+            'severity': severities[i % len(severities)],
+        }
+        for i in range(count)
+    ]
+
+
+def _embedded(html):
+    match = re.search(r'<script type="application/json" id="dna-variants-data">(.*?)</script>', html, re.S)
+    return json.loads(match.group(1))
+
+
+def test_small_panels_render_cards():
+    """Test the 32-gene panel keeps one card per variant"""
+    html = HELDDashboardGenerator()._build_dna_html(_variants(32))
+
+    assert html.count('class="dna-card"') == 32
+    assert 'dna-variants-data' not in html
+
+
+def test_large_imports_are_virtualized():
+    """Test only flagged variants are server-rendered and all are embedded"""
+    variants = _variants(dna_section.VIRTUALIZE_THRESHOLD + 100)
+    html = HELDDashboardGenerator()._build_dna_html(variants)
+
+    flagged = [v for v in variants if v['severity'] != 'info']
+    assert html.count('class="dna-card"') == min(len(flagged), dna_section.MAX_SERVER_CARDS)
+    data = _embedded(html)
+    assert len(data['rows']) == len(variants)
+    assert len(data['impacts']) == 2
+
+
+def test_html_size_grows_slowly():
+    """Test per-variant cost is a compact JSON row, not a card"""
+    generator = HELDDashboardGenerator()
+    small = len(generator._build_dna_html(_variants(1000)))
+    large = len(generator._build_dna_html(_variants(11000)))
+
+    assert (large - small) / 10000 < 50
+
+
+def test_embedded_json_cannot_close_script():
+    """Test impact text cannot break out of the data element"""
+    variants = _variants(dna_section.VIRTUALIZE_THRESHOLD + 1)
+    variants[0]['impact'] = '</script><script>alert(1)</script>'
+
+    html = dna_section.build_virtual_dna_html(variants, lambda v: '')
+
+    assert _embedded(html)['impacts'][0] == variants[0]['impact']
+
+
+def test_filter_options_are_localized():
+    """Test the severity filter follows the dashboard language"""
+    variants = _variants(dna_section.VIRTUALIZE_THRESHOLD + 1)
+    html = HELDDashboardGenerator()._build_dna_html(variants, get_catalog('de'))
+
+    assert '<option value="critical">Kritisch</option>' in html
+    assert '<option value="warning">Warnung</option>' in html
+    assert '>Critical<' not in html
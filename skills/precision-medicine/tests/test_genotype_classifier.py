@@ -0,0 +1,98 @@
+"""Tests for batch genotype classification"""
+import random
+import time
+from array import array
+
+import pytest
+
+from parsers.dna_parser import DNAParser
+from parsers.genotype_classifier import (
+    NO_CALL, SEVERITIES, GenotypeClassifier, encode_genotype, encode_genotypes
+)
+
+GENES = ['MTHFR', 'CBS', 'PEMT', 'BHMT', 'COMT', 'VDR']
+GENOTYPES = [a + b for a in 'ACGT' for b in 'ACGT']
+
+
+def test_encode_genotype():
+    """Test two bits per allele"""
+    assert encode_genotype('AA') == 0
+    assert encode_genotype('AG') == 0b0010
+    assert encode_genotype('TT') == 0b1111
+    assert encode_genotypes(['AG', 'TT']) == bytes([2, 15])
+
+
+def test_classify_matches_determine_severity():
+    """Test every gene/rs/genotype combination agrees with the parser rules"""
+    classifier = GenotypeClassifier(GENES)
+    parser = DNAParser()
+    rows = [
+        (gene, rs, genotype)
+        for gene in GENES
+        for rs in (234706, 1801133)
+        for genotype in GENOTYPES
+    ]
+
+    codes = classifier.classify(
+        bytes(classifier.gene_ids[gene] for gene, _, _ in rows),
+        array('I', [rs for _, rs, _ in rows]),
+        encode_genotypes([genotype for _, _, genotype in rows])
+    )
+
+    for (gene, rs, genotype), code in zip(rows, codes):
+        expected = parser.determine_severity(gene, f"rs{rs}", genotype, '')
+        assert SEVERITIES[code] == expected, (gene, rs, genotype)
+
+
+def test_classify_600k_snps_quickly():
+    """Test a full raw genotype array classifies without a per-SNP Python loop"""
+    classifier = GenotypeClassifier(GENES)
+    rng = random.Random(0)
+    count = 600_000
+    gene_ids = bytes(rng.randrange(len(GENES)) for _ in range(count))
+    rs_ids = array('I', (rng.randrange(1, 5_000_000) for _ in range(count)))
+    genotypes = bytes(rng.randrange(16) for _ in range(count))
+    rs_ids[1234] = 234706
+
+    start = time.perf_counter()
+    codes = classifier.classify(gene_ids, rs_ids, genotypes)
+    elapsed = time.perf_counter() - start
+
+    assert len(codes) == count
+    # Takes ~10 ms; the bound only catches a fall back to per-SNP Python
+    assert elapsed < 1.0
+
+
+def test_classify_empty_and_mismatched():
+    """Test empty input and length mismatches"""
+    classifier = GenotypeClassifier(GENES)
+
+    assert classifier.classify(b'', array('I'), b'') == b''
+    with pytest.raises(ValueError):
+        classifier.classify(b'\x00', array('I'), b'')
+
+
+def test_no_calls_classify_as_info():
+    """Test no-calls in raw exports encode to NO_CALL and classify as info"""
+    classifier = GenotypeClassifier(GENES)
+    genotypes = encode_genotypes(['--', 'AG', '00', 'DI', 'AA'])
+    mthfr = classifier.gene_ids['MTHFR']
+    cbs = classifier.gene_ids['CBS']
+
+    codes = classifier.classify(
+        bytes([mthfr, mthfr, cbs, mthfr, cbs]),
+        array('I', [1801133, 1801133, 234706, 1801133, 234706]),
+        genotypes
+    )
+
+    assert genotypes[0] == genotypes[2] == genotypes[3] == NO_CALL
+    assert [SEVERITIES[c] for c in codes] == ['info', 'warning', 'info', 'info', 'critical']
+
+
+@pytest.mark.parametrize('code', [16, 20, 254])
+def test_invalid_genotype_codes_are_rejected(code):
+    """Test codes that do not fit the 4-bit packing raise instead of misclassifying"""
+    classifier = GenotypeClassifier(GENES)
+
+    with pytest.raises(ValueError, match='< 16'):
+        classifier.classify(b'\x00\x00', array('I', [1, 2]), bytes([2, code]))
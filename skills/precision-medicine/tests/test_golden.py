@@ -0,0 +1,64 @@
+"""Golden-file regression tests for rendered dashboards"""
+from golden import check_goldens, diff_trees, normalize, parse_html, synthetic_patients
+from held_dashboard_generator import HELDDashboardGenerator
+
+GOLDEN_COUNT = 12
+
+
+def test_dashboards_match_goldens():
+    """Test the synthetic corpus renders exactly as stored (python golden.py --update to refresh)"""
+    failures = check_goldens(HELDDashboardGenerator(), synthetic_patients(GOLDEN_COUNT))
+
+    assert failures == {}, '\n'.join(
+        f"{patient_id}: {differences[0]}" for patient_id, differences in failures.items()
+    )
+
+
+def test_normalization_ignores_formatting():
+    """Test whitespace, attribute order and comments do not matter"""
+    a = '<div class="x" id="y">\n  Hallo   wereld <!-- note --><br></div>'
+    b = '<div id="y" class="x">Hallo wereld<br/></div>'
+
+    assert normalize(a) == normalize(b)
+    assert parse_html(a).digest == parse_html(b).digest
+
+
+def test_normalized_form_round_trips():
+    """Test a stored golden parses back to the same tree"""
+    html = '<!DOCTYPE html><html><style>body { color: red; }</style><p>a &lt; b & <b>c</b></p></html>'
+    golden = normalize(html)
+
+    assert 'color: red' not in golden
+    assert parse_html(golden).digest == parse_html(html).digest
+
+
+def test_diff_reports_changes_with_paths():
+    """Test text, attribute, added and removed nodes are reported"""
+    before = parse_html('<div class="grid"><p class="a">een</p><p class="b">twee</p><span>x</span></div>')
+    after = parse_html('<div class="grid"><p class="a">EEN</p><p class="c">twee</p><em>y</em></div>')
+
+    differences = diff_trees(before, after)
+
+    assert "/div.grid[0]/p.a[0]/#text[0]: 'een' -> 'EEN'" in differences
+    assert "/div.grid[0]/p.b[1]: @class 'b' -> 'c'" in differences
+    assert any('removed <span>' in d for d in differences)
+    assert any('added <em>' in d for d in differences)
+
+
+def test_moved_subtrees_are_not_differences_inside():
+    """Test identical subtrees are matched by hash and never descended into"""
+    before = parse_html('<ul><li>a</li><li>b</li><li>c</li></ul>')
+    after = parse_html('<ul><li>c</li><li>a</li><li>b</li></ul>')
+
+    assert diff_trees(before, after) == []
+    assert diff_trees(before, parse_html('<ul><li>a</li><li>b</li><li>c</li></ul>')) == []
+
+
+def test_corpus_is_deterministic():
+    """Test the same seed gives the same corpus and larger counts extend it"""
+    small = synthetic_patients(5, seed=3)
+
+    assert synthetic_patients(5, seed=3) == small
+    assert synthetic_patients(8, seed=3)[:5] == small
+    assert synthetic_patients(5, seed=4) != small
+    assert {p['locale'] for p in synthetic_patients(GOLDEN_COUNT)} == {'nl', 'en', 'de'}
@@ -0,0 +1,114 @@
+"""Tests for concurrent patient source ingestion"""
+import json
+from pathlib import Path
+
+import ingest
+from held_dashboard_generator import HELDDashboardGenerator
+from ingest import PatientLoader, discover_sources, read_text
+
+
+def _write_patient(directory, test_data, blood_encoding='utf-8'):
+    directory.mkdir()
+    (directory / 'bloedwaarden.txt').write_bytes(test_data['blood_sample'].encode(blood_encoding))
+    (directory / 'dna_panel.txt').write_text(test_data['dna_sample'], encoding='utf-8')
+    (directory / 'consult_notes.md').write_text('Vermoeid, slaapt slecht', encoding='utf-8')
+    return directory
+
+
+def _test_data():
+    test_data_path = Path(__file__).parent / 'fixtures' / 'test_data.json'
+    with open(test_data_path, encoding='utf-8') as f:
+        return json.load(f)
+
+
+def test_read_text_encodings(tmp_path):
+    """Test UTF-8 (with BOM) and cp1252 files decode to the same text"""
+    text = 'HomocysteÏne + 18.0 Opt:<8.0 µmol/L'
+    (tmp_path / 'a.txt').write_bytes(b'\xef\xbb\xbf' + text.encode('utf-8'))
+    (tmp_path / 'b.txt').write_bytes(text.encode('cp1252'))
+
+    assert read_text(str(tmp_path / 'a.txt')) == text
+    assert read_text(str(tmp_path / 'b.txt')) == text
+
+
+def test_discover_sources(tmp_path):
+    """Test archive filenames map to source kinds"""
+    patient_dir = _write_patient(tmp_path / 'mario', _test_data())
+
+    sources = discover_sources(str(patient_dir))
+
+    assert set(sources) == {'blood', 'dna', 'notes'}
+    assert sources['blood'].endswith('bloedwaarden.txt')
+
+
+def test_load_patient(tmp_path):
+    """Test all sources are parsed into one record with diagnostics"""
+    test_data = _test_data()
+    patient_dir = _write_patient(tmp_path / 'mario', test_data, blood_encoding='cp1252')
+
+    record = PatientLoader().load('mario', discover_sources(str(patient_dir)))
+
+    assert record['patient_id'] == 'mario'
+    assert [b['name'] for b in record['biomarkers']] == ['HomocysteÏne', 'Ferritine', 'Vitamine D']
+    assert len(record['dna_variants']) == 3
+    assert record['consult_notes'] == 'Vermoeid, slaapt slecht'
+    assert record['diagnostics']['blood']['parsed'] == 3
+
+
+def test_load_many_yields_every_patient(tmp_path):
+    """Test a batch yields each patient exactly once"""
+    test_data = _test_data()
+    patients = {
+        f"p{i}": discover_sources(str(_write_patient(tmp_path / f"p{i}", test_data)))
+        for i in range(5)
+    }
+    patients['empty'] = {}
+
+    loaded = dict(PatientLoader(workers=4).load_many(patients))
+
+    assert set(loaded) == set(patients)
+    assert all(len(loaded[f"p{i}"]['dna_variants']) == 3 for i in range(5))
+    assert loaded['empty']['biomarkers'] == []
+
+
+def test_missing_file_is_recorded_not_raised(tmp_path):
+    """Test an unreadable file marks its patient and the batch continues"""
+    test_data = _test_data()
+    good = discover_sources(str(_write_patient(tmp_path / 'good', test_data)))
+    broken = dict(good, blood=str(tmp_path / 'ontbreekt.txt'))
+
+    loaded = dict(PatientLoader(workers=2).load_many({'broken': broken, 'good': good}))
+
+    assert set(loaded) == {'broken', 'good'}
+    assert 'FileNotFoundError' in loaded['broken']['errors']['blood']
+    assert len(loaded['broken']['dna_variants']) == 3
+    assert loaded['good']['errors'] == {}
+
+
+def test_load_many_bounds_reads_in_flight(tmp_path, monkeypatch):
+    """Test a slow consumer does not make every file of the batch be read"""
+    test_data = _test_data()
+    patients = {
+        f"p{i}": discover_sources(str(_write_patient(tmp_path / f"p{i}", test_data)))
+        for i in range(10)
+    }
+    reads = []
+    monkeypatch.setattr(ingest, 'read_text', lambda path: reads.append(path) or read_text(path))
+
+    batch = PatientLoader(workers=1).load_many(patients)
+    next(batch)
+
+    assert len(reads) <= 2 + 3
+    assert len(list(batch)) == 9
+    assert len(reads) == 30
+
+
+def test_default_blood_parser_uses_configured_thresholds(tmp_path):
+    """Test loader statuses match the dashboard generator for the same file"""
+    patient_dir = _write_patient(tmp_path / 'mario', _test_data())
+    sources = discover_sources(str(patient_dir))
+
+    record = PatientLoader().load('mario', sources)
+    expected = HELDDashboardGenerator().blood_parser.parse(read_text(sources['blood']))
+
+    assert record['biomarkers'] == expected
@@ -0,0 +1,59 @@
+"""Tests for the interaction checker"""
+import pytest
+
+from held_dashboard_generator import HELDDashboardGenerator
+from interactions import Interaction, InteractionChecker, medication_id, supplement_id
+
+
+def test_check_finds_pairs_in_either_order():
+    """Test the conflict matrix is symmetric"""
+    checker = InteractionChecker([
+        Interaction('supplement:zinc', 'supplement:copper', 'info', 'spacing'),
+    ])
+
+    assert [i.message for i in checker.check(['supplement:copper', 'supplement:zinc'])] == ['spacing']
+    assert checker.check(['supplement:zinc', 'supplement:iron']) == []
+
+
+def test_check_orders_by_severity():
+    """Test critical interactions come first"""
+    found = InteractionChecker().check([
+        supplement_id('magnesium'), supplement_id('vitamin_k2'),
+        medication_id('Levothyroxine'), medication_id('warfarine'),
+    ])
+
+    assert [i.severity for i in found] == ['critical', 'info']
+
+
+def test_unknown_severity_rejected():
+    """Test the library is validated when compiled"""
+    with pytest.raises(ValueError):
+        InteractionChecker([Interaction('a', 'b', 'severe', 'x')])
+
+
+def test_protocol_annotated_for_cbs_upregulation():
+    """Test the B-complex is flagged for CBS upregulation"""
+    generator = HELDDashboardGenerator()
+    dna_variants = [
+        {'gene': 'MTHFR', 'genotype': 'AG', 'rs_number': 'rs1801133', 'severity': 'warning'},
+        {'gene': 'CBS', 'genotype': 'AA', 'rs_number': 'rs234706', 'severity': 'critical'},
+    ]
+
+    protocol = generator.generate_supplement_protocol(dna_variants, [])
+
+    b_complex = next(p for p in protocol if p['name'] == 'Methylated B-Complex')
+    assert any('CBS upregulatie' in m for m in b_complex['interactions'])
+    zinc = next(p for p in protocol if p['name'] == 'Zink Bisglycinaat')
+    assert 'interactions' not in zinc
+
+
+def test_medications_annotate_protocol():
+    """Test medications are checked against the protocol"""
+    generator = HELDDashboardGenerator()
+    biomarkers = [{'name': 'Vitamine D', 'status': 'warning', 'value': 30.0, 'unit': 'ng/ml'}]
+
+    protocol = generator.generate_supplement_protocol([], biomarkers, medications=['Warfarine'])
+
+    assert 'warfarine' in protocol[0]['interactions'][0]
+    html = generator._build_supplements_html(protocol)
+    assert 'supplement-interactions' in html
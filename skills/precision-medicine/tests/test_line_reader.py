@@ -0,0 +1,59 @@
+"""Tests for the memory-mapped line reader"""
+import json
+from pathlib import Path
+
+from parsers.blood_parser import BloodParser
+from parsers.diagnostics import ParseDiagnostics
+from parsers.dna_parser import DNAParser
+from parsers.line_reader import has_digit, iter_lines
+
+
+def _test_data():
+    test_data_path = Path(__file__).parent / 'fixtures' / 'test_data.json'
+    with open(test_data_path, encoding='utf-8') as f:
+        return json.load(f)
+
+
+def test_iter_lines_numbers_and_line_endings(tmp_path):
+    """Test CRLF endings, blank lines and line numbering"""
+    path = tmp_path / 'a.txt'
+    path.write_bytes(b'first\r\n\r\nthird 3\r\nlast')
+
+    assert list(iter_lines(str(path))) == [(1, 'first'), (3, 'third 3'), (4, 'last')]
+
+
+def test_iter_lines_prefilter_skips_without_decoding(tmp_path):
+    """Test prefiltered lines are only counted in diagnostics"""
+    path = tmp_path / 'a.txt'
+    path.write_bytes(b'Hematologie\nFerritine + 307 \xb5g/L\n')
+    diagnostics = ParseDiagnostics()
+
+    lines = list(iter_lines(str(path), has_digit, diagnostics))
+
+    # \xb5 is cp1252 for the micro sign, decoded per line after UTF-8 fails
+    assert lines == [(2, 'Ferritine + 307 µg/L')]
+    assert diagnostics.reasons['prefiltered'] == 1
+    assert diagnostics.skipped == 0
+
+
+def test_iter_lines_bom_and_empty_file(tmp_path):
+    """Test a UTF-8 BOM is dropped and empty files yield nothing"""
+    (tmp_path / 'bom.txt').write_bytes(b'\xef\xbb\xbfHomocyste\xc3\x8fne 1')
+    (tmp_path / 'empty.txt').write_bytes(b'')
+    (tmp_path / 'utf16.txt').write_text('HomocysteÏne 1\nx', encoding='utf-16')
+
+    assert list(iter_lines(str(tmp_path / 'bom.txt'))) == [(1, 'HomocysteÏne 1')]
+    assert list(iter_lines(str(tmp_path / 'empty.txt'))) == []
+    assert list(iter_lines(str(tmp_path / 'utf16.txt'))) == [(1, 'HomocysteÏne 1'), (2, 'x')]
+
+
+def test_parse_file_matches_parse(tmp_path):
+    """Test file parsing gives the same records as parsing the text"""
+    test_data = _test_data()
+    blood_path = tmp_path / 'blood.txt'
+    dna_path = tmp_path / 'dna.txt'
+    blood_path.write_text('Naam Waarde Range\n' + test_data['blood_sample'], encoding='utf-8')
+    dna_path.write_text(test_data['dna_sample'] + '\nFooter text', encoding='utf-8')
+
+    assert BloodParser().parse_file(str(blood_path)) == BloodParser().parse(test_data['blood_sample'])
+    assert DNAParser().parse_file(str(dna_path)) == DNAParser().parse(test_data['dna_sample'])
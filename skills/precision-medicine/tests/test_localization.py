@@ -0,0 +1,100 @@
+"""Tests for the compiled localization catalogs"""
+import json
+from pathlib import Path
+
+import pytest
+
+import localization
+from action_plan import HIGH_HOMOCYSTEINE, resolve_plan
+from held_dashboard_generator import HELDDashboardGenerator
+from localization import Catalog, available_locales, get_catalog
+
+
+def _model(generator, locale=None):
+    fixtures_path = Path(__file__).parent / 'fixtures' / 'test_data.json'
+    data = json.loads(fixtures_path.read_text(encoding='utf-8'))
+    return generator.build_model(
+        patient_name=data['patient_name'],
+        consult_date=data['consult_date'],
+        consult_notes="",
+        blood_data=data['blood_sample'],
+        dna_data=data['dna_sample'],
+        locale=locale
+    )
+
+
+def test_messages_are_compiled_once():
+    """Test plain messages are stored as strings and placeholders are filled"""
+    catalog = Catalog('xx', {'plain': 'Hallo {{naam}}', 'field': '{count} van {total:>3}'})
+
+    assert catalog._messages['plain'] == 'Hallo {naam}'
+    assert catalog('plain') == 'Hallo {naam}'
+    assert catalog('field', count=2, total=10) == '2 van  10'
+
+
+def test_missing_messages_fall_back_to_dutch():
+    """Test a catalog without a message uses the Dutch text"""
+    catalog = Catalog('xx', {'html.lang': 'xx'}, fallback=get_catalog('nl'))
+
+    assert catalog('html.lang') == 'xx'
+    assert catalog('supplements.none') == get_catalog()('supplements.none')
+
+
+def test_catalogs_define_the_same_messages():
+    """Test every shipped locale translates every Dutch message"""
+    source = json.loads((localization.LOCALES_DIR / 'nl.json').read_text(encoding='utf-8'))
+
+    assert available_locales() == ['de', 'en', 'nl']
+    for locale in available_locales():
+        messages = json.loads((localization.LOCALES_DIR / f'{locale}.json').read_text(encoding='utf-8'))
+        assert set(messages) == set(source), locale
+
+
+def test_unknown_locale_raises():
+    """Test an unknown locale is rejected"""
+    with pytest.raises(ValueError, match='Unknown locale'):
+        get_catalog('xx')
+
+
+def test_catalog_is_loaded_once():
+    """Test repeated lookups reuse the compiled catalog"""
+    assert get_catalog('en') is get_catalog('en')
+    assert get_catalog() is get_catalog('nl')
+
+
+def test_plan_is_memoized_per_locale():
+    """Test the same conditions resolve to a plan per language"""
+    conditions = frozenset({HIGH_HOMOCYSTEINE})
+
+    assert resolve_plan(conditions)[0]['phase'].startswith('Fase 1')
+    assert resolve_plan(conditions, 'en')[0]['phase'].startswith('Phase 1')
+    assert resolve_plan(conditions, 'de')[0]['actions'][0]['icon'] == '🥚'
+
+
+def test_english_and_german_dashboards():
+    """Test the dashboard chrome, alerts, protocol and plan are translated"""
+    generator = HELDDashboardGenerator()
+
+    english = generator.render(_model(generator, 'en'), 'html')
+    german = generator.render(_model(generator, 'de'), 'html')
+
+    assert '<html lang="en">' in english
+    assert get_catalog('en')('section.plan.title') in english
+    assert get_catalog('en')('alert.ferritin.title_high') in english
+    assert 'Alle rechten voorbehouden' not in english
+    assert '<html lang="de">' in german
+    assert get_catalog('de')('section.supplements.title') in german
+
+
+def test_mixed_locale_batch():
+    """Test models in different languages do not affect each other"""
+    generator = HELDDashboardGenerator()
+    dutch = _model(generator)
+    english = _model(generator, 'en')
+    dutch_again = _model(generator)
+
+    assert dutch.supplement_protocol[0]['time_label'] == 'Ochtend (nuchter)'
+    assert english.supplement_protocol[0]['time_label'] != 'Ochtend (nuchter)'
+    assert dutch == dutch_again
+    assert generator.render(english, 'text') != generator.render(dutch, 'text')
+    assert 'Consult Datum' in generator.render(dutch, 'markdown')
@@ -0,0 +1,49 @@
+"""Tests for multilingual biomarker name resolution"""
+from parsers.markers import MarkerResolver, fold, resolve_marker
+
+
+def test_fold_strips_accents_and_punctuation():
+    """Test accent folding and punctuation collapsing"""
+    assert fold('HomocysteÏne') == 'homocysteine'
+    assert fold('25-OH Vit. D') == '25 oh vit d'
+    assert fold('Ferritin (serum)') == 'ferritin serum'
+
+
+def test_resolve_lab_variants():
+    """Test lab spelling variants resolve to the canonical key"""
+    assert resolve_marker('HomocysteÏne') == 'homocysteine'
+    assert resolve_marker('Hcy') == 'homocysteine'
+    assert resolve_marker('Ferritine') == 'ferritin'
+    assert resolve_marker('Ferritin (serum)') == 'ferritin'
+    assert resolve_marker('25-OH Vit D') == 'vitamin_d'
+    assert resolve_marker('Vitamine D') == 'vitamin_d'
+    assert resolve_marker('hs-CRP') == 'crp'
+    assert resolve_marker('Folsäure') == 'folate'
+
+
+def test_resolve_requires_whole_words():
+    """Test aliases do not match inside other words"""
+    assert resolve_marker('Vitamine B12') == 'vitamin_b12'
+    assert resolve_marker('Vitamine Dx') is None
+    assert resolve_marker('Zincum') is None
+    assert resolve_marker('Onbekend') is None
+
+
+def test_longest_alias_wins():
+    """Test the longest matching alias is preferred"""
+    resolver = MarkerResolver({'short': ('vit',), 'long': ('vit d',)})
+
+    assert resolver.resolve('Vit D') == 'long'
+    assert resolver.resolve('Vit') == 'short'
+
+
+def test_resolution_is_cached():
+    """Test repeated names are served from the cache"""
+    resolver = MarkerResolver()
+
+    for _ in range(1000):
+        resolver.resolve('HomocysteÏne')
+
+    assert resolver.cache_info().hits == 999
+    assert resolver.cache_hit_rate == 0.999
+    assert MarkerResolver().cache_hit_rate == 0.0
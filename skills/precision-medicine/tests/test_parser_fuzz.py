@@ -0,0 +1,58 @@
+"""Fuzz and worst-case timing tests for the line parsers"""
+import time
+
+from parser_fuzz import LINE_BUDGET, MAX_LINE_LENGTH, adversarial_lines, fuzz, fuzz_parsers
+from parsers.blood_parser import BloodParser
+
+# The CLI enforces LINE_BUDGET; the suite only catches super-linear
+# regressions (those take seconds), so loaded CI machines do not flake
+TEST_BUDGET = LINE_BUDGET * 10
+
+
+def test_no_line_raises_or_exceeds_budget():
+    """Test adversarial lines never raise and none parses super-linearly"""
+    for name, report in fuzz_parsers(count=200).items():
+        assert report.errors == [], name
+        assert report.worst_seconds < TEST_BUDGET, (
+            f"{name}: {report.worst_seconds * 1000:.1f} ms for {report.worst_line[:60]!r}..."
+        )
+
+
+def test_long_digit_run_is_linear():
+    """Test the ':opt'/':VN' range patterns do not backtrack over long digit runs"""
+    parser = BloodParser()
+    line = 'Ferritine + 307 ' + '1' * MAX_LINE_LENGTH
+
+    started = time.perf_counter()
+    parser._parse_line(line)
+
+    assert time.perf_counter() - started < TEST_BUDGET
+
+
+def test_range_and_unit_extraction_unchanged():
+    """Test anchoring the patterns keeps the extracted ranges and unit"""
+    biomarker = BloodParser()._parse_line('Ferritine + 307 50-120:opt. 22-322:VN µg/L')
+
+    assert biomarker['optimal_range'] == '50-120'
+    assert biomarker['normal_range'] == '22-322'
+    assert biomarker['unit'] == 'µg/L'
+
+
+def test_corpus_is_deterministic():
+    """Test the same seed yields the same adversarial lines"""
+    first = list(adversarial_lines(count=20, max_length=500, seed=7))
+
+    assert first == list(adversarial_lines(count=20, max_length=500, seed=7))
+    assert max(len(line) for line in first) <= 500
+
+
+def test_fuzz_records_errors():
+    """Test exceptions are collected instead of aborting the run"""
+    def parse_line(line):
+        if 'x' in line:
+            raise KeyError(line)
+
+    report = fuzz(parse_line, iter(['a', 'x', 'b']))
+
+    assert report.lines == 3
+    assert report.errors == ["KeyError: 'x'"]
@@ -0,0 +1,90 @@
+"""Tests for pathway scoring"""
+import json
+import time
+from pathlib import Path
+
+from cohort import Cohort
+from parsers.blood_parser import BloodParser
+from parsers.dna_parser import DNAParser
+from pathways import PathwayScorer, patient_features
+
+
+def _config():
+    config_path = Path(__file__).parent.parent / 'config' / 'brand_config.json'
+    with open(config_path, encoding='utf-8') as f:
+        return json.load(f)
+
+
+def _mario():
+    test_data_path = Path(__file__).parent / 'fixtures' / 'test_data.json'
+    with open(test_data_path, encoding='utf-8') as f:
+        test_data = json.load(f)
+    return (
+        BloodParser().parse(test_data['blood_sample']),
+        DNAParser().parse(test_data['dna_sample'])
+    )
+
+
+def test_patient_features():
+    """Test variants and biomarkers become feature names"""
+    biomarkers, dna_variants = _mario()
+
+    features = patient_features(biomarkers, dna_variants)
+
+    assert 'PEMT:TT' in features
+    assert 'CBS:rs234706:AA' in features
+    assert 'homocysteine:critical' in features
+
+
+def test_score_mario():
+    """Test Mario's pathway scores from the config weights"""
+    scorer = PathwayScorer.from_config(_config())
+
+    scores = scorer.score(*_mario())
+
+    assert scores == {
+        'methylation': 3.0,
+        'transsulfuration': 2.5,
+        'choline': 2.0,
+        'catecholamine': 0.0,
+    }
+
+
+def test_mthfr_homozygous_weights_are_per_snp():
+    """Test only the risk homozygote of each MTHFR SNP gets the double weight"""
+    scorer = PathwayScorer.from_config(_config())
+
+    def methylation(rs_number, genotype):
+        variant = {'gene': 'MTHFR', 'rs_number': rs_number, 'genotype': genotype, 'severity': 'info'}
+        return scorer.score([], [variant])['methylation']
+
+    assert methylation('rs1801131', 'AA') == 0.0
+    assert methylation('rs1801131', 'TT') == 0.0
+    assert methylation('rs1801131', 'GG') == 2.0
+    assert methylation('rs1801133', 'AA') == 2.0
+    assert methylation('rs1801133', 'AG') == 1.0
+
+
+def test_weight_change_rescoring():
+    """Test a new weight matrix changes scores without re-parsing"""
+    scorer = PathwayScorer({'choline': {'PEMT:TT': 5.0}})
+
+    assert scorer.score(*_mario()) == {'choline': 5.0}
+
+
+def test_score_cohort_100k_patients():
+    """Test cohort-wide re-scoring over 100k patients stays within seconds"""
+    biomarkers, dna_variants = _mario()
+    cohort = Cohort()
+    for i in range(100_000):
+        cohort.add_patient(str(i), biomarkers if i % 2 else [], dna_variants)
+    scorer = PathwayScorer.from_config(_config())
+
+    start = time.perf_counter()
+    scores = scorer.score_cohort(cohort)
+    elapsed = time.perf_counter() - start
+
+    assert len(scores) == 100_000
+    assert scores[1] == (3.0, 2.5, 2.0, 0.0)
+    assert scores[0] == (1.0, 2.0, 2.0, 0.0)
+    assert elapsed < 5.0
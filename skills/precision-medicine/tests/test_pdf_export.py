@@ -0,0 +1,116 @@
+"""Tests for the PDF export pipeline"""
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from types import SimpleNamespace
+
+import pytest
+
+import pdf_export
+from pdf_export import export_pdfs, select_dashboards, strip_inline_css
+from template_builder import get_css
+
+
+def test_select_dashboards_by_month(tmp_path):
+    """Test month filter uses the save_dashboard timestamp"""
+    for name in [
+        'Mario_Test_HELD_Dashboard_20251105.html',
+        'Anna_HELD_Dashboard_20251130.html',
+        'Jan_HELD_Dashboard_20251201.html',
+        'notes.html',
+    ]:
+        (tmp_path / name).write_text('<html></html>')
+
+    november = select_dashboards(str(tmp_path), month='2025-11')
+
+    assert [p.name for p in november] == [
+        'Anna_HELD_Dashboard_20251130.html',
+        'Mario_Test_HELD_Dashboard_20251105.html',
+    ]
+    assert len(select_dashboards(str(tmp_path))) == 4
+
+
+def test_strip_inline_css():
+    """Test the embedded stylesheet is removed once"""
+    css = get_css()
+    html = f"<html><head><style>{css}</style></head><body></body></html>"
+
+    stripped = strip_inline_css(html, css)
+
+    assert css not in stripped
+    assert '<style></style>' in stripped
+
+
+def test_missing_weasyprint_reports_install_hint(tmp_path):
+    """Test a clear error when the optional renderer is not installed"""
+    try:
+        import weasyprint  # noqa: F401
+        pytest.skip("WeasyPrint is installed")
+    except ImportError:
+        pass
+
+    with pytest.raises(ImportError, match='pip install weasyprint'):
+        list(export_pdfs([], str(tmp_path)))
+
+
+def _stub_weasyprint(rendered):
+    """Minimal WeasyPrint stand-in recording what would be rendered"""
+    class HTML:
+        def __init__(self, string, base_url):
+            self.string = string
+
+        def write_pdf(self, f, stylesheets):
+            if 'kapot' in self.string:
+                raise RuntimeError('layout failed')
+            rendered.append((self.string, stylesheets))
+            f.write(b'%PDF-stub')
+
+    return SimpleNamespace(HTML=HTML, CSS=lambda string: ('stylesheet', len(string)))
+
+
+@pytest.fixture
+def stub_renderer(monkeypatch):
+    """Run export_pdfs in threads against the stub renderer"""
+    rendered = []
+    weasyprint = _stub_weasyprint(rendered)
+    monkeypatch.setattr(pdf_export, '_load_weasyprint', lambda: weasyprint)
+    monkeypatch.setattr(pdf_export, '_worker_state', {})
+    monkeypatch.setattr(pdf_export, 'ProcessPoolExecutor', ThreadPoolExecutor)
+    return rendered
+
+
+def test_render_uses_cached_stylesheet(tmp_path, stub_renderer):
+    """Test the inline HELD stylesheet is stripped and passed pre-parsed instead"""
+    css = get_css()
+    (tmp_path / 'a.html').write_text(f"<html><style>{css}</style><body>A</body></html>", encoding='utf-8')
+    (tmp_path / 'b.html').write_text("<html><style>p {}</style><body>B</body></html>", encoding='utf-8')
+
+    pdf_path, size = pdf_export._render(str(tmp_path / 'a.html'), str(tmp_path / 'a.pdf'))
+    pdf_export._render(str(tmp_path / 'b.html'), str(tmp_path / 'b.pdf'))
+
+    assert pdf_path.endswith('a.pdf')
+    assert size == len(b'%PDF-stub')
+    (html_a, sheets_a), (html_b, sheets_b) = stub_renderer
+    assert css not in html_a
+    assert sheets_a == [('stylesheet', len(css))]
+    assert 'p {}' in html_b
+    assert sheets_b == []
+
+
+def test_failed_document_does_not_abort_batch(tmp_path, stub_renderer):
+    """Test one failing dashboard is reported and the others are still exported"""
+    paths = []
+    for name in ('a', 'kapot', 'c', 'd'):
+        path = tmp_path / f"{name}.html"
+        path.write_text(f"<html><body>{name}</body></html>", encoding='utf-8')
+        paths.append(path)
+    paths.append(tmp_path / 'ontbreekt.html')
+
+    results = {
+        Path(pdf_path).stem: (size, error)
+        for pdf_path, size, error in export_pdfs(paths, str(tmp_path / 'pdf'), workers=1)
+    }
+
+    assert set(results) == {'a', 'kapot', 'c', 'd', 'ontbreekt'}
+    assert results['kapot'] == (0, 'RuntimeError: layout failed')
+    assert results['ontbreekt'][1].startswith('FileNotFoundError')
+    assert all(results[name] == (len(b'%PDF-stub'), None) for name in ('a', 'c', 'd'))
@@ -0,0 +1,120 @@
+"""Tests for the priority engine"""
+import pytest
+
+from held_dashboard_generator import HELDDashboardGenerator
+from priorities import MAX_DEVIATION, PriorityEngine, deviation
+
+
+def _marker(name, value, optimal_range, status, unit='x'):
+    return {'name': name, 'value': value, 'unit': unit, 'optimal_range': optimal_range, 'status': status}
+
+
+def test_deviation_is_relative_and_signed():
+    """Test deviation from one-sided and two-sided ranges"""
+    assert deviation('<8.0', 18.0) == pytest.approx(1.25)
+    assert deviation('45-60', 36.0) == pytest.approx(-0.2)
+    assert deviation('>30', 40.0) == 0.0
+    assert deviation('n.v.t.', 5.0) == 0.0
+
+
+def test_scores_weigh_severity_marker_and_deviation():
+    """Test a critical, heavily weighted, far-off marker scores highest"""
+    engine = PriorityEngine()
+    scores = engine.score_biomarkers([
+        _marker('Homocysteïne', 18.0, '<8.0', 'critical'),
+        _marker('Vitamine D', 39.7, '45-60', 'warning'),
+        _marker('Onbekend', 15.0, '10-20', 'optimal'),
+    ])
+
+    assert scores[0] == pytest.approx(3.0 * 3.0 * 2.25)
+    assert 0 < scores[1] < scores[0]
+    assert scores[2] == 0.0
+
+
+def test_extreme_deviation_is_capped():
+    """Test one extreme value cannot exceed the deviation cap"""
+    engine = PriorityEngine(marker_weights={})
+    score = engine.score_biomarkers([_marker('X', 1e6, '<1', 'critical')])[0]
+
+    assert score == pytest.approx(3.0 * (1 + MAX_DEVIATION))
+
+
+def test_variant_scores_use_pathway_weights():
+    """Test variant features weighted in the config rank above unweighted ones"""
+    engine = PriorityEngine.from_config({'pathway_weights': {'choline': {'PEMT:TT': 2.0}}})
+    variants = [
+        {'gene': 'ABC', 'rs_number': 'rs1', 'genotype': 'TT', 'severity': 'warning'},
+        {'gene': 'PEMT', 'rs_number': 'rs7946', 'genotype': 'TT', 'severity': 'warning'},
+    ]
+
+    scores = engine.score_variants(variants)
+
+    assert scores == [pytest.approx(1.5), pytest.approx(4.5)]
+
+
+def test_top_k_across_biomarkers_and_variants():
+    """Test the heap returns the k best findings, highest first"""
+    engine = PriorityEngine()
+    panel = [_marker(f'M{i}', 100 + i / 10, '<100', 'warning') for i in range(1, 201)]
+    variants = [{'gene': 'CBS', 'rs_number': 'rs234706', 'genotype': 'AA', 'severity': 'info'}]
+
+    top = engine.top_priorities(panel, variants, k=3)
+
+    assert [p['name'] for p in top] == ['M200', 'M199', 'M198']
+    assert len(engine.top_priorities(panel[:2], variants, k=10)) == 3
+
+
+def test_alerts_cover_any_marker():
+    """Test markers beyond the original three produce ranked alerts"""
+    generator = HELDDashboardGenerator()
+    biomarkers = [
+        _marker('Vitamine D', 39.7, '45-60', 'warning', 'ng/ml'),
+        _marker('CRP', 12.0, '<1.0', 'critical', 'mg/L'),
+        _marker('TSH', 2.0, '0.5-2.5', 'optimal', 'mU/L'),
+        _marker('Zink', 3.0, '12-18', 'warning', 'µmol/L'),
+    ]
+
+    alerts = generator.identify_critical_alerts(biomarkers)
+
+    assert [a['marker'].split(':')[0] for a in alerts] == ['CRP', 'Zink', 'Vitamine D']
+    assert alerts[0]['title'] == 'Verhoogd CRP'
+    assert alerts[0]['icon'] == '🔴'
+    assert alerts[1]['title'] == 'Verlaagd Zink'
+    assert alerts[2]['title'] == 'Vitamine D Deficiëntie'
+
+
+def test_generator_priorities():
+    """Test generate_priorities is no longer a stub"""
+    generator = HELDDashboardGenerator()
+    biomarkers = [_marker('HomocysteÏne', 18.0, '<8.0', 'critical', 'µmol/L')]
+    variants = [{'gene': 'CBS', 'rs_number': 'rs234706', 'genotype': 'AA', 'severity': 'critical'}]
+
+    priorities = generator.generate_priorities(biomarkers, variants)
+
+    assert [p['kind'] for p in priorities] == ['biomarker', 'variant']
+    assert priorities[0]['label'] == 'HomocysteÏne: 18.0 µmol/L'
+
+
+def test_alert_direction_falls_back_to_lab_flag():
+    """Test a low-flagged marker without a range is titled low, without an optimal line"""
+    generator = HELDDashboardGenerator()
+    marker = _marker('Hemoglobine', 7.1, '', 'critical', 'mmol/L')
+    marker['flag'] = '-'
+
+    alert = generator.identify_critical_alerts([marker])[0]
+
+    assert alert['title'] == 'Verlaagd Hemoglobine'
+    assert alert['optimal'] == ''
+    assert '()' not in generator._build_alerts_html([alert])
+
+
+def test_low_ferritin_is_not_titled_inflammation():
+    """Test marker-specific titles follow the direction of the deviation"""
+    generator = HELDDashboardGenerator()
+
+    low = generator.identify_critical_alerts([_marker('Ferritine', 5.0, '30-150', 'critical', 'µg/L')])[0]
+    high = generator.identify_critical_alerts([_marker('Ferritine', 307.0, '50-120', 'warning', 'µg/L')])[0]
+
+    assert low['title'] == 'Lage IJzervoorraad'
+    assert 'ijzertekort' in low['description']
+    assert high['title'] == 'Verhoogd Inflammatieprofiel'
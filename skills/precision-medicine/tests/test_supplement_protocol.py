@@ -0,0 +1,53 @@
+"""Tests for the memoized supplement protocol"""
+import supplement_protocol
+from held_dashboard_generator import HELDDashboardGenerator
+from supplement_protocol import (
+    CBS_UPREGULATION, LOW_VITAMIN_D, MTHFR, PEMT_TT, resolve_protocol
+)
+
+
+def test_condition_mask_from_parsed_data():
+    """Test the generator packs conditions into a bitmask"""
+    generator = HELDDashboardGenerator()
+    dna_variants = [
+        {'gene': 'PEMT', 'genotype': 'TT', 'rs_number': 'rs7946', 'severity': 'warning'},
+        {'gene': 'CBS', 'genotype': 'AA', 'rs_number': 'rs234706', 'severity': 'critical'},
+    ]
+    biomarkers = [{'name': 'Vitamine D', 'status': 'warning', 'value': 39.7, 'unit': 'ng/ml'}]
+
+    mask = generator._protocol_conditions(dna_variants, biomarkers)
+
+    assert mask == PEMT_TT | CBS_UPREGULATION | LOW_VITAMIN_D
+
+
+def test_protocol_is_memoized_per_mask():
+    """Test patients with the same conditions reuse one rule evaluation"""
+    mask = PEMT_TT | MTHFR | CBS_UPREGULATION
+    resolve_protocol(mask)
+    before = supplement_protocol.cache_info()
+
+    for value in (20.0, 30.0, 40.0):
+        resolve_protocol(mask, {'value': value, 'unit': 'ng/ml'})
+
+    after = supplement_protocol.cache_info()
+    assert after.hits == before.hits + 3
+    assert after.misses == before.misses
+
+
+def test_vitamin_d_value_is_patched_per_patient():
+    """Test only the measured value differs between patients"""
+    first = resolve_protocol(LOW_VITAMIN_D, {'value': 20.0, 'unit': 'ng/ml'})
+    second = resolve_protocol(LOW_VITAMIN_D, {'value': 39.7, 'unit': 'ng/ml'})
+
+    assert first[0]['reason'].startswith('Huidige waarde 20.0 ng/ml')
+    assert second[0]['reason'].startswith('Huidige waarde 39.7 ng/ml')
+    assert resolve_protocol(LOW_VITAMIN_D)[0]['reason'].startswith('Vloeibare vorm')
+
+
+def test_cbs_upregulation_delays_b_complex():
+    """Test the B-complex becomes FASE 2 with CBS upregulation"""
+    protocol = resolve_protocol(MTHFR | CBS_UPREGULATION)
+
+    b_complex = next(p for p in protocol if p['name'] == 'Methylated B-Complex')
+    assert b_complex['badge'] == 'FASE 2'
+    assert [p['time'] for p in protocol] == sorted(p['time'] for p in protocol)
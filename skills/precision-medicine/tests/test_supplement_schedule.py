@@ -0,0 +1,77 @@
+"""Tests for the supplement timing scheduler"""
+import pytest
+
+import supplement_schedule
+from supplement_protocol import resolve_protocol
+from supplement_schedule import schedule_protocol
+
+
+def _item(name, time):
+    return {'name': name, 'time': time, 'time_label': '', 'dosage': '', 'reason': '', 'badge': 'KERN'}
+
+
+def test_proposed_times_kept_when_allowed():
+    """Test the generated protocol keeps its proposed times"""
+    protocol = resolve_protocol(0xFF)
+
+    assert schedule_protocol(protocol) == protocol
+
+
+def test_zinc_and_copper_spaced_apart():
+    """Test competing minerals are moved to different meals"""
+    scheduled = schedule_protocol([
+        _item('Zink Bisglycinaat', '12:30'),
+        _item('Koper Bisglycinaat', '12:30'),
+    ])
+
+    assert [s['time'] for s in scheduled] == ['08:00', '12:30']
+    assert scheduled[0]['time_label'] == 'Bij Ontbijt'
+
+
+def test_food_and_period_rules_applied():
+    """Test items proposed at a disallowed time move to the nearest valid slot"""
+    scheduled = schedule_protocol([
+        _item('Vitamine D3 + K2 (vloeibaar)', '07:30'),
+        _item('Trimethylglycine (TMG/Betaine)', '08:00'),
+    ])
+
+    times = {s['name']: s['time'] for s in scheduled}
+    assert times['Vitamine D3 + K2 (vloeibaar)'] == '08:00'
+    assert times['Trimethylglycine (TMG/Betaine)'] == '18:30'
+
+
+def test_slot_capacity(monkeypatch):
+    """Test a full slot pushes the next item to another slot"""
+    monkeypatch.setattr(supplement_schedule, 'MAX_PER_SLOT', 1)
+    supplement_schedule._solve.cache_clear()
+    try:
+        scheduled = schedule_protocol([
+            _item('Magnesium Glycinaat', '15:00'),
+            _item('Methylated B-Complex', '15:00'),
+        ])
+    finally:
+        supplement_schedule._solve.cache_clear()
+
+    assert len({s['time'] for s in scheduled}) == 2
+
+
+def test_unsatisfiable_schedule_raises(monkeypatch):
+    """Test an impossible set of constraints is reported"""
+    monkeypatch.setattr(supplement_schedule, 'MAX_PER_SLOT', 0)
+    supplement_schedule._solve.cache_clear()
+    try:
+        with pytest.raises(ValueError):
+            schedule_protocol([_item('Zink Bisglycinaat', '12:30')])
+    finally:
+        supplement_schedule._solve.cache_clear()
+
+
+def test_schedule_memoized_per_supplement_set():
+    """Test the same protocol is solved once"""
+    protocol = resolve_protocol(0x0F)
+    schedule_protocol(protocol)
+    before = supplement_schedule.cache_info()
+
+    schedule_protocol(list(reversed(protocol)))
+
+    assert supplement_schedule.cache_info().hits == before.hits + 1
@@ -0,0 +1,83 @@
+"""Tests for the brand theme registry"""
+import json
+from pathlib import Path
+
+import pytest
+
+from held_dashboard_generator import HELDDashboardGenerator
+from template_builder import get_css
+from themes import ThemeRegistry, compile_brand_profile, parse_brand_profile
+
+PROFILE = """# 🔶 Test Clinic Brand Profile
+
+| Role | Tailwind | Hex |
+|------|----------|-----|
+| Primary | `orange-500` | `#f97316` |
+| Primary Dark | `orange-600` | `#EA580C` |
+| Accent | `blue-500` | `#3B82F6` |
+
+```css
+font-family: 'Geist', sans-serif;
+```
+"""
+
+
+def _render(generator, brand=None):
+    fixtures_path = Path(__file__).parent / 'fixtures' / 'test_data.json'
+    data = json.loads(fixtures_path.read_text(encoding='utf-8'))
+    return generator.generate_dashboard(
+        patient_name=data['patient_name'],
+        consult_date=data['consult_date'],
+        consult_notes='',
+        blood_data=data['blood_sample'],
+        dna_data=data['dna_sample'],
+        brand=brand
+    )
+
+
+def test_parse_brand_profile():
+    """Test name, colors and font are read from a profile"""
+    profile = parse_brand_profile(PROFILE)
+
+    assert profile['name'] == 'Test Clinic'
+    assert profile['colors']['primary'] == '#F97316'
+    assert profile['colors']['primary_dark'] == '#EA580C'
+    assert profile['font_family'] == "'Geist', sans-serif"
+
+
+def test_compiled_css_uses_brand_tokens():
+    """Test brand colors replace the HELD colors throughout"""
+    theme = compile_brand_profile('test-clinic', PROFILE)
+
+    assert '--jungle-green: #F97316;' in theme.css
+    assert '--american-orange: #3B82F6;' in theme.css
+    assert 'rgba(52, 178, 123,' not in theme.css
+    assert "font-family: 'Geist', sans-serif;" in theme.css
+
+
+def test_registry_loads_aura_brands():
+    """Test every aura-design brand profile is registered next to HELD"""
+    registry = ThemeRegistry.from_config({'brand_name': 'HELD', 'tagline': 'x'})
+
+    assert registry.ids()[0] == 'held'
+    assert {'d-business', 'reconnect-academy', 'custom-mobile'} <= set(registry.ids())
+    # HELD keeps the dashboard stylesheet from the brand config
+    assert registry.get('held').css == get_css()
+
+
+def test_unknown_brand_rejected():
+    """Test an unknown brand id raises"""
+    with pytest.raises(ValueError):
+        ThemeRegistry.from_config({}, brands_dir=None).get('nope')
+
+
+def test_brand_per_dashboard():
+    """Test one generator renders different brands without recompiling"""
+    generator = HELDDashboardGenerator()
+
+    held = _render(generator)
+    other = _render(generator, brand='d-business')
+
+    assert '<div class="logo">HELD</div>' in held
+    assert '<div class="logo">D-Business</div>' in other
+    assert generator.themes.get('d-business').css in other
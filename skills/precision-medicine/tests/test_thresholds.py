@@ -0,0 +1,97 @@
+"""Tests for config-driven status thresholds"""
+import json
+from pathlib import Path
+
+import pytest
+
+from parsers.blood_parser import BloodParser
+from parsers.thresholds import ThresholdEngine, evaluated_range
+
+
+def _engine():
+    config_path = Path(__file__).parent.parent / 'config' / 'brand_config.json'
+    with open(config_path, encoding='utf-8') as f:
+        return ThresholdEngine.from_config(json.load(f))
+
+
+def test_evaluate_upper_bound_marker():
+    """Test homocysteine uses optimal_max and normal_max"""
+    engine = _engine()
+
+    assert engine.evaluate('HomocysteÏne', 7.5, 'µmol/L') == 'optimal'
+    assert engine.evaluate('HomocysteÏne', 12.0, 'µmol/L') == 'warning'
+    assert engine.evaluate('HomocysteÏne', 18.0, 'µmol/L') == 'critical'
+
+
+def test_evaluate_range_marker_without_normal_min():
+    """Test a missing normal bound falls back to the parser's margin"""
+    engine = _engine()
+
+    assert engine.evaluate('Ferritine', 90, 'µg/L') == 'optimal'
+    assert engine.evaluate('Ferritine', 307, 'µg/L') == 'warning'
+    assert engine.evaluate('Ferritine', 400, 'µg/L') == 'critical'
+    assert engine.evaluate('Ferritine', 45, 'µg/L') == 'warning'
+    assert engine.evaluate('Ferritine', 39, 'µg/L') == 'critical'
+
+
+def test_evaluate_unknown_marker_or_unit():
+    """Test markers without thresholds or in another unit are not evaluated"""
+    engine = _engine()
+
+    assert engine.evaluate('TSH', 2.0, 'mU/L') is None
+    assert engine.evaluate('Vitamine D', 39.7, 'mg/L') is None
+
+
+def test_optimal_range_text():
+    """Test configured bounds are formatted like lab ranges, keeping their precision"""
+    engine = _engine()
+
+    assert engine.optimal_range('homocysteine') == '<8.0'
+    assert engine.optimal_range('vitamin_d') == '45-60'
+
+
+def test_parser_prefers_config_over_printed_range():
+    """Test configured thresholds win and fill a missing optimal range"""
+    parser = BloodParser(_engine())
+    text = """Ferritine + 307 50-120:opt. 22-322:VN µg/L
+Vitamine D - 39.7 30-100:VN ng/ml
+TSH 2.1 Opt:0.5-2.0 mU/L"""
+
+    ferritin, vitamin_d, tsh = parser.parse(text)
+
+    assert ferritin['status'] == 'warning'
+    assert vitamin_d['status'] == 'warning'
+    assert vitamin_d['optimal_range'] == '45-60'
+    assert tsh['status'] == 'warning'
+
+
+def test_parser_keeps_the_printed_range():
+    """Test the lab range is kept and the range that decided the status is stored alongside"""
+    parser = BloodParser(_engine())
+
+    vitamin_d, tsh = parser.parse("Vitamine D - 45 30-40:opt. ng/ml\nTSH 2.1 Opt:0.5-2.0 mU/L")
+
+    assert vitamin_d['status'] == 'optimal'
+    assert vitamin_d['optimal_range'] == '30-40'
+    assert vitamin_d['configured_range'] == '45-60'
+    assert evaluated_range(vitamin_d) == '45-60'
+    assert tsh['optimal_range'] == '0.5-2.0'
+    assert tsh['configured_range'] == ''
+    assert evaluated_range(tsh) == '0.5-2.0'
+
+
+@pytest.mark.parametrize('value, status', [
+    (39.0, 'critical'),
+    (45.0, 'warning'),
+    (120.0, 'optimal'),
+    (307.0, 'warning'),
+    (322.0, 'warning'),
+    (323.0, 'critical'),
+])
+def test_ferritin_status_boundaries(value, status):
+    """Test ferritin is critical only beyond the configured normal range (above 322, below 40)"""
+    parser = BloodParser(_engine())
+
+    ferritin = parser.parse(f"Ferritine + {value} 50-120:opt. 22-322:VN µg/L")[0]
+
+    assert ferritin['status'] == status
@@ -0,0 +1,55 @@
+"""Tests for biomarker unit normalization"""
+from parsers.blood_parser import BloodParser
+from parsers.units import canonical_unit, conversion_factor, convert_range
+
+
+def test_canonical_unit_spellings_are_interned():
+    """Test lab spelling variants map to one interned unit"""
+    assert canonical_unit('umol/l') == 'µmol/L'
+    assert canonical_unit('μmol/L') == 'µmol/L'
+    assert canonical_unit('ng/mL') == 'ng/ml'
+    assert canonical_unit('umol/l') is canonical_unit('µmol/L')
+
+
+def test_conversion_factor():
+    """Test precomputed factors to the canonical unit"""
+    assert conversion_factor('vitamin_d', 'ng/ml') == 1.0
+    assert abs(conversion_factor('vitamin_d', 'nmol/L') - 1 / 2.496) < 1e-9
+    assert conversion_factor('ferritin', 'ng/mL') == 1.0
+    assert conversion_factor('vitamin_d', 'mg/L') is None
+    assert conversion_factor(None, 'ng/ml') is None
+
+
+def test_convert_range():
+    """Test every number in a range string is scaled"""
+    assert convert_range('<8.0', 2) == '<16'
+    assert convert_range('45-60', 0.5) == '22.5-30'
+    assert convert_range('', 2) == ''
+
+
+def test_parse_vitamin_d_in_nmol_is_normalized():
+    """Test nmol/L vitamin D is converted to ng/ml with its ranges"""
+    parser = BloodParser()
+    text = "Vitamine D - 99.1 112-150:opt. 75-250:VN nmol/L"
+
+    result = parser.parse(text)[0]
+
+    assert result['unit'] == 'ng/ml'
+    assert result['value'] == 39.7
+    assert result['optimal_range'] == '44.87-60.1'
+    assert result['status'] == 'warning'
+    assert result['raw_value'] == 99.1
+    assert result['raw_unit'] == 'nmol/L'
+
+
+def test_parse_canonical_unit_is_untouched():
+    """Test values already in the canonical unit keep their exact text"""
+    parser = BloodParser()
+    text = "HomocysteÏne + 18.0 Opt:<8.0 V.N 3.7-13.9 umol/L"
+
+    result = parser.parse(text)[0]
+
+    assert result['unit'] == 'µmol/L'
+    assert result['value'] == 18.0
+    assert result['optimal_range'] == '<8.0'
+    assert result['raw_unit'] == 'umol/L'
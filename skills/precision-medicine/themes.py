@@ -0,0 +1,148 @@
+"""
+Brand theme registry for multi-clinic dashboards
+
+Each brand's color tokens are compiled into a complete stylesheet once,
+when the registry is built; rendering a dashboard for another brand is a
+dict lookup. The HELD theme comes from config/brand_config.json and is the
+unchanged template_builder stylesheet. Other brands are read from the
+aura-design brand profiles (skills/aura-design/brands/*.md).
+"""
+
+import re
+from pathlib import Path
+from typing import Dict, List, NamedTuple, Optional
+
+from template_builder import get_css
+
+DEFAULT_THEME = 'held'
+
+DEFAULT_BRANDS_DIR = Path(__file__).resolve().parent.parent / 'aura-design' / 'brands'
+
+# Colors in the base stylesheet, as written there
+_BASE_PRIMARY = '#34B27B'
+_BASE_PRIMARY_DARK = '#2d9e6b'
+_BASE_SECONDARY = '#FE8900'
+_BASE_FONT = "'Inter', 'Open Sans', system-ui, -apple-system, sans-serif"
+
+_TITLE = re.compile(r'^#\s+\S+\s+(.+?)\s+Brand Profile', re.M)
+_COLOR_ROW = re.compile(r'^\|\s*([^|]+?)\s*\|.*?`(#[0-9A-Fa-f]{6})`', re.M)
+_FONT = re.compile(r'font-family:\s*([^;]+);')
+
+
+class Theme(NamedTuple):
+    """A compiled brand theme"""
+    theme_id: str
+    name: str
+    tagline: str
+    css: str
+
+
+def _rgb(hex_color: str) -> str:
+    """'#34B27B' -> '52, 178, 123'"""
+    value = hex_color.lstrip('#')
+    return ', '.join(str(int(value[i:i + 2], 16)) for i in (0, 2, 4))
+
+
+def parse_brand_profile(text: str) -> Dict:
+    """
+    Extract name, color tokens and font from an aura-design brand profile
+
+    Returns:
+        {'name': str, 'colors': {role: '#RRGGBB'}, 'font_family': str or None}
+    """
+    title = _TITLE.search(text)
+    colors = {}
+    for role, hex_color in _COLOR_ROW.findall(text):
+        colors.setdefault(re.sub(r'\W+', '_', role.strip().lower()), hex_color.upper())
+    font = _FONT.search(text)
+    return {
+        'name': title.group(1).strip() if title else '',
+        'colors': colors,
+        'font_family': font.group(1).strip() if font else None,
+    }
+
+
+def compile_css(
+    primary: str,
+    primary_dark: str,
+    secondary: str,
+    font_family: Optional[str] = None
+) -> str:
+    """Compile the dashboard stylesheet for a set of brand colors"""
+    css = get_css()
+    # Literal rgba() tints first, while the hex values are still the base ones
+    css = css.replace(f"rgba({_rgb(_BASE_PRIMARY)},", f"rgba({_rgb(primary)},")
+    css = css.replace(f"rgba({_rgb(_BASE_SECONDARY)},", f"rgba({_rgb(secondary)},")
+    css = css.replace(f"--jungle-green: {_BASE_PRIMARY};", f"--jungle-green: {primary};")
+    css = css.replace(f"--jungle-green-dark: {_BASE_PRIMARY_DARK};", f"--jungle-green-dark: {primary_dark};")
+    css = css.replace(f"--american-orange: {_BASE_SECONDARY};", f"--american-orange: {secondary};")
+    if font_family:
+        css = css.replace(f"font-family: {_BASE_FONT};", f"font-family: {font_family};", 1)
+    return css
+
+
+def compile_brand_profile(theme_id: str, text: str) -> Theme:
+    """Compile an aura-design brand profile into a theme"""
+    profile = parse_brand_profile(text)
+    colors = profile['colors']
+    if 'primary' not in colors:
+        raise ValueError(f"Brand profile {theme_id} has no Primary color")
+
+    primary = colors['primary']
+    primary_dark = colors.get('primary_dark', primary)
+    secondary = next(
+        (colors[role] for role in ('secondary', 'accent', 'primary_light') if role in colors),
+        primary_dark
+    )
+    return Theme(
+        theme_id=theme_id,
+        name=profile['name'] or theme_id,
+        tagline='',
+        css=compile_css(primary, primary_dark, secondary, profile['font_family']),
+    )
+
+
+class ThemeRegistry:
+    """Compiled themes by brand id"""
+
+    def __init__(self):
+        self._themes: Dict[str, Theme] = {}
+
+    @classmethod
+    def from_config(cls, config: Dict, brands_dir: Optional[Path] = DEFAULT_BRANDS_DIR) -> 'ThemeRegistry':
+        """
+        Build the registry: HELD from the brand config, then every brand profile
+
+        The brand config stays authoritative for HELD; a brand profile with
+        the same id does not replace it.
+        """
+        registry = cls()
+        registry.register(Theme(
+            theme_id=DEFAULT_THEME,
+            name=config.get('brand_name', 'HELD'),
+            tagline=config.get('tagline', ''),
+            css=get_css(),
+        ))
+        if brands_dir is not None and Path(brands_dir).is_dir():
+            for path in sorted(Path(brands_dir).glob('*.md')):
+                if path.stem not in registry:
+                    registry.register(compile_brand_profile(path.stem, path.read_text(encoding='utf-8')))
+        return registry
+
+    def register(self, theme: Theme):
+        """Add or replace a theme"""
+        self._themes[theme.theme_id] = theme
+
+    def get(self, theme_id: Optional[str] = None) -> Theme:
+        """Theme for a brand id (the default theme for None)"""
+        theme = self._themes.get(theme_id or DEFAULT_THEME)
+        if theme is None:
+            raise ValueError(f"Unknown brand: {theme_id} (choose from {', '.join(self._themes)})")
+        return theme
+
+    def __contains__(self, theme_id: str) -> bool:
+        return theme_id in self._themes
+
+    def ids(self) -> List[str]:
+        """Registered brand ids"""
+        return list(self._themes)